@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import asyncio
+import inspect
+import queue
+import tkinter as tk
+import traceback
+
+
+class NgAsync:
+    """asyncio integration: pump Tk from the event loop and await events"""
+
+    def _init_async(self):
+        """Initialize asyncio variables"""
+        self.async_fps = 60
+        self._async_tasks = set()
+
+    async def read_async(self, timeout=None, fps=None):
+        """Await next event while pumping Tk from the running asyncio loop
+
+        Tk is updated fps times per second (async_fps by default) and the wait
+        ends as soon as event_queue receives an item, from any thread.
+        timeout is in milliseconds like read()"""
+        if self.window_closed:
+            return None, {}
+
+        self._flush_deferred_layout()
+
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        def notify():
+            loop.call_soon_threadsafe(wakeup.set)
+
+        frame = 1.0 / (fps or self.async_fps)
+        deadline = None if timeout is None else loop.time() + timeout / 1000.0
+
+        self.event_queue.add_listener(notify)
+        try:
+            while True:
+                try:
+                    self._pump_async()
+                except tk.TclError:
+                    self.window_closed = True
+                    return None, {}
+
+                try:
+                    event, values = self._next_event()
+                    return event, values
+                except queue.Empty:
+                    pass
+
+                if self.window_closed:
+                    return None, {}
+
+                delay = frame
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return '', {}
+                    delay = min(delay, remaining)
+
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.event_queue.remove_listener(notify)
+
+    def _pump_async(self):
+        """Apply posted updates and process pending Tk events once"""
+        self._check_posted_updates()
+        self.root.update()
+
+    async def events(self, fps=None):
+        """Async iterator over (event, values), ending after the window-closed event"""
+        while True:
+            event, values = await self.read_async(fps=fps)
+            yield event, values
+            if event is None:
+                break
+
+    async def run_async(self, fps=None):
+        """Dispatch events to registered handlers until the window closes
+
+        Handlers registered with register_event_handler() may be coroutine
+        functions: they run as tasks, so Tk keeps being pumped while they await"""
+        async for event, values in self.events(fps):
+            if event is None:
+                break
+
+            result = self.process_event(event, values)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._async_tasks.add(task)
+                task.add_done_callback(self._async_task_done)
+
+        for task in list(self._async_tasks):
+            task.cancel()
+
+        return self
+
+    def _async_task_done(self, task):
+        """Forget a finished handler task and report its error"""
+        self._async_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            print(f"Error in async event handler: {exc}")
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
@@ -0,0 +1,106 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import itertools
+
+
+class NgCheckpoint:
+    """Window state saved by checkpoint(): element generation, layout cursor and defaults"""
+
+    __slots__ = ('name', 'generation', 'layout', 'defaults')
+
+    def __init__(self, name, generation, layout, defaults):
+        self.name = name
+        self.generation = generation
+        self.layout = layout
+        self.defaults = defaults
+
+    def __repr__(self):
+        return f"NgCheckpoint({self.name!r}, generation={self.generation})"
+
+
+class NgCheckpoints:
+    """Layout checkpoints: roll back the elements added after a point in the layout"""
+
+    # Layout cursor and row state
+    _checkpoint_layout_attrs = ('current_x', 'current_y', 'initial_x', 'row_height', 'current_row_height',
+                                'current_row_start_y', 'current_row_max_height', 'last_element_height')
+
+    # Defaults applied to new elements
+    _checkpoint_default_attrs = ('default_s', 'default_fg', 'default_bg', 'default_k_prefix',
+                                 'text_width_chars', 'text_height_lines', 'input_width_chars',
+                                 'input_height_lines')
+
+    def _init_checkpoints(self):
+        """Initialize checkpoint variables"""
+        self._checkpoints = {}
+        # Set by finalize_layout(), rolled back by clear_error_messages()
+        self._layout_checkpoint = None
+
+    def checkpoint(self, name=''):
+        """Save the current layout point, to be restored later with rollback()
+
+            cp = window.checkpoint()
+            window.text('Name is required', fg='red').br()
+            ...
+            window.rollback(cp)     # removes the message, cursor back where it was
+
+        With a name the checkpoint is also kept on the window: rollback(name)"""
+        cp = NgCheckpoint(name, self._generation,
+                          self._save_attrs(self._checkpoint_layout_attrs),
+                          self._save_attrs(self._checkpoint_default_attrs))
+        if name:
+            self._checkpoints[name] = cp
+        return cp
+
+    def rollback(self, checkpoint):
+        """Delete the elements created after checkpoint and restore its layout cursor and defaults"""
+        if isinstance(checkpoint, str):
+            checkpoint = self._checkpoints[checkpoint]
+
+        self._remove_elements_after(checkpoint.generation)
+
+        for name, value in itertools.chain(checkpoint.layout.items(), checkpoint.defaults.items()):
+            setattr(self, name, value)
+        return self
+
+    def _save_attrs(self, names):
+        """Return the current value of the attributes that are set"""
+        return {name: getattr(self, name) for name in names if hasattr(self, name)}
+
+    def _remove_elements_after(self, generation):
+        """Delete groups and widgets registered after generation, newest first
+
+        Both _groups and elements are kept in creation order, so only the
+        entries newer than generation are visited"""
+        new_groups = list(itertools.takewhile(lambda key: self._groups[key].generation > generation,
+                                              reversed(self._groups)))
+        new_elements = list(itertools.takewhile(lambda element: self._element_generation(element) > generation,
+                                                reversed(self.elements)))
+
+        with self.batch():
+            for key in new_groups:
+                if key in self._groups:
+                    self._delete_key(key)
+
+            for element in new_elements:
+                if element in self.elements:
+                    self._remove_element(element)
+
+    def _element_generation(self, element):
+        record = self._records.get(element)
+        return record.generation if record is not None else 0
+
+    def _remove_element(self, element):
+        """Destroy a widget and drop the key it was registered under"""
+        record = self._records.get(element)
+        key = record.key if record is not None else None
+
+        self._unplace_element(element)
+        self._safe_destroy_element(element)
+        self.elements.discard(element)
+
+        if key and self.element_keys.get(key) is element:
+            del self.element_keys[key]
+            self.element_positions.pop(key, None)
+            self.element_strings.pop(key, None)
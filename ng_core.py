@@ -2,20 +2,61 @@
 # Licensed under the MIT License
 
 import tkinter as tk
+import tkinter.ttk as ttk
+import tkinter.font as tkfont
+import collections
+import collections.abc
 import queue
+import time
+
+
+class NgEventQueue(queue.Queue):
+    """Event queue that notifies listeners, from any thread, when an event is put"""
+
+    def __init__(self):
+        super().__init__()
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call callback() after every put"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Stop notifying callback"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        for callback in list(self._listeners):
+            callback()
 
 
 class NgCore:
     """Base class for pyNaviGui - manages window, events and core logic"""
 
+    # Widget toolkit used by all builders, replaced by the headless backend
+    _tk = tk
+    _ttk = ttk
+    _tkfont = tkfont
+
     def __init__(self, geometry='800x600', embed_mode=False, parent_root=None):
         """Initialize GUI with embedded mode support"""
         self.title = 'pyNaviGui'
         self.geometry = geometry
         self.window_closed = False
-        self.event_queue = queue.Queue()
+        # True while show() runs mainloop(), when other threads may call Tk
+        self._in_mainloop = False
+        self.event_queue = NgEventQueue()
         self.event_handlers = {}
+        self._exact_handlers = {}
+        self._pattern_handlers = []
+        self._handler_cache = collections.OrderedDict()
+        self._handler_cache_size = 1024
+        self._handler_stats = {}
+        self._stats = None
         self.initial_elements_count = 0
+        self.read_wakeup_ms = 50
 
         self.embed_mode = embed_mode
 
@@ -24,7 +65,7 @@ class NgCore:
                 raise ValueError("parent_root is required when embed_mode=True")
             self.root = parent_root
         else:
-            self.root = tk.Tk()
+            self.root = self._tk.Tk()
             self._update_title_impl()
             self._update_geometry_impl()
             self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -35,6 +76,22 @@ class NgCore:
             self._init_layout()
         if hasattr(self, '_init_elements'):
             self._init_elements()
+        if hasattr(self, '_init_async'):
+            self._init_async()
+        if hasattr(self, '_init_updates'):
+            self._init_updates()
+        if hasattr(self, '_init_tasks'):
+            self._init_tasks()
+        if hasattr(self, '_init_scheduler'):
+            self._init_scheduler()
+        if hasattr(self, '_init_stats'):
+            self._init_stats()
+        if hasattr(self, '_init_batch'):
+            self._init_batch()
+        if hasattr(self, '_init_checkpoints'):
+            self._init_checkpoints()
+        if hasattr(self, '_init_measure'):
+            self._init_measure()
 
     def _on_closing(self):
         """Handle window closing"""
@@ -75,22 +132,163 @@ class NgCore:
         return self
 
     def register_event_handler(self, event_key, handler_func):
-        """Register event handler"""
+        """Register event handler
+
+        event_key is an exact key, a prefix pattern ('ROW_*') or a suffix
+        pattern ('*_CHANGE'). An exact key wins, then the longest matching
+        pattern. Handlers reached through a pattern find the actual event
+        key in values['_event']"""
         self.event_handlers[event_key] = handler_func
+        self._compile_event_handlers()
 
-    def process_event(self, event_key, values):
-        """Process event with registered handler"""
+    def unregister_event_handler(self, event_key):
+        """Remove a handler registered with register_event_handler()"""
         if event_key in self.event_handlers:
-            return self.event_handlers[event_key](values)
+            del self.event_handlers[event_key]
+            self._handler_stats.pop(event_key, None)
+            self._compile_event_handlers()
+
+    def _compile_event_handlers(self):
+        """Build the lookup tables used by process_event()
+
+        Patterns are grouped by length, longest first, so a lookup costs one
+        dict probe per distinct pattern length"""
+        self._exact_handlers = {}
+        levels = {}
+        for pattern in self.event_handlers:
+            if isinstance(pattern, str) and len(pattern) > 1 and pattern.endswith('*'):
+                level = levels.setdefault((len(pattern) - 1, 0), {})
+                level.setdefault(pattern[:-1], pattern)
+            elif isinstance(pattern, str) and len(pattern) > 1 and pattern.startswith('*'):
+                level = levels.setdefault((len(pattern) - 1, 1), {})
+                level.setdefault(pattern[1:], pattern)
+            else:
+                self._exact_handlers[pattern] = pattern
+
+        # (length, is_suffix, table): longer first, prefix before suffix on ties
+        self._pattern_handlers = [(length, is_suffix, levels[(length, is_suffix)])
+                                  for length, is_suffix in sorted(levels, key=lambda lv: (-lv[0], lv[1]))]
+        self._handler_cache.clear()
+
+    def _resolve_event_handler(self, event_key):
+        """Return the registered key or pattern handling event_key, or None
+
+        Keys matched by a pattern are remembered in a small LRU; exact keys and
+        misses are not cached, so arbitrary event keys cannot grow it"""
+        try:
+            pattern = self._exact_handlers.get(event_key)
+        except TypeError:
+            return None
+        if pattern is not None or not isinstance(event_key, str) or not self._pattern_handlers:
+            return pattern
+
+        cache = self._handler_cache
+        pattern = cache.get(event_key)
+        if pattern is not None:
+            cache.move_to_end(event_key)
+            return pattern
+
+        for length, is_suffix, table in self._pattern_handlers:
+            if len(event_key) < length:
+                continue
+            pattern = table.get(event_key[-length:] if is_suffix else event_key[:length])
+            if pattern is not None:
+                cache[event_key] = pattern
+                if len(cache) > self._handler_cache_size:
+                    cache.popitem(last=False)
+                return pattern
         return None
 
+    def process_event(self, event_key, values):
+        """Process event with registered handler, recording calls and time spent"""
+        pattern = self._resolve_event_handler(event_key)
+        if pattern is None:
+            return None
+
+        if pattern != event_key and isinstance(values, collections.abc.MutableMapping):
+            values['_event'] = event_key
+
+        start = time.perf_counter()
+        try:
+            return self.event_handlers[pattern](values)
+        finally:
+            self._record_handler_time(pattern, time.perf_counter() - start)
+
+    def _post_widget_event(self, k, extra_values=None):
+        """Queue an event from a widget callback, stamped with the time it fired"""
+        fired = time.monotonic()
+
+        values = self._get_values()
+        if extra_values:
+            values.update(extra_values)
+
+        self.event_queue.put((k, values, fired))
+
+    def _next_event(self):
+        """Pop the next queued event, recording how long a stamped event waited"""
+        item = self.event_queue.get_nowait()
+        if len(item) > 2 and self._stats is not None:
+            self._record_stat('queue_wait', time.monotonic() - item[2])
+        return item[0], item[1]
+
+    def _record_handler_time(self, pattern, elapsed):
+        """Accumulate call count and time for a handler"""
+        if self._stats is not None:
+            self._record_stat('handler', elapsed)
+
+        stats = self._handler_stats.get(pattern)
+        if stats is None:
+            self._handler_stats[pattern] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+    def event_handler_stats(self):
+        """Return {key or pattern: {'calls', 'total_ms', 'avg_ms', 'max_ms'}}, slowest first"""
+        report = {}
+        for pattern, (calls, total, longest) in sorted(self._handler_stats.items(),
+                                                       key=lambda item: -item[1][1]):
+            report[pattern] = {
+                'calls': calls,
+                'total_ms': total * 1000,
+                'avg_ms': total * 1000 / calls,
+                'max_ms': longest * 1000
+            }
+        return report
+
+    def reset_event_handler_stats(self):
+        """Forget recorded handler calls and times"""
+        self._handler_stats = {}
+        return self
+
+    def dispatch_forever(self):
+        """Read events and route them to registered handlers until the window closes"""
+        while True:
+            event, values = self.read()
+            if event is None:
+                break
+            if event:
+                self.process_event(event, values)
+        return self
+
     def show(self):
         """Start main loop"""
-        self.root.mainloop()
+        self._flush_deferred_layout()
+        self._in_mainloop = True
+        try:
+            self.root.mainloop()
+        finally:
+            self._in_mainloop = False
         return self
 
     def read(self, timeout=None):
-        """Read next event"""
+        """Read next event
+
+        timeout=None waits until an event arrives, timeout=0 polls without
+        blocking, any other value waits at most that many milliseconds and
+        returns ('', {}) when nothing arrived in time"""
         # Auto-finalize layout on first read() call
         if not hasattr(self, 'initial_elements_count'):
             self.finalize_layout()
@@ -99,10 +297,10 @@ class NgCore:
             return None, {}
 
         try:
-            self.root.update()
+            self._pump_events(timeout)
 
             if not self.event_queue.empty():
-                event, values = self.event_queue.get_nowait()
+                event, values = self._next_event()
                 return event, values
             else:
                 return '', {}
@@ -111,8 +309,72 @@ class NgCore:
             self.window_closed = True
             return None, {}
 
+    def read_many(self, max_events=100, timeout=None, coalesce=True):
+        """Read up to max_events queued (event, values), folding consecutive events with the same key if coalesce"""
+        if self.window_closed:
+            return [(None, {})]
+
+        try:
+            self._pump_events(timeout)
+        except tk.TclError:
+            self.window_closed = True
+            return [(None, {})]
+
+        events = []
+        while len(events) < max_events:
+            try:
+                event, values = self._next_event()
+            except queue.Empty:
+                break
+
+            if coalesce and events and events[-1][0] == event:
+                events[-1] = (event, values)
+            else:
+                events.append((event, values))
+
+        return events
+
+    def _pump_events(self, timeout=None):
+        """Run Tk once (timeout=0) or until an event is queued or timeout expires"""
+        self._flush_deferred_layout()
+        if hasattr(self, '_check_posted_updates'):
+            self._check_posted_updates()
+        if timeout == 0:
+            self.root.update()
+        else:
+            self._wait_for_event(timeout)
+
+    def _wait_for_event(self, timeout=None):
+        """Dispatch Tk events until event_queue has an item or timeout (ms) expires"""
+        expired = []
+        timers = {}
+
+        def heartbeat():
+            # Wakes dooneevent() so events and updates posted by other threads are noticed
+            if hasattr(self, '_check_posted_updates'):
+                self._check_posted_updates()
+            timers['heartbeat'] = self.root.after(self.read_wakeup_ms, heartbeat)
+
+        if timeout is not None:
+            timers['timeout'] = self.root.after(max(int(timeout), 1), lambda: expired.append(True))
+        timers['heartbeat'] = self.root.after(self.read_wakeup_ms, heartbeat)
+
+        try:
+            while self.event_queue.empty() and not expired and not self.window_closed:
+                self.root.tk.dooneevent(0)
+        finally:
+            for timer_id in timers.values():
+                try:
+                    self.root.after_cancel(timer_id)
+                except tk.TclError:
+                    pass
+
     def close(self):
         """Close window if not in embedded mode"""
+        if hasattr(self, '_shutdown_tasks'):
+            self._shutdown_tasks()
+        if hasattr(self, '_save_layout_cache'):
+            self._save_layout_cache()
         if not self.embed_mode:
             self.window_closed = True
             self._close_impl()
\ No newline at end of file
@@ -1,8 +1,8 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-import tkinter as tk
-import os
+from ng_index import NgKeyIndex, NgSelectionIndex
+from ng_registry import ElementRecord, GroupKind, NgElementList, NgOptions
 try:
     from PIL import Image, ImageTk
 except ImportError:
@@ -15,11 +15,20 @@ class NgElementsBase00:
 
     def _init_elements(self):
         """Initialize element variables"""
-        self.elements = []
-        self.element_keys = {}
-        self.element_positions = {}
-        self.element_strings = {}
+        self.elements = NgElementList()
+        self.element_keys = NgKeyIndex()
+        # Key -> (x, y, width, height), the boxes computed by the layout engine
+        self.element_positions = self.layout.boxes
+        self.element_strings = NgSelectionIndex()
         self.element_counter = 0
+        # Widget -> ElementRecord, for constant-time lookups starting from a widget
+        self._records = {}
+        # Key -> GroupRecord of multi-widget elements (checkboxes, tables, panels, ...)
+        self._groups = {}
+        # Kind -> GroupKind, registered by the element builders
+        self._group_kinds = {}
+        # Incremented for every new record, see checkpoint()
+        self._generation = 0
 
     def _register_element(self, element, key, s=''):
         """Register element with key and selection string"""
@@ -34,6 +43,66 @@ class NgElementsBase00:
         if s:
             self.element_strings[key] = s
 
+        self._track_element(element, key, s)
+
+    def _record_for(self, element):
+        """Return the record of element, creating it on first use"""
+        record = self._records.get(element)
+        if record is None:
+            self._generation += 1
+            record = self._records[element] = ElementRecord(element, self._generation)
+        return record
+
+    def _track_element(self, element, key, s=''):
+        """Link a registered widget to its key and selection string"""
+        record = self._record_for(element)
+        if record.key is None:
+            record.key = key
+            record.s = s
+
+    def _register_group_kind(self, kind, reader=None, cleanup=None, writer=None):
+        """Register the value reader, cleanup and writer of a group kind, once per window"""
+        if kind not in self._group_kinds:
+            self._group_kinds[kind] = GroupKind(kind, reader, cleanup, writer)
+
+    def _register_group(self, group, elements, positions):
+        """Store a group record with the (x, y) of each of its widgets, replacing any group with the same key"""
+        group.members = list(zip(elements, positions))
+        # Re-insert so _groups stays in creation order
+        self._groups.pop(group.key, None)
+        self._groups[group.key] = group
+
+        for element, position in group.members:
+            record = self._record_for(element)
+            record.group = group.key
+            record.position = position
+
+        self._generation += 1
+        group.generation = self._generation
+
+    def _group(self, key, kind=''):
+        """Return the group record of key, None if missing or not of the given kind"""
+        group = self._groups.get(key)
+        if group is None or (kind and group.kind != kind):
+            return None
+        return group
+
+    def _forget_element(self, element):
+        """Drop the record of a destroyed widget, with the auto key it was registered under"""
+        record = self._records.pop(element, None)
+        if record is None or not record.key or not record.key.startswith('__auto_key_'):
+            return
+        if self.element_keys.get(record.key) is element:
+            del self.element_keys[record.key]
+            self.element_strings.pop(record.key, None)
+            self.element_positions.pop(record.key, None)
+
+    def _parse_options(self, options):
+        """Return options as a list of (display, value) pairs"""
+        if isinstance(options, NgOptions):
+            return list(options)
+        return list(NgOptions.parse(options))
+
     def _register_element_position(self, key, x, y, width, height):
         """Register element position"""
         if key:
@@ -70,19 +139,13 @@ class NgElementsBase00:
         if self.text_height_lines is not None and self.text_height_lines > 1:
             label_options['height'] = self.text_height_lines
 
-        label = tk.Label(self.root, **label_options)
-        label.place(x=self.current_x, y=self.current_y)
-        label.update_idletasks()
-        width = label.winfo_reqwidth()
-        height = label.winfo_reqheight()
-
-        # Update the row height based on actual element height
-        self._update_row_height(height)
+        label = self._tk.Label(self.root, **label_options)
+        self._place_element(label, x=self.current_x, y=self.current_y)
+        width, height = self._label_size(label, text, label_options.get('font'),
+                                         label_options.get('width'), label_options.get('height'))
 
         effective_key = k if k else f"__auto_key_{self.element_counter}"
-        self._register_element_position(effective_key, self.current_x, self.current_y, width, height)
-
-        self._update_position(width, height)
+        self.layout.place(effective_key, width, height)
         self._register_element(label, k, s)
 
         return self
@@ -102,38 +165,26 @@ class NgElementsBase00:
         if bg:
             entry_options['bg'] = bg
 
-        # Handle font parameter
-        if font is not None:
-            # Support both string format ('Arial 12 bold') and tuple format (('Arial', 12, 'bold'))
-            if isinstance(font, str):
-                entry_options['font'] = font
-            elif isinstance(font, tuple):
-                # Convert the tuple to the format tkinter expects
-                if len(font) == 2:  # ('Arial', 12)
-                    family, size = font
-                    entry_options['font'] = (family, size)
-                elif len(font) >= 3:  # ('Arial', 12, 'bold') or ('Arial', 12, 'bold italic')
-                    family, size = font[0], font[1]
-                    style = ' '.join(font[2:])
-                    entry_options['font'] = (family, size, style)
+        # Support both string format ('Arial 12 bold') and tuple format (('Arial', 12, 'bold'))
+        entry_font = self._font_option(font)
+        if entry_font is not None:
+            entry_options['font'] = entry_font
 
-        entry = tk.Entry(self.root, **entry_options)
+        entry = self._tk.Entry(self.root, **entry_options)
         if text:
             entry.insert(0, text)
 
         # Handle Enter key press event
         if event_enter and k:
             def enter_handler(event):
-                values = self._get_values()
-                self.event_queue.put((k, values))
+                self._post_widget_event(k)
 
             entry.bind("<Return>", enter_handler)
 
         # Handle Tab key press event
         if event_tab and k:
             def tab_handler(event):
-                values = self._get_values()
-                self.event_queue.put((f"{k}_TAB", values))
+                self._post_widget_event(f"{k}_TAB")
                 # Allow focus to move to the next widget
 
             entry.bind("<Tab>", tab_handler)
@@ -150,8 +201,7 @@ class NgElementsBase00:
                 # Only trigger if value actually changed
                 if current_value != entry.previous_value:
                     entry.previous_value = current_value
-                    values = self._get_values()
-                    self.event_queue.put((f"{k}_CHANGE", values))
+                    self._post_widget_event(f"{k}_CHANGE")
 
             def on_key_release(event):
                 # Cancel previous timer if exists
@@ -162,13 +212,13 @@ class NgElementsBase00:
 
             entry.bind("<KeyRelease>", on_key_release)
 
+        # Entries with the same width and font have the same size, measured once
+        width, height = self._widget_size(entry, entry_options.get('width'), entry_font)
+
         # Improved vertical alignment logic
         y_offset = 0
-        if hasattr(self, 'last_element_height'):
-            # Get entry's required height before placing it
-            entry.pack()
-            entry_height = entry.winfo_reqheight()
-            entry.pack_forget()
+        if self.last_element_height is not None:
+            entry_height = height
 
             # Calculate vertical center alignment between the label and entry
             if self.last_element_height > entry_height:
@@ -177,10 +227,7 @@ class NgElementsBase00:
                 # If entry is taller than label, adjust position upward
                 y_offset = -(entry_height - self.last_element_height) // 2
 
-        entry.place(x=self.current_x, y=self.current_y + y_offset)
-        entry.update_idletasks()
-        width = entry.winfo_reqwidth()
-        height = entry.winfo_reqheight()
+        self._place_element(entry, x=self.current_x, y=self.current_y + y_offset)
 
         effective_key = k if k else f"__auto_key_{self.element_counter}"
         self._register_element_position(effective_key, self.current_x, self.current_y + y_offset, width, height)
@@ -203,8 +250,7 @@ class NgElementsBase00:
 
         def button_callback(event=None):
             if k:
-                values = self._get_values()
-                self.event_queue.put((k, values))
+                self._post_widget_event(k)
             elif command:
                 command()
 
@@ -214,24 +260,8 @@ class NgElementsBase00:
         if is_macos and bg:
             # Create a Canvas-based button for macOS with background color support
 
-            # First create a temporary label to measure text size
-            temp_label = tk.Label(self.root, text=text)
-            if font is not None:
-                if isinstance(font, str):
-                    temp_label.config(font=font)
-                elif isinstance(font, tuple):
-                    if len(font) == 2:
-                        family, size = font
-                        temp_label.config(font=(family, size))
-                    elif len(font) >= 3:
-                        family, size = font[0], font[1]
-                        style_part = ' '.join(font[2:])
-                        temp_label.config(font=(family, size, style_part))
-
-            temp_label.update_idletasks()
-            text_width = temp_label.winfo_reqwidth()
-            text_height = temp_label.winfo_reqheight()
-            temp_label.destroy()
+            # Measure the text as a Label would show it
+            text_width, text_height = self._label_size(None, text, self._font_option(font))
 
             # Create canvas with padding
             padding_x = 20
@@ -239,7 +269,7 @@ class NgElementsBase00:
             canvas_width = text_width + padding_x
             canvas_height = text_height + padding_y
 
-            canvas = tk.Canvas(self.root, width=canvas_width, height=canvas_height,
+            canvas = self._tk.Canvas(self.root, width=canvas_width, height=canvas_height,
                                highlightthickness=0, bd=0)
 
             # Draw button background
@@ -308,18 +338,14 @@ class NgElementsBase00:
                         style_part = ' '.join(font[2:])
                         button_options['font'] = (family, size, style_part)
 
-            button = tk.Button(self.root, **button_options)
+            button = self._tk.Button(self.root, **button_options)
 
         # Common positioning and registration code
-        button.place(x=self.current_x, y=self.current_y)
-        button.update_idletasks()
-        width = button.winfo_reqwidth()
-        height = button.winfo_reqheight()
+        self._place_element(button, x=self.current_x, y=self.current_y)
+        width, height = self._widget_size(button, text, self._font_option(font))
 
         effective_key = k if k else f"__auto_key_{self.element_counter}"
-        self._register_element_position(effective_key, self.current_x, self.current_y, width, height)
-
-        self._update_position(width, height)
+        self.layout.place(effective_key, width, height)
         self._register_element(button, k, s)
 
         return self
\ No newline at end of file
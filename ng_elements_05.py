@@ -2,8 +2,6 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-import tkinter as tk
-
 
 class NgElementsBase05:
     """Rectangle element implementation"""
@@ -13,9 +11,9 @@ class NgElementsBase05:
         s, fg, bg, k = self._merge_defaults(s, fg, bg, k)
 
         # Create a frame to represent our rectangle
-        rect = tk.Frame(self.root, width=width, height=height, bg=bg, highlightbackground=fg,
+        rect = self._tk.Frame(self.root, width=width, height=height, bg=bg, highlightbackground=fg,
                         highlightthickness=1 if fg else 0)
-        rect.place(x=self.current_x, y=self.current_y)
+        self._place_element(rect, x=self.current_x, y=self.current_y)
 
         effective_key = k if k else f"__auto_key_{self.element_counter}"
         self._register_element_position(effective_key, self.current_x, self.current_y, width, height)
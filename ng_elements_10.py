@@ -1,7 +1,7 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-import tkinter as tk
+from ng_registry import CheckboxGroup, RadioGroup
 
 
 class NgElementsBase10:
@@ -26,25 +26,13 @@ class NgElementsBase10:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w', bg=bg if bg else None)
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w', bg=bg if bg else None)
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
-        parsed_options = []
-        for option in checkbox_options:
-            if isinstance(option, str) and '|' in option:
-                display_text, value = option.split('|', 1)
-            else:
-                display_text = value = str(option)
-            parsed_options.append((display_text, value))
-
-        if not hasattr(self, '_checkbox_groups'):
-            self._checkbox_groups = {}
+        parsed_options = self._parse_options(checkbox_options)
 
         checkbox_vars = []
         checkboxes_elements = []
@@ -60,7 +48,7 @@ class NgElementsBase10:
         checkbox_bg = bg if bg else getattr(self, 'default_bg', None)
 
         for i, (display_text, value) in enumerate(parsed_options):
-            var = tk.BooleanVar()
+            var = self._tk.BooleanVar()
             checkbox_vars.append((var, value))
 
             # Aggiungi il parametro bg al checkbox
@@ -74,16 +62,14 @@ class NgElementsBase10:
             if checkbox_bg:
                 checkbox_options['bg'] = checkbox_bg
 
-            checkbox = tk.Checkbutton(
+            checkbox = self._tk.Checkbutton(
                 self.root,
                 **checkbox_options
             )
 
-            checkbox.place(x=self.current_x, y=self.current_y)
-            checkbox.update_idletasks()
-
-            width = checkbox.winfo_reqwidth()
-            height = max(checkbox.winfo_reqheight(), checkbox_height)
+            self._place_element(checkbox, x=self.current_x, y=self.current_y)
+            width, height = self._widget_size(checkbox, display_text)
+            height = max(height, checkbox_height)
 
             checkboxes_elements.append(checkbox)
             element_positions.append((self.current_x, self.current_y))
@@ -94,12 +80,10 @@ class NgElementsBase10:
                 self.current_y += height
 
         if k:
-            self._checkbox_groups[k] = checkbox_vars
             effective_key = k
         else:
             effective_key = f"__auto_key_{self.element_counter}"
             self.element_counter += 1
-            self._checkbox_groups[effective_key] = checkbox_vars
 
         total_height = title_height + len(parsed_options) * checkbox_height
         if title_height > 0:
@@ -107,10 +91,9 @@ class NgElementsBase10:
 
         self._register_element_position(effective_key, start_x, start_y, max_width, total_height)
 
-        if not hasattr(self, '_checkbox_element_positions'):
-            self._checkbox_element_positions = {}
-
-        self._checkbox_element_positions[effective_key] = list(zip(checkboxes_elements, element_positions))
+        self._register_group_kind('checkbox', self._checkbox_value, self._cleanup_element_group,
+                                  self._set_checkbox_value)
+        self._register_group(CheckboxGroup(effective_key, checkbox_vars), checkboxes_elements, element_positions)
 
         if s:
             self.element_strings[effective_key] = s
@@ -144,27 +127,15 @@ class NgElementsBase10:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w', bg=bg if bg else None)
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w', bg=bg if bg else None)
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
-        parsed_options = []
-        for option in radio_options:
-            if isinstance(option, str) and '|' in option:
-                display_text, value = option.split('|', 1)
-            else:
-                display_text = value = str(option)
-            parsed_options.append((display_text, value))
-
-        if not hasattr(self, '_radio_groups'):
-            self._radio_groups = {}
+        parsed_options = self._parse_options(radio_options)
 
-        radio_var = tk.StringVar()
+        radio_var = self._tk.StringVar()
 
         if default is not None:
             default_found = False
@@ -206,16 +177,14 @@ class NgElementsBase10:
             if radio_bg:
                 radio_options['bg'] = radio_bg
 
-            radiobutton = tk.Radiobutton(
+            radiobutton = self._tk.Radiobutton(
                 self.root,
                 **radio_options
             )
 
-            radiobutton.place(x=self.current_x, y=self.current_y)
-            radiobutton.update_idletasks()
-
-            width = radiobutton.winfo_reqwidth()
-            height = max(radiobutton.winfo_reqheight(), radio_height)
+            self._place_element(radiobutton, x=self.current_x, y=self.current_y)
+            width, height = self._widget_size(radiobutton, display_text)
+            height = max(height, radio_height)
 
             radio_elements.append(radiobutton)
             element_positions.append((self.current_x, self.current_y))
@@ -226,12 +195,10 @@ class NgElementsBase10:
                 self.current_y += height
 
         if k:
-            self._radio_groups[k] = radio_var
             effective_key = k
         else:
             effective_key = f"__auto_key_{self.element_counter}"
             self.element_counter += 1
-            self._radio_groups[effective_key] = radio_var
 
         total_height = title_height + len(parsed_options) * radio_height
         if title_height > 0:
@@ -239,10 +206,9 @@ class NgElementsBase10:
 
         self._register_element_position(effective_key, start_x, start_y, max_width, total_height)
 
-        if not hasattr(self, '_radio_element_positions'):
-            self._radio_element_positions = {}
-
-        self._radio_element_positions[effective_key] = list(zip(radio_elements, element_positions))
+        self._register_group_kind('radio', self._radio_value, self._cleanup_element_group,
+                                  self._set_radio_value)
+        self._register_group(RadioGroup(effective_key, radio_var), radio_elements, element_positions)
 
         if s:
             self.element_strings[effective_key] = s
@@ -2,13 +2,14 @@
 # Licensed under the MIT License
 
 import tkinter as tk
+from ng_registry import ListboxGroup, ComboboxGroup
 
 
 class NgElementsBase20:
     """List elements: listbox and combobox"""
 
     def listbox(self, title_or_options, options=None, k='', s='', default=None, nr_rows=5, multi_select=False,
-                event_click=False, event_dbclick=False):
+                event_click=False, event_dbclick=False, budget_ms=0):
         """Create listbox using Tkinter Listbox with optional click and double-click events"""
         s, _, _, k = self._merge_defaults(s, '', '', k)
 
@@ -26,28 +27,16 @@ class NgElementsBase20:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w')
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w')
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
-        parsed_options = []
-        for option in listbox_options:
-            if isinstance(option, str) and '|' in option:
-                display_text, value = option.split('|', 1)
-            else:
-                display_text = value = str(option)
-            parsed_options.append((display_text, value))
-
-        if not hasattr(self, '_listbox_groups'):
-            self._listbox_groups = {}
+        parsed_options = self._parse_options(listbox_options)
 
         selectmode = tk.EXTENDED if multi_select else tk.SINGLE
-        listbox = tk.Listbox(self.root, height=nr_rows, selectmode=selectmode)
+        listbox = self._tk.Listbox(self.root, height=nr_rows, selectmode=selectmode)
 
         # Handle click and double-click events with proper coordination
         if (event_click or event_dbclick) and k:
@@ -68,14 +57,12 @@ class NgElementsBase20:
                         # Wait 300ms to see if a double-click follows
                         def delayed_click():
                             if not listbox.double_click_pending:
-                                values = self._get_values()
-                                self.event_queue.put((k, values))
+                                self._post_widget_event(k)
 
                         listbox.click_timer = self.root.after(300, delayed_click)
                     else:
                         # No double-click enabled, fire immediately
-                        values = self._get_values()
-                        self.event_queue.put((k, values))
+                        self._post_widget_event(k)
 
                 listbox.bind("<<ListboxSelect>>", listbox_click_handler)
 
@@ -90,40 +77,31 @@ class NgElementsBase20:
                     listbox.double_click_pending = True
 
                     # Fire double-click event
-                    values = self._get_values()
-                    self.event_queue.put((f"{k}_DBCLICK", values))
+                    self._post_widget_event(f"{k}_DBCLICK")
 
                 listbox.bind("<Double-Button-1>", listbox_dbclick_handler)
 
-        scrollbar = tk.Scrollbar(self.root, orient=tk.VERTICAL, command=listbox.yview)
+        scrollbar = self._tk.Scrollbar(self.root, orient=tk.VERTICAL, command=listbox.yview)
         listbox.config(yscrollcommand=scrollbar.set)
 
-        for display_text, value in parsed_options:
-            listbox.insert(tk.END, display_text)
-
-        if default is not None:
-            if multi_select:
-                default_values = default if isinstance(default, (list, tuple)) else [default]
-                for i, (display_text, value) in enumerate(parsed_options):
-                    if value in default_values:
-                        listbox.selection_set(i)
-                        if i == 0 or value == default_values[0]:
-                            listbox.see(i)
-            else:
-                for i, (display_text, value) in enumerate(parsed_options):
-                    if value == default:
-                        listbox.selection_set(i)
-                        listbox.see(i)
-                        break
+        if k:
+            effective_key = k
+        else:
+            effective_key = f"__auto_key_{self.element_counter}"
+            self.element_counter += 1
 
-        listbox.place(x=self.current_x, y=self.current_y)
-        listbox.update_idletasks()
+        option_inserter = self._insert_listbox_options(listbox, parsed_options, default, multi_select)
+        if budget_ms > 0 and parsed_options:
+            self._schedule_job(option_inserter, budget_ms=budget_ms, job_id=('listbox_options', effective_key))
+        else:
+            for _ in option_inserter:
+                pass
 
-        listbox_width = listbox.winfo_reqwidth()
-        listbox_height = listbox.winfo_reqheight()
+        self._place_element(listbox, x=self.current_x, y=self.current_y)
+        listbox_width, listbox_height = self._widget_size(listbox, nr_rows)
 
         scrollbar_width = 20
-        scrollbar.place(x=self.current_x + listbox_width, y=self.current_y, height=listbox_height)
+        self._place_element(scrollbar, x=self.current_x + listbox_width, y=self.current_y, height=listbox_height)
 
         max_width = max(max_width, listbox_width + scrollbar_width)
 
@@ -139,24 +117,15 @@ class NgElementsBase20:
         element_positions.append((self.current_x, self.current_y))
         element_positions.append((self.current_x + listbox_width, self.current_y))
 
-        if k:
-            self._listbox_groups[k] = (listbox, parsed_options, multi_select)
-            effective_key = k
-        else:
-            effective_key = f"__auto_key_{self.element_counter}"
-            self.element_counter += 1
-            self._listbox_groups[effective_key] = (listbox, parsed_options, multi_select)
-
         total_height = title_height + listbox_height
         if title_height > 0:
             total_height += 2
 
         self._register_element_position(effective_key, start_x, start_y, max_width, total_height)
 
-        if not hasattr(self, '_listbox_element_positions'):
-            self._listbox_element_positions = {}
-
-        self._listbox_element_positions[effective_key] = list(zip(listbox_elements, element_positions))
+        self._register_group_kind('listbox', self._listbox_value, self._cleanup_listbox,
+                                  self._set_listbox_value)
+        self._register_group(ListboxGroup(effective_key, listbox, parsed_options, multi_select), listbox_elements, element_positions)
 
         if s:
             self.element_strings[effective_key] = s
@@ -171,13 +140,34 @@ class NgElementsBase20:
 
         return self
 
+    def _insert_listbox_options(self, listbox, parsed_options, default=None, multi_select=False):
+        """Generator inserting listbox options one per step, then selecting default"""
+        for display_text, value in parsed_options:
+            listbox.insert(tk.END, display_text)
+            yield
+
+        if default is not None:
+            if multi_select:
+                default_values = default if isinstance(default, (list, tuple)) else [default]
+                for i, (display_text, value) in enumerate(parsed_options):
+                    if value in default_values:
+                        listbox.selection_set(i)
+                        if i == 0 or value == default_values[0]:
+                            listbox.see(i)
+            else:
+                for i, (display_text, value) in enumerate(parsed_options):
+                    if value == default:
+                        listbox.selection_set(i)
+                        listbox.see(i)
+                        break
+
+    def _cleanup_listbox(self, key):
+        """Delete a listbox, stopping options still being inserted"""
+        self.unschedule(('listbox_options', key))
+        self._cleanup_element_group(key)
+
     def combobox(self, title_or_options, options=None, k='', s='', default=None, nr_rows=5, event_change=False):
         """Create combobox with optional change event support"""
-        try:
-            import tkinter.ttk as ttk
-        except ImportError:
-            from tkinter import ttk
-
         s, _, _, k = self._merge_defaults(s, '', '', k)
 
         if options is None:
@@ -194,30 +184,16 @@ class NgElementsBase20:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w')
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w')
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
-        parsed_options = []
-        display_values = []
-
-        for option in combobox_options:
-            if isinstance(option, str) and '|' in option:
-                display_text, value = option.split('|', 1)
-            else:
-                display_text = value = str(option)
-            parsed_options.append((display_text, value))
-            display_values.append(display_text)
+        parsed_options = self._parse_options(combobox_options)
+        display_values = [display_text for display_text, _ in parsed_options]
 
-        if not hasattr(self, '_combobox_groups'):
-            self._combobox_groups = {}
-
-        combobox_widget = ttk.Combobox(self.root,
+        combobox_widget = self._ttk.Combobox(self.root,
                                        values=display_values,
                                        height=nr_rows,
                                        state='readonly')
@@ -225,8 +201,7 @@ class NgElementsBase20:
         # Add change event support
         if event_change and k:
             def combobox_change_handler(event):
-                values = self._get_values()
-                self.event_queue.put((k, values))
+                self._post_widget_event(k)
 
             combobox_widget.bind("<<ComboboxSelected>>", combobox_change_handler)
 
@@ -244,11 +219,9 @@ class NgElementsBase20:
                         combobox_widget.current(i)
                         break
 
-        combobox_widget.place(x=self.current_x, y=self.current_y)
-        combobox_widget.update_idletasks()
-
-        combobox_width = combobox_widget.winfo_reqwidth()
-        combobox_height = combobox_widget.winfo_reqheight()
+        self._place_element(combobox_widget, x=self.current_x, y=self.current_y)
+        # The size of a readonly combobox does not depend on its values
+        combobox_width, combobox_height = self._widget_size(combobox_widget)
 
         max_width = max(max_width, combobox_width)
 
@@ -263,12 +236,10 @@ class NgElementsBase20:
         element_positions.append((self.current_x, self.current_y))
 
         if k:
-            self._combobox_groups[k] = (combobox_widget, parsed_options)
             effective_key = k
         else:
             effective_key = f"__auto_key_{self.element_counter}"
             self.element_counter += 1
-            self._combobox_groups[effective_key] = (combobox_widget, parsed_options)
 
         total_height = title_height + combobox_height
         if title_height > 0:
@@ -276,10 +247,9 @@ class NgElementsBase20:
 
         self._register_element_position(effective_key, start_x, start_y, max_width, total_height)
 
-        if not hasattr(self, '_combobox_element_positions'):
-            self._combobox_element_positions = {}
-
-        self._combobox_element_positions[effective_key] = list(zip(combobox_elements, element_positions))
+        self._register_group_kind('combobox', self._combobox_value, self._cleanup_element_group,
+                                  self._set_combobox_value)
+        self._register_group(ComboboxGroup(effective_key, combobox_widget, parsed_options), combobox_elements, element_positions)
 
         if s:
             self.element_strings[effective_key] = s
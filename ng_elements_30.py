@@ -2,6 +2,7 @@
 # Licensed under the MIT License
 
 import tkinter as tk
+from ng_registry import MultilineGroup
 
 class NgElementsBase30:
     """Text elements: multiline text input"""
@@ -24,31 +25,25 @@ class NgElementsBase30:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w')
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w')
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
-        text_widget = tk.Text(self.root, height=nr_rows, width=nr_cols, wrap=tk.WORD)
+        text_widget = self._tk.Text(self.root, height=nr_rows, width=nr_cols, wrap=tk.WORD)
 
-        scrollbar = tk.Scrollbar(self.root, orient=tk.VERTICAL, command=text_widget.yview)
+        scrollbar = self._tk.Scrollbar(self.root, orient=tk.VERTICAL, command=text_widget.yview)
         text_widget.config(yscrollcommand=scrollbar.set)
 
         if initial_text:
             text_widget.insert('1.0', initial_text)
 
-        text_widget.place(x=self.current_x, y=self.current_y)
-        text_widget.update_idletasks()
-
-        text_width = text_widget.winfo_reqwidth()
-        text_height = text_widget.winfo_reqheight()
+        self._place_element(text_widget, x=self.current_x, y=self.current_y)
+        text_width, text_height = self._widget_size(text_widget, nr_rows, nr_cols)
 
         scrollbar_width = 20
-        scrollbar.place(x=self.current_x + text_width, y=self.current_y, height=text_height)
+        self._place_element(scrollbar, x=self.current_x + text_width, y=self.current_y, height=text_height)
 
         total_width = text_width + scrollbar_width
         max_width = max(max_width, total_width)
@@ -77,15 +72,9 @@ class NgElementsBase30:
 
         self._register_element_position(effective_key, start_x, start_y, max_width, total_height)
 
-        if not hasattr(self, '_multiline_groups'):
-            self._multiline_groups = {}
-
-        self._multiline_groups[effective_key] = text_widget
-
-        if not hasattr(self, '_multiline_element_positions'):
-            self._multiline_element_positions = {}
-
-        self._multiline_element_positions[effective_key] = list(zip(multiline_elements, element_positions))
+        self._register_group_kind('multiline', self._multiline_value, self._cleanup_element_group,
+                                  self._set_multiline_value)
+        self._register_group(MultilineGroup(effective_key, text_widget), multiline_elements, element_positions)
 
         if s:
             self.element_strings[effective_key] = s
@@ -2,18 +2,14 @@
 # Licensed under the MIT License
 
 import tkinter as tk
+from ng_registry import TableGroup
 
 class NgElementsBase40:
     """Data display elements: table"""
 
     def table(self, title_or_conf, conf=None, data=None, nr_rows=5, k='', s='', rowcolors=None,
-              event_click=False, event_dbclick=False):
+              event_click=False, event_dbclick=False, budget_ms=0):
         """Create table using Tkinter ttk.Treeview with optional click events"""
-        try:
-            import tkinter.ttk as ttk
-        except ImportError:
-            from tkinter import ttk
-
         s, _, _, k = self._merge_defaults(s, '', '', k)
 
         if conf is None:
@@ -33,12 +29,9 @@ class NgElementsBase40:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w')
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w')
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
@@ -46,7 +39,7 @@ class NgElementsBase40:
         column_names = [table_conf[key][0] for key in column_keys]
         column_widths = [table_conf[key][1] * 10 for key in column_keys]
 
-        table_widget = ttk.Treeview(self.root,
+        table_widget = self._ttk.Treeview(self.root,
                                     columns=column_keys,
                                     show='headings',
                                     height=nr_rows)
@@ -70,14 +63,12 @@ class NgElementsBase40:
                         # Wait 300ms to see if a double-click follows
                         def delayed_click():
                             if not table_widget.double_click_pending:
-                                values = self._get_values()
-                                self.event_queue.put((k, values))
+                                self._post_widget_event(k)
 
                         table_widget.click_timer = self.root.after(300, delayed_click)
                     else:
                         # No double-click enabled, fire immediately
-                        values = self._get_values()
-                        self.event_queue.put((k, values))
+                        self._post_widget_event(k)
 
                 table_widget.bind("<<TreeviewSelect>>", table_click_handler)
 
@@ -92,8 +83,7 @@ class NgElementsBase40:
                     table_widget.double_click_pending = True
 
                     # Fire double-click event
-                    values = self._get_values()
-                    self.event_queue.put((f"{k}_DBCLICK", values))
+                    self._post_widget_event(f"{k}_DBCLICK")
 
                 table_widget.bind("<Double-Button-1>", table_dbclick_handler)
 
@@ -101,63 +91,34 @@ class NgElementsBase40:
             table_widget.heading(col_key, text=column_names[i])
             table_widget.column(col_key, width=column_widths[i], minwidth=50)
 
-        row_color_map = {}
-        if rowcolors:
-            for row_color_info in rowcolors:
-                if len(row_color_info) == 2:
-                    row_index, bg_color = row_color_info
-                    row_color_map[row_index] = (bg_color, None)
-                elif len(row_color_info) >= 3:
-                    row_index, bg_color, fg_color = row_color_info[:3]
-                    row_color_map[row_index] = (bg_color, fg_color)
-
-        unique_color_combinations = set()
-        if rowcolors:
-            for row_index, color_info in row_color_map.items():
-                unique_color_combinations.add(color_info)
-
-        for bg_color, fg_color in unique_color_combinations:
-            if fg_color is None:
-                tag_name = f"bg_{bg_color}"
-                table_widget.tag_configure(tag_name, background=bg_color)
-            else:
-                tag_name = f"bg_{bg_color}_fg_{fg_color}"
-                table_widget.tag_configure(tag_name, background=bg_color, foreground=fg_color)
+        row_color_map = self._parse_rowcolors(rowcolors)
 
-        inserted_items = []
-        for row_index, row_data in enumerate(data):
-            if len(row_data) >= len(column_keys):
-                values_to_insert = row_data[:len(column_keys)]
-            else:
-                padded_row = list(row_data) + [''] * (len(column_keys) - len(row_data))
-                values_to_insert = padded_row
+        self._configure_table_tags(table_widget, row_color_map)
 
-            tags = ()
-            if row_index in row_color_map:
-                bg_color, fg_color = row_color_map[row_index]
-                if fg_color is None:
-                    tag_name = f"bg_{bg_color}"
-                else:
-                    tag_name = f"bg_{bg_color}_fg_{fg_color}"
-                tags = (tag_name,)
+        if k:
+            effective_key = k
+        else:
+            effective_key = f"__auto_key_{self.element_counter}"
+            self.element_counter += 1
 
-            item_id = table_widget.insert('', 'end', values=values_to_insert, tags=tags)
-            inserted_items.append(item_id)
+        row_inserter = self._insert_table_rows(table_widget, column_keys, data, row_color_map)
+        if budget_ms > 0 and data:
+            self._schedule_job(row_inserter, budget_ms=budget_ms, job_id=('table_rows', effective_key))
+        else:
+            for _ in row_inserter:
+                pass
 
-        v_scrollbar = ttk.Scrollbar(self.root, orient=tk.VERTICAL, command=table_widget.yview)
-        h_scrollbar = ttk.Scrollbar(self.root, orient=tk.HORIZONTAL, command=table_widget.xview)
+        v_scrollbar = self._ttk.Scrollbar(self.root, orient=tk.VERTICAL, command=table_widget.yview)
+        h_scrollbar = self._ttk.Scrollbar(self.root, orient=tk.HORIZONTAL, command=table_widget.xview)
 
         table_widget.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
 
-        table_widget.place(x=self.current_x, y=self.current_y)
-        table_widget.update_idletasks()
-
-        table_width = table_widget.winfo_reqwidth()
-        table_height = table_widget.winfo_reqheight()
+        self._place_element(table_widget, x=self.current_x, y=self.current_y)
+        table_width, table_height = self._widget_size(table_widget, tuple(column_widths), nr_rows)
 
         scrollbar_width = 20
-        v_scrollbar.place(x=self.current_x + table_width, y=self.current_y, height=table_height)
-        h_scrollbar.place(x=self.current_x, y=self.current_y + table_height, width=table_width)
+        self._place_element(v_scrollbar, x=self.current_x + table_width, y=self.current_y, height=table_height)
+        self._place_element(h_scrollbar, x=self.current_x, y=self.current_y + table_height, width=table_width)
 
         total_width = table_width + scrollbar_width
         total_height = table_height + scrollbar_width
@@ -178,27 +139,14 @@ class NgElementsBase40:
             (self.current_x, self.current_y + table_height)
         ])
 
-        if k:
-            effective_key = k
-        else:
-            effective_key = f"__auto_key_{self.element_counter}"
-            self.element_counter += 1
-
         final_total_height = title_height + total_height
         if title_height > 0:
             final_total_height += 2
 
         self._register_element_position(effective_key, start_x, start_y, max_width, final_total_height)
 
-        if not hasattr(self, '_table_groups'):
-            self._table_groups = {}
-
-        self._table_groups[effective_key] = (table_widget, column_keys)
-
-        if not hasattr(self, '_table_element_positions'):
-            self._table_element_positions = {}
-
-        self._table_element_positions[effective_key] = list(zip(table_elements, element_positions))
+        self._register_group_kind('table', self._table_value, self._cleanup_table)
+        self._register_group(TableGroup(effective_key, table_widget, column_keys), table_elements, element_positions)
 
         # Register main table widget in element_keys
         self.element_keys[effective_key] = table_widget
@@ -214,4 +162,50 @@ class NgElementsBase40:
         self.current_x = start_x + max_width + 10
         self.current_y = start_y
 
-        return self
\ No newline at end of file
+        return self
+
+    def _parse_rowcolors(self, rowcolors):
+        """Turn [(row, bg), (row, bg, fg), ...] into {row: (bg, fg or None)}"""
+        row_color_map = {}
+        if rowcolors:
+            for row_color_info in rowcolors:
+                if len(row_color_info) == 2:
+                    row_index, bg_color = row_color_info
+                    row_color_map[row_index] = (bg_color, None)
+                elif len(row_color_info) >= 3:
+                    row_index, bg_color, fg_color = row_color_info[:3]
+                    row_color_map[row_index] = (bg_color, fg_color)
+        return row_color_map
+
+    def _row_color_tag(self, color_info):
+        """Return the Treeview tag name for a (bg, fg) pair"""
+        bg_color, fg_color = color_info
+        if fg_color is None:
+            return f"bg_{bg_color}"
+        return f"bg_{bg_color}_fg_{fg_color}"
+
+    def _configure_table_tags(self, table_widget, row_color_map):
+        """Configure one Treeview tag per distinct color combination"""
+        for color_info in set(row_color_map.values()):
+            bg_color, fg_color = color_info
+            if fg_color is None:
+                table_widget.tag_configure(self._row_color_tag(color_info), background=bg_color)
+            else:
+                table_widget.tag_configure(self._row_color_tag(color_info), background=bg_color,
+                                           foreground=fg_color)
+
+    def _insert_table_rows(self, table_widget, column_keys, data, row_color_map):
+        """Generator inserting table rows one per step"""
+        for row_index, row_data in enumerate(data):
+            if len(row_data) >= len(column_keys):
+                values_to_insert = row_data[:len(column_keys)]
+            else:
+                padded_row = list(row_data) + [''] * (len(column_keys) - len(row_data))
+                values_to_insert = padded_row
+
+            tags = ()
+            if row_index in row_color_map:
+                tags = (self._row_color_tag(row_color_map[row_index]),)
+
+            table_widget.insert('', 'end', values=values_to_insert, tags=tags)
+            yield
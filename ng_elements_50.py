@@ -1,7 +1,6 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-import tkinter as tk
 import os
 try:
     from PIL import Image, ImageTk, ImageDraw
@@ -27,47 +26,22 @@ class NgElementsBase50:
             except (ValueError, IndexError):
                 pass
 
-        photo_image = None
-
-        if image_path and os.path.exists(image_path):
-            try:
-                pil_image = Image.open(image_path)
-                pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS)
-                photo_image = ImageTk.PhotoImage(pil_image)
-            except Exception as e:
-                print(f"Image loading error {image_path}: {e}")
-                photo_image = None
-
-        if photo_image is None:
-            placeholder_image = Image.new('RGB', (width, height), color='lightgray')
-
-            try:
-                if ImageDraw:
-                    draw = ImageDraw.Draw(placeholder_image)
-                    draw.line([(0, 0), (width - 1, height - 1)], fill='gray', width=2)
-                    draw.line([(0, height - 1), (width - 1, 0)], fill='gray', width=2)
-                    draw.rectangle([(0, 0), (width - 1, height - 1)], outline='gray', width=1)
-            except ImportError:
-                pass
-
-            photo_image = ImageTk.PhotoImage(placeholder_image)
+        photo_image = self._load_photo_image(image_path, width, height)
 
         def image_callback(event):
             if k:
-                values = self._get_values()
-                self.event_queue.put((k, values))
+                self._post_widget_event(k)
             elif command:
                 command()
 
-        image_label = tk.Label(self.root, image=photo_image)
+        image_label = self._tk.Label(self.root, image=photo_image)
         image_label.image = photo_image
 
         if command or k:
             image_label.bind("<Button-1>", image_callback)
             image_label.config(cursor="hand2")
 
-        image_label.place(x=self.current_x, y=self.current_y)
-        image_label.update_idletasks()
+        self._place_element(image_label, x=self.current_x, y=self.current_y)
 
         actual_width = width
         actual_height = height
@@ -79,4 +53,27 @@ class NgElementsBase50:
         self._update_position(actual_width, actual_height)
         self._register_element(image_label, k, s)
 
-        return self
\ No newline at end of file
+        return self
+
+    def _load_photo_image(self, image_path, width, height):
+        """Load image_path resized to width x height, or a crossed placeholder if it cannot be read"""
+        if image_path and os.path.exists(image_path):
+            try:
+                pil_image = Image.open(image_path)
+                pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS)
+                return ImageTk.PhotoImage(pil_image)
+            except Exception as e:
+                print(f"Image loading error {image_path}: {e}")
+
+        placeholder_image = Image.new('RGB', (width, height), color='lightgray')
+
+        try:
+            if ImageDraw:
+                draw = ImageDraw.Draw(placeholder_image)
+                draw.line([(0, 0), (width - 1, height - 1)], fill='gray', width=2)
+                draw.line([(0, height - 1), (width - 1, 0)], fill='gray', width=2)
+                draw.rectangle([(0, 0), (width - 1, height - 1)], outline='gray', width=1)
+        except ImportError:
+            pass
+
+        return ImageTk.PhotoImage(placeholder_image)
@@ -1,7 +1,7 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-import tkinter as tk
+from ng_registry import PanelGroup
 
 
 class NgElementsBase60:
@@ -10,7 +10,6 @@ class NgElementsBase60:
     def _init_panel_elements(self):
         """Initialize panel variables"""
         self._panel_stack = []
-        self._panel_groups = {}
         self._current_panel_key = None
         self._panel_padding = 15  # Default horizontal padding inside panels
 
@@ -24,6 +23,9 @@ class NgElementsBase60:
             # End panel mode - restore original context
             if hasattr(self, '_panel_stack') and self._panel_stack:
                 panel_data = self._panel_stack.pop()
+                panel = self._group(panel_data['key'], 'panel')
+                if panel is not None:
+                    panel.state['end_generation'] = self._generation
                 self.current_x = panel_data['end_x']
                 self.current_y = panel_data['end_y']
                 self.default_s = panel_data['prev_s']
@@ -58,34 +60,31 @@ class NgElementsBase60:
         start_x = self.current_x
         start_y = self.current_y
 
-        rect = tk.Frame(self.root, width=width, height=height, bg=panel_bg,
+        rect = self._tk.Frame(self.root, width=width, height=height, bg=panel_bg,
                         highlightbackground='gray', highlightthickness=1)
-        rect.place(x=start_x, y=start_y)
+        self._place_element(rect, x=start_x, y=start_y)
 
         # Create close button
-        close_btn = tk.Button(self.root, text="×", width=2, height=1, bg=panel_bg,
+        close_btn = self._tk.Button(self.root, text="×", width=2, height=1, bg=panel_bg,
                               command=lambda: self._toggle_panel_visibility(k, s))
-        close_btn.place(x=start_x + width - 25, y=start_y + 2)
+        self._place_element(close_btn, x=start_x + width - 25, y=start_y + 2)
 
         # Create title if provided
         title_label = None
         if title:
-            title_label = tk.Label(self.root, text=title, bg=panel_bg)
-            title_label.place(x=start_x + 10, y=start_y + 2)
+            title_label = self._tk.Label(self.root, text=title, bg=panel_bg)
+            self._place_element(title_label, x=start_x + 10, y=start_y + 2)
 
         # Register elements
         effective_key = k if k else f"__auto_key_{self.element_counter}"
         self._register_element_position(effective_key, start_x, start_y, width, height)
 
-        # Create panel elements tracking if not exists
-        if not hasattr(self, '_panel_groups'):
-            self._panel_groups = {}
-
         # Ensure we have a selection string for the panel
         panel_s = s if s else f"panel_{effective_key}"
 
-        # Store panel data for internal reference
-        self._panel_groups[effective_key] = {
+        # Store panel data for internal reference (panels carry no value)
+        self._register_group_kind('panel', cleanup=self._cleanup_panel)
+        self._register_group(PanelGroup(effective_key, {
             'rect': rect,
             'close_btn': close_btn,
             'title': title_label,
@@ -98,7 +97,7 @@ class NgElementsBase60:
             'padding': padding,
             'background': panel_bg,
             'selection_string': panel_s
-        }
+        }), [], [])
 
         # Store original default_s and default_bg to restore it later
         prev_s = self.default_s
@@ -171,10 +170,13 @@ class NgElementsBase60:
         if s:
             self.element_strings[key] = s
 
+        self._track_element(element, key, s)
+
         # If we're inside a panel, add this element to the panel's list
-        if hasattr(self, '_current_panel_key') and self._current_panel_key:
-            if self._current_panel_key in self._panel_groups:
-                panel_data = self._panel_groups[self._current_panel_key]
+        if self._current_panel_key:
+            panel = self._group(self._current_panel_key, 'panel')
+            if panel is not None:
+                panel_data = panel.state
                 panel_data['elements'].append(element)
                 panel_data['element_keys'].append(key)
 
@@ -216,11 +218,43 @@ class NgElementsBase60:
         if s:
             self.element_strings[key] = s
 
+        self._track_element(element, key, s)
+
         # If we're inside a panel, add this element to the panel's list
-        if hasattr(self, '_current_panel_key') and self._current_panel_key:
-            if self._current_panel_key in self._panel_groups:
-                self._panel_groups[self._current_panel_key]['elements'].append(element)
-                self._panel_groups[self._current_panel_key]['element_keys'].append(key)
+        if self._current_panel_key:
+            panel = self._group(self._current_panel_key, 'panel')
+            if panel is not None:
+                panel.state['elements'].append(element)
+                panel.state['element_keys'].append(key)
+
+    def _cleanup_panel(self, key):
+        """Delete a panel with its frame, controls and the elements created inside it"""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        panel_data = group.state
+
+        # A panel still open stops collecting elements
+        if self._current_panel_key == key:
+            self._current_panel_key = None
+        self._panel_stack = [entry for entry in self._panel_stack if entry['key'] != key]
+
+        # Children are whatever was registered between the panel start and its end
+        first, last = group.generation, panel_data.get('end_generation', self._generation)
+        child_groups = [child for child, record in self._groups.items() if first < record.generation <= last]
+        child_elements = [element for element in self.elements if first < self._element_generation(element) <= last]
+
+        with self.batch():
+            for child in reversed(child_groups):
+                if child in self._groups:
+                    self._delete_key(child)
+
+            for element in [panel_data['rect'], panel_data['close_btn'], panel_data['title']] + child_elements:
+                if element is not None and element in self.elements:
+                    self._remove_element(element)
+
+        self.element_positions.pop(key, None)
+        self.element_strings.pop(key, None)
 
     def _toggle_panel_visibility(self, panel_key, panel_s=None):
         """Toggle panel visibility when close button is clicked
@@ -229,10 +263,11 @@ class NgElementsBase60:
             panel_key: Key of the panel to toggle
             panel_s: Selection string of the panel (optional)
         """
-        if not hasattr(self, '_panel_groups') or panel_key not in self._panel_groups:
+        panel = self._group(panel_key, 'panel')
+        if panel is None:
             return
 
-        panel_data = self._panel_groups[panel_key]
+        panel_data = panel.state
 
         # Check if panel is visible
         is_visible = True
@@ -253,24 +288,24 @@ class NgElementsBase60:
             if is_visible:
                 # Hide panel frame and controls
                 if hasattr(panel_data['rect'], 'place_forget'):
-                    panel_data['rect'].place_forget()
+                    self._unplace_element(panel_data['rect'])
                 if hasattr(panel_data['close_btn'], 'place_forget'):
-                    panel_data['close_btn'].place_forget()
+                    self._unplace_element(panel_data['close_btn'])
                 if panel_data['title'] and hasattr(panel_data['title'], 'place_forget'):
-                    panel_data['title'].place_forget()
+                    self._unplace_element(panel_data['title'])
 
                 # Hide all elements in the panel
                 for element in panel_data['elements']:
                     if hasattr(element, 'place_forget'):
-                        element.place_forget()
+                        self._unplace_element(element)
             else:
                 # Show panel frame and controls
                 start_x, start_y, width, height = self.element_positions.get(panel_key, (0, 0, 100, 100))
-                panel_data['rect'].place(x=start_x, y=start_y, width=width, height=height)
-                panel_data['close_btn'].place(x=start_x + width - 25, y=start_y + 2)
+                self._place_element(panel_data['rect'], x=start_x, y=start_y, width=width, height=height)
+                self._place_element(panel_data['close_btn'], x=start_x + width - 25, y=start_y + 2)
 
                 if panel_data['title']:
-                    panel_data['title'].place(x=start_x + 10, y=start_y + 2)
+                    self._place_element(panel_data['title'], x=start_x + 10, y=start_y + 2)
 
                 # Show all elements in the panel
                 for element_key in panel_data['element_keys']:
@@ -280,9 +315,9 @@ class NgElementsBase60:
 
                         # Make sure the element is visible when shown again
                         if width and height:
-                            element.place(x=x, y=y, width=width, height=height)
+                            self._place_element(element, x=x, y=y, width=width, height=height)
                         else:
-                            element.place(x=x, y=y)
+                            self._place_element(element, x=x, y=y)
 
     def _hide_elements_by_selection_string(self, s):
         """Hide all elements with matching selection string"""
@@ -291,14 +326,11 @@ class NgElementsBase60:
             return
 
         # Find all keys with matching selection string
-        matching_keys = []
-        for key, stored_s in self.element_strings.items():
-            if stored_s == s:
-                matching_keys.append(key)
+        matching_keys = self.element_strings.keys_equal(s)
 
         # Hide all matching elements
         for key in matching_keys:
             if key in self.element_keys:
                 element = self.element_keys[key]
                 if hasattr(element, 'place_forget'):
-                    element.place_forget()
\ No newline at end of file
+                    self._unplace_element(element)
\ No newline at end of file
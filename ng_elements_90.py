@@ -1,116 +1,286 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
+import collections.abc
+import time
 import tkinter as tk
 
+
+class NgValues(collections.abc.MutableMapping):
+    """Values read on access: a widget is queried when the handler first asks for its key
+
+    Values are read at that time, not when the event fired; keys of widgets
+    deleted in between are missing. Not a dict: json.dumps() needs values.copy()"""
+
+    def __init__(self, window):
+        self._window = window
+        self._values = {}
+        self._deleted = set()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key in self._deleted:
+                raise
+
+        window = self._window
+        start = time.perf_counter()
+        try:
+            value = window._read_value(key)
+        except tk.TclError:
+            # The widget was destroyed after the event fired
+            raise KeyError(key) from None
+        if getattr(window, '_stats', None) is not None:
+            window._record_stat('values', time.perf_counter() - start)
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key):
+        return key in self._values or (key not in self._deleted and self._window._has_value(key))
+
+    def _load_all(self):
+        """Read every value not accessed yet, return the keys in snapshot order"""
+        keys = []
+        for key in self._window._value_keys():
+            if key in self._values or key not in self._deleted:
+                try:
+                    self[key]
+                except KeyError:
+                    continue
+                keys.append(key)
+        listed = set(keys)
+        return keys + [key for key in self._values if key not in listed]
+
+    def __iter__(self):
+        return iter(self._load_all())
+
+    def __len__(self):
+        return len(self._load_all())
+
+    def __repr__(self):
+        return f"NgValues({self.copy()!r})"
+
+    def copy(self):
+        """Return a plain dict snapshot of all values"""
+        return {key: self._values[key] for key in self._load_all()}
+
+
 class NgElementsBase90:
     """Values management: collecting data from all elements"""
 
+    def set_eager_values(self, enabled=True):
+        """Pass a plain dict snapshot of all values with every event instead of the lazy NgValues"""
+        self.eager_values = enabled
+        return self
+
     def _get_values(self):
-        """Collect all values from input elements, checkboxes, radio buttons and listboxes"""
+        """Return the values passed along with an event: NgValues, or a dict snapshot with set_eager_values()"""
+        if not getattr(self, 'eager_values', False):
+            return NgValues(self)
+        if getattr(self, '_stats', None) is None:
+            return self._get_values_snapshot()
+
+        start = time.perf_counter()
+        values = self._get_values_snapshot()
+        self._record_stat('values', time.perf_counter() - start)
+        return values
+
+    def _get_values_snapshot(self):
+        """Collect all values from input elements and element groups"""
         values = {}
 
         # Input values
         for key, element in self.element_keys.items():
-            if not key.startswith('__auto_key_') and isinstance(element, tk.Entry):
-                values[key] = element.get()
-
-        # Checkbox group values
-        if hasattr(self, '_checkbox_groups'):
-            for key, checkbox_vars in self._checkbox_groups.items():
-                if not key.startswith('__auto_key_'):
-                    selected_values = []
-                    for var, value in checkbox_vars:
-                        if var.get():
-                            selected_values.append(value)
-                    values[key] = selected_values
-
-        # Radio button group values
-        if hasattr(self, '_radio_groups'):
-            for key, radio_var in self._radio_groups.items():
-                if not key.startswith('__auto_key_'):
-                    selected_value = radio_var.get()
-                    values[key] = selected_value if selected_value else ''
-
-        # Listbox values with multi-select support
-        if hasattr(self, '_listbox_groups'):
-            for key, listbox_data in self._listbox_groups.items():
-                if not key.startswith('__auto_key_'):
-                    if len(listbox_data) == 3:
-                        listbox_widget, parsed_options, multi_select = listbox_data
-                    else:
-                        listbox_widget, parsed_options = listbox_data
-                        multi_select = False
-
-                    selection = listbox_widget.curselection()
-
-                    if multi_select:
-                        selected_values = []
-                        for selected_index in selection:
-                            if selected_index < len(parsed_options):
-                                _, selected_value = parsed_options[selected_index]
-                                selected_values.append(selected_value)
-                        values[key] = selected_values
-                    else:
-                        if selection:
-                            selected_index = selection[0]
-                            if selected_index < len(parsed_options):
-                                _, selected_value = parsed_options[selected_index]
-                                values[key] = selected_value
-                            else:
-                                values[key] = ''
-                        else:
-                            values[key] = ''
-
-        # Multiline widget values
-        if hasattr(self, '_multiline_groups'):
-            for key, text_widget in self._multiline_groups.items():
-                if not key.startswith('__auto_key_'):
-                    text_content = text_widget.get('1.0', 'end-1c')
-                    values[key] = text_content
-
-        # Combobox values
-        if hasattr(self, '_combobox_groups'):
-            for key, combobox_data in self._combobox_groups.items():
-                if not key.startswith('__auto_key_'):
-                    combobox_widget, parsed_options = combobox_data
-
-                    current_selection = combobox_widget.current()
-
-                    if current_selection >= 0 and current_selection < len(parsed_options):
-                        _, selected_value = parsed_options[current_selection]
-                        values[key] = selected_value
-                    else:
-                        values[key] = ''
-
-        # Table values (selections)
-        if hasattr(self, '_table_groups'):
-            for key, table_data in self._table_groups.items():
-                if not key.startswith('__auto_key_'):
-                    table_widget, column_keys = table_data
-
-                    selection = table_widget.selection()
-
-                    if selection:
-                        selected_indices = []
-                        for item_id in selection:
-                            index = table_widget.index(item_id)
-                            selected_indices.append(index)
-
-                        values[key] = selected_indices
-                    else:
-                        values[key] = []
-
-        # Navigation table values - Using English key names
-        if hasattr(self, '_navtable_groups'):
-            for key, navtable_data in self._navtable_groups.items():
-                if not key.startswith('__auto_key_'):
-                    values[key] = {
-                        'current_page': navtable_data['current_page'],
-                        'total_pages': navtable_data['total_pages'],
-                        'rows_per_page': navtable_data['nr_rows'],
-                        'total_data': len(navtable_data['data']),
-                        'current_page_data': self._get_current_page_data_navtable(navtable_data)
-                    }
-
-        return values
\ No newline at end of file
+            if not key.startswith('__auto_key_') and isinstance(element, self._tk.Entry):
+                values[key] = self._entry_value(element)
+
+        # Group values, read by the reader registered for each group kind
+        kinds = self._group_kinds
+        for key, group in self._groups.items():
+            reader = kinds[group.kind].reader
+            if reader is not None and not key.startswith('__auto_key_'):
+                values[key] = reader(group)
+
+        return values
+
+    def _group_reader(self, key):
+        """Return (group, reader) of a group carrying a value, (None, None) otherwise"""
+        group = self._groups.get(key)
+        if group is None:
+            return None, None
+        reader = self._group_kinds[group.kind].reader
+        return (group, reader) if reader is not None else (None, None)
+
+    def _read_value(self, key):
+        """Read the current value of a single element, KeyError if key has no value"""
+        if not isinstance(key, str) or key.startswith('__auto_key_'):
+            raise KeyError(key)
+
+        group, reader = self._group_reader(key)
+        if reader is not None:
+            return reader(group)
+
+        element = self.element_keys.get(key)
+        if isinstance(element, self._tk.Entry):
+            return self._entry_value(element)
+
+        raise KeyError(key)
+
+    def _has_value(self, key):
+        """Check if key identifies an element that carries a value"""
+        if not isinstance(key, str) or key.startswith('__auto_key_'):
+            return False
+
+        if self._group_reader(key)[1] is not None:
+            return True
+
+        return isinstance(self.element_keys.get(key), self._tk.Entry)
+
+    def _value_keys(self):
+        """Return value keys in the same order as the eager snapshot"""
+        keys = {}
+
+        for key, element in self.element_keys.items():
+            if not key.startswith('__auto_key_') and isinstance(element, self._tk.Entry):
+                keys[key] = None
+
+        kinds = self._group_kinds
+        for key, group in self._groups.items():
+            if kinds[group.kind].reader is not None and not key.startswith('__auto_key_'):
+                keys[key] = None
+
+        return list(keys)
+
+    def _write_value(self, key, value):
+        """Set the value of a single element, the inverse of _read_value(); labels and buttons get value as text
+
+        None clears entries and texts"""
+        group = self._groups.get(key)
+        if group is not None:
+            writer = self._group_kinds[group.kind].writer
+            if writer is not None:
+                writer(group, value)
+            return
+
+        if value is None:
+            value = ''
+
+        element = self.element_keys.get(key)
+        if isinstance(element, self._tk.Entry):
+            element.delete(0, 'end')
+            element.insert(0, value)
+        elif isinstance(element, (self._tk.Label, self._tk.Button)):
+            element.configure(text=value)
+
+    def _entry_value(self, element):
+        """Read an Entry"""
+        return element.get()
+
+    def _checkbox_value(self, group):
+        """Read a checkbox group as the list of checked values"""
+        selected_values = []
+        for var, value in group.vars:
+            if var.get():
+                selected_values.append(value)
+        return selected_values
+
+    def _radio_value(self, group):
+        """Read a radio group as the selected value"""
+        selected_value = group.var.get()
+        return selected_value if selected_value else ''
+
+    def _listbox_value(self, group):
+        """Read a listbox as the selected value, or list of values when multi-select"""
+        parsed_options = group.options
+        selection = group.widget.curselection()
+
+        if group.multi_select:
+            selected_values = []
+            for selected_index in selection:
+                if selected_index < len(parsed_options):
+                    _, selected_value = parsed_options[selected_index]
+                    selected_values.append(selected_value)
+            return selected_values
+
+        if selection:
+            selected_index = selection[0]
+            if selected_index < len(parsed_options):
+                _, selected_value = parsed_options[selected_index]
+                return selected_value
+        return ''
+
+    def _multiline_value(self, group):
+        """Read a multiline Text widget"""
+        return group.widget.get('1.0', 'end-1c')
+
+    def _combobox_value(self, group):
+        """Read a combobox as the selected value"""
+        parsed_options = group.options
+        current_selection = group.widget.current()
+
+        if current_selection >= 0 and current_selection < len(parsed_options):
+            _, selected_value = parsed_options[current_selection]
+            return selected_value
+        return ''
+
+    def _set_checkbox_value(self, group, value):
+        """Check the checkboxes whose value is in value (a list, or a single value)"""
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for var, checkbox_value in group.vars:
+            var.set(checkbox_value in values)
+
+    def _set_radio_value(self, group, value):
+        """Select the radio button of value, none for None"""
+        group.var.set('' if value is None else value)
+
+    def _set_listbox_value(self, group, value):
+        """Select the options of value (a list when multi-select)"""
+        values = value if isinstance(value, (list, tuple)) else [value]
+        group.widget.selection_clear(0, 'end')
+        for i, (_, option_value) in enumerate(group.options):
+            if option_value in values:
+                group.widget.selection_set(i)
+
+    def _set_combobox_value(self, group, value):
+        """Select the option of value, clear the combobox if there is none"""
+        for i, (_, option_value) in enumerate(group.options):
+            if option_value == value:
+                group.widget.current(i)
+                return
+        group.widget.set('')
+
+    def _set_multiline_value(self, group, value):
+        """Replace the text of a multiline widget"""
+        group.widget.delete('1.0', 'end')
+        group.widget.insert('1.0', '' if value is None else value)
+
+    def _table_value(self, group):
+        """Read a table as the list of selected row indices"""
+        table_widget = group.widget
+
+        selected_indices = []
+        for item_id in table_widget.selection():
+            selected_indices.append(table_widget.index(item_id))
+        return selected_indices
+
+    def _navtable_value(self, group):
+        """Read a navigation table as its paging state and current page data"""
+        navtable_data = group.state
+        return {
+            'current_page': navtable_data['current_page'],
+            'total_pages': navtable_data['total_pages'],
+            'rows_per_page': navtable_data['nr_rows'],
+            'total_data': len(navtable_data['data']),
+            'current_page_data': self._get_current_page_data_navtable(navtable_data)
+        }
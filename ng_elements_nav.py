@@ -1,23 +1,15 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-import tkinter as tk
 import os
-
-try:
-    from PIL import Image, ImageTk, ImageDraw
-except ImportError:
-    print("ERROR: PIL/Pillow not installed. Install with: pip install Pillow")
-    Image = None
-    ImageTk = None
-    ImageDraw = None
+from ng_registry import NavtableGroup
 
 
 class NgNavElements:
     """Mixin for complex navigable GUI elements"""
 
     def navtable(self, title_or_conf, conf=None, data=None, nr_rows=5, k='', s='', folder_images='', size_img='50x50',
-                 vgap=0, vnavgap=10, alternate_rowcolor=''):
+                 vgap=0, vnavgap=10, alternate_rowcolor='', budget_ms=0):
         """Create navigable table with images and automatic pagination"""
         # Set default vertical gap if not provided
         if vgap is None:
@@ -43,12 +35,9 @@ class NgNavElements:
 
         title_element = None
         if title:
-            title_element = tk.Label(self.root, text=title, anchor='w')
-            title_element.place(x=start_x, y=start_y)
-            title_element.update_idletasks()
-
-            title_width = title_element.winfo_reqwidth()
-            title_height = title_element.winfo_reqheight()
+            title_element = self._tk.Label(self.root, text=title, anchor='w')
+            self._place_element(title_element, x=start_x, y=start_y)
+            title_width, title_height = self._label_size(title_element, title)
             max_width = max(max_width, title_width)
             self.current_y += title_height + 2
 
@@ -76,18 +65,12 @@ class NgNavElements:
         if k:
             effective_key = k
             # Clean any existing navtable with same key before creating new one
-            if hasattr(self, '_navtable_groups') and effective_key in self._navtable_groups:
+            if self._group(effective_key, 'navtable'):
                 self._cleanup_navtable(effective_key)
         else:
             effective_key = f"__auto_key_{self.element_counter}"
             self.element_counter += 1
 
-        # Initialize dictionaries for navigable table if they don't exist
-        if not hasattr(self, '_navtable_groups'):
-            self._navtable_groups = {}
-        if not hasattr(self, '_navtable_element_positions'):
-            self._navtable_element_positions = {}
-
         # Calculate pagination parameters
         rows_per_page = nr_rows
         total_pages = (len(data) + rows_per_page - 1) // rows_per_page if data else 1
@@ -120,9 +103,9 @@ class NgNavElements:
             # Create background frame for alternating colors if needed
             row_frame = None
             if alternate_rowcolor and i % 2 == 1:  # Apply color to even-indexed rows (0-indexed)
-                row_frame = tk.Frame(self.root, background=alternate_rowcolor,
+                row_frame = self._tk.Frame(self.root, background=alternate_rowcolor,
                                      width=total_width, height=row_height)
-                row_frame.place(x=start_x, y=row_y)
+                self._place_element(row_frame, x=start_x, y=row_y)
                 navtable_elements.append(row_frame)
                 element_positions.append((start_x, row_y))
                 row_frames.append(row_frame)
@@ -166,13 +149,12 @@ class NgNavElements:
                 # Calculate vertical center of the row for text alignment
                 text_y = row_y + (row_height - 16) // 2  # 16 is approximate height of text
 
-                text_element = tk.Label(self.root, text=text_content, width=table_conf[col_key][1], anchor='w')
+                text_element = self._tk.Label(self.root, text=text_content, width=table_conf[col_key][1], anchor='w')
                 # If alternate row color is set, apply background to label
                 if alternate_rowcolor and i % 2 == 1:
                     text_element.config(background=alternate_rowcolor)
 
-                text_element.place(x=current_x_text, y=text_y)
-                text_element.update_idletasks()
+                self._place_element(text_element, x=current_x_text, y=text_y)
 
                 navtable_elements.append(text_element)
                 element_positions.append((current_x_text, text_y))
@@ -184,9 +166,9 @@ class NgNavElements:
             if not has_initial_data:
                 for element in row_elements_list:
                     if hasattr(element, 'place_forget'):
-                        element.place_forget()
+                        self._unplace_element(element)
                 if row_frames[i]:
-                    row_frames[i].place_forget()
+                    self._unplace_element(row_frames[i])
 
             row_elements.append(row_elements_list)
             max_width = max(max_width, current_x_text - start_x)
@@ -199,26 +181,25 @@ class NgNavElements:
             """Create navigation callback with proper closure"""
             return lambda: self._navtable_navigate(key, direction)
 
-        btn_back = tk.Button(self.root, text="  <<  ",
+        btn_back = self._tk.Button(self.root, text="  <<  ",
                              command=create_nav_callback(effective_key, -1))
-        btn_back.place(x=start_x, y=nav_y)
-        btn_back.update_idletasks()
+        self._place_element(btn_back, x=start_x, y=nav_y)
+        btn_back_width, btn_back_height = self._widget_size(btn_back, "  <<  ", None)
         navtable_elements.append(btn_back)
         element_positions.append((start_x, nav_y))
 
-        btn_forward_x = start_x + btn_back.winfo_reqwidth() + 5
-        btn_forward = tk.Button(self.root, text="  >>  ",
+        btn_forward_x = start_x + btn_back_width + 5
+        btn_forward = self._tk.Button(self.root, text="  >>  ",
                                 command=create_nav_callback(effective_key, 1))
-        btn_forward.place(x=btn_forward_x, y=nav_y)
-        btn_forward.update_idletasks()
+        self._place_element(btn_forward, x=btn_forward_x, y=nav_y)
+        btn_forward_width, _ = self._widget_size(btn_forward, "  >>  ", None)
         navtable_elements.append(btn_forward)
         element_positions.append((btn_forward_x, nav_y))
 
         # Updated page label to include total rows
-        lbl_page_x = btn_forward_x + btn_forward.winfo_reqwidth() + 10
-        lbl_page = tk.Label(self.root, text=f"Page 1/{total_pages} - total rows {len(data)}", width=25, anchor='w')
-        lbl_page.place(x=lbl_page_x, y=nav_y)
-        lbl_page.update_idletasks()
+        lbl_page_x = btn_forward_x + btn_forward_width + 10
+        lbl_page = self._tk.Label(self.root, text=f"Page 1/{total_pages} - total rows {len(data)}", width=25, anchor='w')
+        self._place_element(lbl_page, x=lbl_page_x, y=nav_y)
         navtable_elements.append(lbl_page)
         element_positions.append((lbl_page_x, nav_y))
 
@@ -226,7 +207,7 @@ class NgNavElements:
         total_height = (title_height + 2 if title_height > 0 else 0) + \
                        nr_rows * row_spacing - vgap + \
                        vnavgap + \
-                       btn_back.winfo_reqheight() + 5
+                       btn_back_height + 5
 
         # Save all necessary information for table management
         navtable_data = {
@@ -246,6 +227,7 @@ class NgNavElements:
             'vgap': vgap,
             'vnavgap': vnavgap,
             'alternate_rowcolor': alternate_rowcolor,
+            'budget_ms': budget_ms,
             'row_frames': row_frames,
             'start_positions': {
                 'start_x': start_x,
@@ -254,10 +236,9 @@ class NgNavElements:
             }
         }
 
-        self._navtable_groups[effective_key] = navtable_data
-
         self._register_element_position(effective_key, start_x, start_y, max_width, total_height)
-        self._navtable_element_positions[effective_key] = list(zip(navtable_elements, element_positions))
+        self._register_group_kind('navtable', self._navtable_value, self._cleanup_navtable)
+        self._register_group(NavtableGroup(effective_key, navtable_data), navtable_elements, element_positions)
 
         if s:
             self.element_strings[effective_key] = s
@@ -274,27 +255,31 @@ class NgNavElements:
 
     def _cleanup_navtable(self, table_key):
         """Clean up existing navtable completely"""
-        if table_key not in self._navtable_groups:
+        group = self._group(table_key, 'navtable')
+        if group is None:
             return
 
-        navtable_data = self._navtable_groups[table_key]
+        navtable_data = group.state
+
+        # Stop a page refill still running
+        self.unschedule(('navtable_page', table_key))
 
         # Delete navigation buttons and page label
         try:
             if 'btn_back' in navtable_data and navtable_data['btn_back']:
-                navtable_data['btn_back'].destroy()
+                self._safe_destroy_element(navtable_data['btn_back'])
         except:
             pass
 
         try:
             if 'btn_forward' in navtable_data and navtable_data['btn_forward']:
-                navtable_data['btn_forward'].destroy()
+                self._safe_destroy_element(navtable_data['btn_forward'])
         except:
             pass
 
         try:
             if 'lbl_page' in navtable_data and navtable_data['lbl_page']:
-                navtable_data['lbl_page'].destroy()
+                self._safe_destroy_element(navtable_data['lbl_page'])
         except:
             pass
 
@@ -303,7 +288,7 @@ class NgNavElements:
             for frame in navtable_data['row_frames']:
                 try:
                     if frame:
-                        frame.destroy()
+                        self._safe_destroy_element(frame)
                 except:
                     pass
 
@@ -312,22 +297,17 @@ class NgNavElements:
             for row_list in navtable_data['row_elements']:
                 for element in row_list:
                     try:
-                        element.destroy()
+                        self._safe_destroy_element(element)
                     except:
                         pass
 
-        # Clean up from element positions
-        if hasattr(self, '_navtable_element_positions') and table_key in self._navtable_element_positions:
-            elements_positions = self._navtable_element_positions[table_key]
-            for element, pos in elements_positions:
-                try:
-                    element.destroy()
-                except:
-                    pass
-            del self._navtable_element_positions[table_key]
+        # Destroy the remaining group widgets (title, first page, navigation)
+        for element, pos in group.members:
+            self._safe_destroy_element(element)
+            self.elements.discard(element)
 
-        # Remove from navtable groups
-        del self._navtable_groups[table_key]
+        # Remove from groups
+        del self._groups[table_key]
 
         # Clean up from main tracking structures
         if table_key in self.element_keys:
@@ -339,33 +319,13 @@ class NgNavElements:
 
     def _create_image_element(self, image_path, width, height, x, y, key, s):
         """Helper method to create image element for navtable"""
-        photo_image = None
-
-        if image_path and os.path.exists(image_path):
-            try:
-                pil_image = Image.open(image_path)
-                pil_image = pil_image.resize((width, height), Image.Resampling.LANCZOS)
-                photo_image = ImageTk.PhotoImage(pil_image)
-            except Exception as e:
-                print(f"Image loading error {image_path}: {e}")
-                photo_image = None
-
-        if photo_image is None:
-            try:
-                placeholder_image = Image.new('RGB', (width, height), color='lightgray')
-
-                if ImageDraw:
-                    draw = ImageDraw.Draw(placeholder_image)
-                    draw.line([(0, 0), (width - 1, height - 1)], fill='gray', width=2)
-                    draw.line([(0, height - 1), (width - 1, 0)], fill='gray', width=2)
-                    draw.rectangle([(0, 0), (width - 1, height - 1)], outline='gray', width=1)
-
-                photo_image = ImageTk.PhotoImage(placeholder_image)
-            except ImportError:
-                # Create a text label as fallback when PIL is not available
-                image_label = tk.Label(self.root, text="IMG", width=6, height=3, bg='lightgray')
-                image_label.place(x=x, y=y)
-                return image_label
+        try:
+            photo_image = self._load_photo_image(image_path, width, height)
+        except ImportError:
+            # Create a text label as fallback when PIL is not available
+            image_label = self._tk.Label(self.root, text="IMG", width=6, height=3, bg='lightgray')
+            self._place_element(image_label, x=x, y=y)
+            return image_label
 
         def image_callback(event):
             parts = key.split('_')
@@ -373,32 +333,32 @@ class NgNavElements:
                 clicked_row = int(parts[-1])
                 base_key = '_'.join(parts[:-3])
 
-                if base_key in self._navtable_groups:
-                    navtable_data = self._navtable_groups[base_key]
+                group = self._group(base_key, 'navtable')
+                if group is not None:
+                    navtable_data = group.state
                     current_page = navtable_data['current_page']
                     rows_per_page = navtable_data['nr_rows']
                     actual_row = current_page * rows_per_page + clicked_row
 
-                    values = self._get_values()
-                    values['_clicked_row'] = actual_row
-                    values['_clicked_data'] = navtable_data['data'][actual_row] if actual_row < len(
+                    clicked_data = navtable_data['data'][actual_row] if actual_row < len(
                         navtable_data['data']) else None
-                    self.event_queue.put((key, values))
+                    self._post_widget_event(key, {'_clicked_row': actual_row, '_clicked_data': clicked_data})
 
-        image_label = tk.Label(self.root, image=photo_image)
+        image_label = self._tk.Label(self.root, image=photo_image)
         image_label.image = photo_image
         image_label.bind("<Button-1>", image_callback)
         image_label.config(cursor="hand2")
-        image_label.place(x=x, y=y)
+        self._place_element(image_label, x=x, y=y)
 
         return image_label
 
     def _navtable_navigate(self, table_key, direction):
         """Handle table navigation (direction: -1 = back, 1 = forward)"""
-        if not hasattr(self, '_navtable_groups') or table_key not in self._navtable_groups:
+        group = self._group(table_key, 'navtable')
+        if group is None:
             return
 
-        navtable_data = self._navtable_groups[table_key]
+        navtable_data = group.state
         current_page = navtable_data['current_page']
         total_pages = navtable_data['total_pages']
 
@@ -412,10 +372,22 @@ class NgNavElements:
 
     def _navtable_update_page(self, table_key):
         """Update current page content of the table"""
-        if not hasattr(self, '_navtable_groups') or table_key not in self._navtable_groups:
+        group = self._group(table_key, 'navtable')
+        if group is None:
             return
 
-        navtable_data = self._navtable_groups[table_key]
+        page_filler = self._fill_navtable_page(group.state)
+        budget_ms = group.state.get('budget_ms', 0)
+        if budget_ms > 0:
+            self._schedule_job(page_filler, budget_ms=budget_ms, job_id=('navtable_page', table_key))
+            return
+
+        self.unschedule(('navtable_page', table_key))
+        for _ in page_filler:
+            pass
+
+    def _fill_navtable_page(self, navtable_data):
+        """Generator showing the rows of the current page one per step"""
         current_page = navtable_data['current_page']
         data = navtable_data['data']
         conf = navtable_data['conf']
@@ -440,14 +412,14 @@ class NgNavElements:
                         if (element != navtable_data.get('btn_back') and
                             element != navtable_data.get('btn_forward') and
                             element != navtable_data.get('lbl_page')):
-                            element.place_forget()
+                            self._unplace_element(element)
                     except:
                         pass
 
             # Hide row frames if they exist
             if i < len(row_frames) and row_frames[i]:
                 try:
-                    row_frames[i].place_forget()
+                    self._unplace_element(row_frames[i])
                 except:
                     pass
 
@@ -471,7 +443,7 @@ class NgNavElements:
 
                 # Show row frame if it exists and alternating color is enabled
                 if alternate_rowcolor and i % 2 == 1 and i < len(row_frames) and row_frames[i]:
-                    row_frames[i].place(x=start_x, y=row_y)
+                    self._place_element(row_frames[i], x=start_x, y=row_y)
                     row_frames[i].lift()  # Lift to ensure it's above any previous elements
                     # Then lower it below the content that will be placed
                     row_frames[i].lower()
@@ -484,7 +456,7 @@ class NgNavElements:
                         img_width = navtable_data.get('img_width', 50)
                         img_height = navtable_data.get('img_height', 50)
                         img_y = row_y + (row_height - img_height) // 2
-                        image_element.place(x=start_x, y=img_y)
+                        self._place_element(image_element, x=start_x, y=img_y)
 
                         # Update image - ALWAYS last column
                         if data[data_row_index]:
@@ -493,33 +465,11 @@ class NgNavElements:
                                                           image_filename) if folder_images else image_filename
 
                             try:
-                                if os.path.exists(new_image_path):
-                                    pil_image = Image.open(new_image_path)
-                                    img_width = navtable_data.get('img_width', 50)
-                                    img_height = navtable_data.get('img_height', 50)
-                                    pil_image = pil_image.resize((img_width, img_height), Image.Resampling.LANCZOS)
-                                    new_photo = ImageTk.PhotoImage(pil_image)
-
-                                    image_element.config(image=new_photo)
-                                    image_element.image = new_photo
-                                else:
-                                    # Create placeholder
-                                    img_width = navtable_data.get('img_width', 50)
-                                    img_height = navtable_data.get('img_height', 50)
-                                    placeholder_image = Image.new('RGB', (img_width, img_height), color='lightgray')
-                                    try:
-                                        if ImageDraw:
-                                            draw = ImageDraw.Draw(placeholder_image)
-                                            draw.line([(0, 0), (img_width - 1, img_height - 1)], fill='gray', width=2)
-                                            draw.line([(0, img_height - 1), (img_width - 1, 0)], fill='gray', width=2)
-                                            draw.rectangle([(0, 0), (img_width - 1, img_height - 1)], outline='gray',
-                                                           width=1)
-                                    except ImportError:
-                                        pass
-
-                                    placeholder_photo = ImageTk.PhotoImage(placeholder_image)
-                                    image_element.config(image=placeholder_photo)
-                                    image_element.image = placeholder_photo
+                                img_width = navtable_data.get('img_width', 50)
+                                img_height = navtable_data.get('img_height', 50)
+                                new_photo = self._load_photo_image(new_image_path, img_width, img_height)
+                                image_element.config(image=new_photo)
+                                image_element.image = new_photo
                             except Exception as e:
                                 print(f"Image loading error {new_image_path}: {e}")
                     except:
@@ -543,7 +493,7 @@ class NgNavElements:
                                 text_element.config(background=self.root.cget('bg'))
 
                             # Reposition text element
-                            text_element.place(x=current_x_text, y=text_y)
+                            self._place_element(text_element, x=current_x_text, y=text_y)
 
                             # Update text content
                             if j < len(keylist) and j < len(
@@ -558,6 +508,8 @@ class NgNavElements:
                         except:
                             pass
 
+                yield
+
         # Update page label with total rows included
         try:
             total_rows = len(data)
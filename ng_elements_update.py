@@ -1,18 +1,89 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
+import threading
+import tkinter as tk
+
+
 class NgElementsUpdate:
     """Update functionality for all element types"""
 
+    def _init_updates(self):
+        """Initialize the cross-thread update pipeline"""
+        self.update_interval_ms = 20
+        self._pending_updates = {}
+        self._pending_updates_lock = threading.Lock()
+        self._update_tick_id = None
+        self._tk_thread = threading.current_thread()
+
+    def post_update(self, k='', **kwargs):
+        """Thread-safe update(): changes are merged per key and applied by the Tk thread every update_interval_ms"""
+        with self._pending_updates_lock:
+            was_idle = not self._pending_updates
+            pending = self._pending_updates.get(k)
+            if pending is None:
+                self._pending_updates[k] = dict(kwargs)
+            else:
+                pending.update(kwargs)
+
+        # Other threads may only call Tk while mainloop() runs; otherwise read() arms the tick
+        if was_idle and (threading.current_thread() is self._tk_thread or self._in_mainloop):
+            self._schedule_update_tick()
+        return self
+
+    def _apply_pending_updates(self):
+        """Apply all posted updates (Tk thread only)"""
+        with self._pending_updates_lock:
+            pending = self._pending_updates
+            self._pending_updates = {}
+
+        for k, kwargs in pending.items():
+            try:
+                self.update(k, **kwargs)
+            except Exception as e:
+                print(f"Error applying posted update for {k}: {e}")
+
+    def _check_posted_updates(self):
+        """Arm the tick for updates posted by other threads (Tk thread only)"""
+        if self._pending_updates:
+            self._schedule_update_tick()
+
+    def _schedule_update_tick(self):
+        """Schedule the next batch of posted updates, unless one is already scheduled"""
+        if self._update_tick_id is not None:
+            return
+        try:
+            self._update_tick_id = self.root.after(self.update_interval_ms, self._update_tick)
+        except tk.TclError:
+            self._update_tick_id = None
+
+    def _update_tick(self):
+        """Apply posted updates, re-armed only while more keep arriving"""
+        self._update_tick_id = None
+        if self.window_closed:
+            return
+        self._apply_pending_updates()
+        self._check_posted_updates()
+
     def update(self, k='', **kwargs):
         """Update existing elements based on their type"""
-        if not self.exists(k):
-            return self
-
         # Handle table updates
-        if hasattr(self, '_table_groups') and k in self._table_groups:
+        if self._group(k, 'table'):
             return self._update_table(k, **kwargs)
 
+        # Handle listbox updates: update(k, options=[...], default=..., budget_ms=...)
+        if self._group(k, 'listbox'):
+            return self._update_listbox(k, **kwargs)
+
+        # Handle scroll area updates: update(k, rows=[...])
+        if self._group(k, 'scroll_rows'):
+            if 'rows' in kwargs:
+                self._write_value(k, kwargs['rows'])
+            return self
+
+        if not self.exists(k):
+            return self
+
         # Handle text updates
         if k in self.element_keys:
             element = self.element_keys[k]
@@ -30,13 +101,38 @@ class NgElementsUpdate:
 
         return self
 
-    def _update_table(self, k, data=None, rowcolors=None, **kwargs):
+    def _update_listbox(self, k, options=None, default=None, budget_ms=0, **kwargs):
+        """Replace the options of a listbox, then select default"""
+        group = self._group(k, 'listbox')
+        if group is None or options is None:
+            return self
+
+        # Stop a fill still running from a previous update
+        self.unschedule(('listbox_options', k))
+
+        group.options = self._parse_options(options)
+        group.widget.delete(0, 'end')
+
+        option_inserter = self._insert_listbox_options(group.widget, group.options, default, group.multi_select)
+        if budget_ms > 0:
+            self._schedule_job(option_inserter, budget_ms=budget_ms, job_id=('listbox_options', k))
+            return self
+
+        for _ in option_inserter:
+            pass
+        return self
+
+    def _update_table(self, k, data=None, rowcolors=None, budget_ms=0, **kwargs):
         """Update table with new data and row colors"""
-        if not hasattr(self, '_table_groups') or k not in self._table_groups:
+        group = self._group(k, 'table')
+        if group is None:
             return self
 
         try:
-            table_widget, column_keys = self._table_groups[k]
+            table_widget, column_keys = group.widget, group.column_keys
+
+            # Stop a fill still running from a previous update
+            self.unschedule(('table_rows', k))
 
             # Clear existing items
             for item in table_widget.get_children():
@@ -67,50 +163,21 @@ class NgElementsUpdate:
             except Exception as e:
                 print(f"Warning: error resetting tags: {e}")
 
-            # Set up color mapping
-            row_color_map = {}
-            if rowcolors:
-                for row_color_info in rowcolors:
-                    if len(row_color_info) == 2:
-                        row_index, bg_color = row_color_info
-                        row_color_map[row_index] = (bg_color, None)
-                    elif len(row_color_info) >= 3:
-                        row_index, bg_color, fg_color = row_color_info[:3]
-                        row_color_map[row_index] = (bg_color, fg_color)
-
-            # Configure color tags
-            for row_index, color_info in row_color_map.items():
-                bg_color, fg_color = color_info
-                if fg_color is None:
-                    tag_name = f"bg_{bg_color}"
-                    table_widget.tag_configure(tag_name, background=bg_color)
-                else:
-                    tag_name = f"bg_{bg_color}_fg_{fg_color}"
-                    table_widget.tag_configure(tag_name, background=bg_color, foreground=fg_color)
+            # Set up color mapping and tags
+            row_color_map = self._parse_rowcolors(rowcolors)
+            self._configure_table_tags(table_widget, row_color_map)
 
             # Insert new data
-            for row_index, row_data in enumerate(data):
-                # Ensure data fits column count
-                if len(row_data) >= len(column_keys):
-                    values_to_insert = row_data[:len(column_keys)]
-                else:
-                    padded_row = list(row_data) + [''] * (len(column_keys) - len(row_data))
-                    values_to_insert = padded_row
-
-                # Determine tags for this row
-                tags = ()
-                if row_index in row_color_map:
-                    bg_color, fg_color = row_color_map[row_index]
-                    if fg_color is None:
-                        tag_name = f"bg_{bg_color}"
-                    else:
-                        tag_name = f"bg_{bg_color}_fg_{fg_color}"
-                    tags = (tag_name,)
-
-                # Insert the row
-                item_id = table_widget.insert('', 'end', values=values_to_insert, tags=tags)
-
-            # Force UI update
+            row_inserter = self._insert_table_rows(table_widget, column_keys, data, row_color_map)
+            if budget_ms > 0:
+                self._schedule_job(row_inserter, budget_ms=budget_ms, job_id=('table_rows', k))
+                return self
+
+            for _ in row_inserter:
+                pass
+
+            # Force UI update, with the elements of a deferred layout placed first
+            self._flush_deferred_layout()
             table_widget.update()
             print("Tabella aggiornata con successo")
 
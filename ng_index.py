@@ -0,0 +1,157 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import bisect
+import itertools
+
+
+class NgIndexedDict(dict):
+    """Dict that keeps secondary indexes in sync through _index()/_unindex() hooks
+
+    Keys also remember their insertion order, so query results can be
+    returned in the same order a plain dict scan would produce"""
+
+    def __init__(self):
+        super().__init__()
+        self._order = {}
+        self._sequence = itertools.count()
+
+    def _index(self, key, value):
+        pass
+
+    def _unindex(self, key, value):
+        pass
+
+    def _in_insertion_order(self, keys):
+        """Sort keys found through an index by insertion order"""
+        keys = list(keys)
+        keys.sort(key=self._order.__getitem__)
+        return keys
+
+    def __setitem__(self, key, value):
+        if dict.__contains__(self, key):
+            self._unindex(key, dict.__getitem__(self, key))
+        else:
+            self._order[key] = next(self._sequence)
+        dict.__setitem__(self, key, value)
+        self._index(key, value)
+
+    def __delitem__(self, key):
+        value = dict.__getitem__(self, key)
+        dict.__delitem__(self, key)
+        del self._order[key]
+        self._unindex(key, value)
+
+    def pop(self, key, *default):
+        if dict.__contains__(self, key):
+            value = dict.__getitem__(self, key)
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self):
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
+
+
+class NgKeyIndex(NgIndexedDict):
+    """Widgets by key, with user keys kept sorted for prefix (kstart) queries
+
+    Auto-generated keys are never returned by prefix queries, so they are
+    left out of the sorted list"""
+
+    AUTO_PREFIX = '__auto_key_'
+
+    def __init__(self):
+        super().__init__()
+        self._sorted_keys = []
+
+    def _index(self, key, element):
+        if not key.startswith(self.AUTO_PREFIX):
+            bisect.insort(self._sorted_keys, key)
+
+    def _unindex(self, key, element):
+        if not key.startswith(self.AUTO_PREFIX):
+            del self._sorted_keys[bisect.bisect_left(self._sorted_keys, key)]
+
+    def keys_starting_with(self, prefix):
+        """Return user keys starting with prefix"""
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        end = start
+        while end < len(self._sorted_keys) and self._sorted_keys[end].startswith(prefix):
+            end += 1
+        return self._in_insertion_order(self._sorted_keys[start:end])
+
+
+class NgSelectionIndex(NgIndexedDict):
+    """Selection strings by key, indexed for exact and substring (shas) queries
+
+    Keys sharing the same selection string are grouped, and every distinct
+    string is indexed by its n-grams up to NGRAM characters. A query touches
+    only the strings sharing its n-grams, so its cost follows the number of
+    matches rather than the number of elements"""
+
+    NGRAM = 3
+
+    def __init__(self):
+        super().__init__()
+        self._keys_by_string = {}
+        self._strings_by_gram = {}
+
+    def _grams(self, s):
+        """Return every substring of s up to NGRAM characters long"""
+        return {s[i:i + n] for n in range(1, self.NGRAM + 1) for i in range(len(s) - n + 1)}
+
+    def _index(self, key, s):
+        keys = self._keys_by_string.get(s)
+        if keys is None:
+            keys = self._keys_by_string[s] = {}
+            for gram in self._grams(s):
+                self._strings_by_gram.setdefault(gram, set()).add(s)
+        keys[key] = None
+
+    def _unindex(self, key, s):
+        keys = self._keys_by_string[s]
+        del keys[key]
+        if not keys:
+            del self._keys_by_string[s]
+            for gram in self._grams(s):
+                strings = self._strings_by_gram[gram]
+                strings.discard(s)
+                if not strings:
+                    del self._strings_by_gram[gram]
+
+    def keys_equal(self, s):
+        """Return keys whose selection string is exactly s"""
+        return self._in_insertion_order(self._keys_by_string.get(s, ()))
+
+    def keys_containing(self, shas):
+        """Return keys whose selection string contains shas"""
+        if len(shas) <= self.NGRAM:
+            strings = self._strings_by_gram.get(shas, ())
+        else:
+            postings = []
+            for i in range(len(shas) - self.NGRAM + 1):
+                strings = self._strings_by_gram.get(shas[i:i + self.NGRAM])
+                if not strings:
+                    return []
+                postings.append(strings)
+            postings.sort(key=len)
+            strings = [s for s in postings[0] if shas in s and all(s in other for other in postings[1:])]
+
+        return self._in_insertion_order(key for s in strings for key in self._keys_by_string[s])
@@ -1,120 +1,49 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
-class NgLayout:
-    """Layout and positioning management mixin"""
+from ng_layout_engine import NgLayoutCursor
 
-    def _init_layout(self):
-        """Initialize layout variables"""
-        self.initial_x = 0
-        self.row_height = 22
-        self.current_row_height = 0
-        self.current_row_start_y = 0
-        self.current_row_max_height = 0
-
-        self.text_width_chars = None
-        self.text_height_lines = None
-        self.input_width_chars = None
-        self.input_height_lines = None
-
-        self.current_x = 0
-        self.current_y = 0
-
-    def _start_new_row(self):
-        """Start new virtual row"""
-        self.current_row_start_y = self.current_y
-        self.current_row_height = self.row_height
-        self.current_row_max_height = 0
-
-    def _update_row_height(self, element_height):
-        """Update maximum height of current row"""
-        if element_height > self.current_row_max_height:
-            self.current_row_max_height = element_height
-
-        if element_height > self.current_row_height:
-            self.current_row_height = element_height
-
-    def _update_position(self, width, height=20):
-        """Update position after adding element"""
-        self._update_row_height(height)
 
-        # Store last element height to use for proper alignment of next element
-        self.last_element_height = height
+class NgLayout(NgLayoutCursor):
+    """Layout and positioning management mixin
 
-        self.current_x += width + 5
-
-    def set_x(self, x):
-        """Set current X coordinate"""
-        self.current_x = x
-        return self
-
-    def set_y(self, y):
-        """Set current Y coordinate"""
-        self.current_y = y
-        self._start_new_row()
-        return self
-
-    def set_text_size(self, width_chars, height_lines=1):
-        """Set dimensions for next text elements"""
-        self.text_width_chars = width_chars
-        self.text_height_lines = height_lines
-        return self
-
-    def set_input_size(self, width_chars, height_lines=1):
-        """Set dimensions for next input elements"""
-        self.input_width_chars = width_chars
-        self.input_height_lines = height_lines
-        return self
+    Cursor and row state live in self.layout (NgLayoutEngine); the current_x,
+    current_y, ... attributes read and write it"""
 
-    def move_to(self, x, y):
-        """Move cursor to specified coordinates"""
-        self.current_x = x
-        self.current_y = y
-        self.initial_x = x
-
-        self._start_new_row()
-        return self
-
-    def br(self, spacing=0):
-        """Break to a new line, similar to HTML's <br> tag"""
-        if self.current_row_max_height > 0:
-            self.current_y = self.current_row_start_y + self.current_row_max_height + spacing + 3
-        else:
-            self.current_y = self.current_row_start_y + self.row_height + spacing
-
-        self.current_x = self.initial_x  # Reset X position to initial X value
-        self._start_new_row()
-        return self
-
-    def move_y(self, y):
-        """Go to Y coordinate and reset X"""
-        self.current_y = y
-        self.current_x = self.initial_x
-
-        self._start_new_row()
-        return self
-
-    def move_below(self, k):
-        """Position below element with key k"""
-        if k in self.element_positions:
-            x, y, width, height = self.element_positions[k]
-            self.current_x = x
-            self.current_y = y + height + 5
-            self.initial_x = x
-            self._start_new_row()
-        return self
-
-    def move_over(self, k):
-        """Position over (on top of) element with key k"""
-        if k in self.element_positions:
-            x, y, width, height = self.element_positions[k]
-            self.current_x = x
-            self.current_y = y
-            self.initial_x = x
-            self._start_new_row()
-        return self
-
-    def set_row_height(self, height):
-        """Set current row height"""
-        self.row_height = height
-        return self
\ No newline at end of file
+    def _init_layout(self):
+        """Initialize layout variables"""
+        self._init_cursor()
+
+        # See set_deferred_layout()
+        self.deferred_layout = False
+        self._layout_batch_open = False
+
+    def set_deferred_layout(self, enabled=True):
+        """Place new elements in one pass at the first read() or finalize_layout()
+
+        Builders then read requested sizes without flushing the Tk idle queue
+        for each element (Tk computes them when a widget is configured), and
+        their place() calls are collected and applied together with a single
+        idle flush. Elements added after that pass are placed immediately"""
+        self.deferred_layout = enabled
+        if enabled and not self._layout_batch_open:
+            self._batch_depth += 1
+            self._layout_batch_open = True
+        elif not enabled:
+            self._flush_deferred_layout()
+        return self
+
+    def _flush_deferred_layout(self):
+        """Apply the placements collected since set_deferred_layout()"""
+        if self._layout_batch_open:
+            self._layout_batch_open = False
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+
+    def _sync_geometry(self, widget):
+        """Make the requested size of widget current before it is read
+
+        Flushes the idle queue, unless layout is deferred"""
+        if not self.deferred_layout:
+            widget.update_idletasks()
@@ -0,0 +1,181 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+class NgLayoutEngine:
+    """Flow layout turning element sizes into (x, y, width, height) boxes, without Tk
+
+    The web backend only shares its row breaks: the browser places web elements"""
+
+    __slots__ = ('current_x', 'current_y', 'initial_x', 'row_height', 'current_row_height',
+                 'current_row_start_y', 'current_row_max_height', 'last_element_height', 'boxes')
+
+    def __init__(self, row_height=22, boxes=None):
+        self.current_x = 0
+        self.current_y = 0
+        self.initial_x = 0
+        self.row_height = row_height
+        self.current_row_height = 0
+        self.current_row_start_y = 0
+        self.current_row_max_height = 0
+        self.last_element_height = None     # None until the first element is placed
+        self.boxes = {} if boxes is None else boxes
+
+    def start_row(self):
+        """Start new virtual row at the cursor"""
+        self.current_row_start_y = self.current_y
+        self.current_row_height = self.row_height
+        self.current_row_max_height = 0
+
+    def update_row_height(self, element_height):
+        """Update maximum height of current row"""
+        if element_height > self.current_row_max_height:
+            self.current_row_max_height = element_height
+
+        if element_height > self.current_row_height:
+            self.current_row_height = element_height
+
+    def advance(self, width, height=20):
+        """Move the cursor past an element of the given size"""
+        self.update_row_height(height)
+        self.last_element_height = height
+        self.current_x += width + 5
+
+    def place(self, key, width, height):
+        """Put an element of the given size at the cursor, advance and return its box"""
+        box = (self.current_x, self.current_y, width, height)
+        if key:
+            self.boxes[key] = box
+        self.advance(width, height)
+        return box
+
+    def move_to(self, x, y):
+        self.current_x = x
+        self.current_y = y
+        self.initial_x = x
+        self.start_row()
+
+    def br(self, spacing=0):
+        if self.current_row_max_height > 0:
+            self.current_y = self.current_row_start_y + self.current_row_max_height + spacing + 3
+        else:
+            self.current_y = self.current_row_start_y + self.row_height + spacing
+
+        self.current_x = self.initial_x
+        self.start_row()
+
+    def set_y(self, y):
+        self.current_y = y
+        self.start_row()
+
+    def move_y(self, y):
+        self.current_y = y
+        self.current_x = self.initial_x
+        self.start_row()
+
+    def move_below(self, key):
+        """Move the cursor below the box of key, False if there is none"""
+        if key not in self.boxes:
+            return False
+        x, y, width, height = self.boxes[key]
+        self.move_to(x, y + height + 5)
+        return True
+
+    def move_over(self, key):
+        """Move the cursor to the top left corner of the box of key, False if there is none"""
+        if key not in self.boxes:
+            return False
+        x, y, width, height = self.boxes[key]
+        self.move_to(x, y)
+        return True
+
+
+def _layout_state(name):
+    """Window attribute stored in the layout engine"""
+    return property(lambda self: getattr(self.layout, name),
+                    lambda self, value: setattr(self.layout, name, value))
+
+
+class NgLayoutCursor:
+    """Cursor API (move_to, br, move_below, ...) of a window, backed by self.layout"""
+
+    current_x = _layout_state('current_x')
+    current_y = _layout_state('current_y')
+    initial_x = _layout_state('initial_x')
+    row_height = _layout_state('row_height')
+    current_row_height = _layout_state('current_row_height')
+    current_row_start_y = _layout_state('current_row_start_y')
+    current_row_max_height = _layout_state('current_row_max_height')
+    last_element_height = _layout_state('last_element_height')
+
+    def _init_cursor(self, boxes=None):
+        """Create the layout engine and the element size settings"""
+        self.layout = NgLayoutEngine(boxes=boxes)
+
+        self.text_width_chars = None
+        self.text_height_lines = None
+        self.input_width_chars = None
+        self.input_height_lines = None
+
+    def _start_new_row(self):
+        """Start new virtual row"""
+        self.layout.start_row()
+
+    def _update_row_height(self, element_height):
+        """Update maximum height of current row"""
+        self.layout.update_row_height(element_height)
+
+    def _update_position(self, width, height=20):
+        """Update position after adding element"""
+        self.layout.advance(width, height)
+
+    def set_x(self, x):
+        """Set current X coordinate"""
+        self.layout.current_x = x
+        return self
+
+    def set_y(self, y):
+        """Set current Y coordinate"""
+        self.layout.set_y(y)
+        return self
+
+    def set_text_size(self, width_chars, height_lines=1):
+        """Set dimensions for next text elements"""
+        self.text_width_chars = width_chars
+        self.text_height_lines = height_lines
+        return self
+
+    def set_input_size(self, width_chars, height_lines=1):
+        """Set dimensions for next input elements"""
+        self.input_width_chars = width_chars
+        self.input_height_lines = height_lines
+        return self
+
+    def move_to(self, x, y):
+        """Move cursor to specified coordinates"""
+        self.layout.move_to(x, y)
+        return self
+
+    def br(self, spacing=0):
+        """Break to a new line, similar to HTML's <br> tag"""
+        self.layout.br(spacing)
+        return self
+
+    def move_y(self, y):
+        """Go to Y coordinate and reset X"""
+        self.layout.move_y(y)
+        return self
+
+    def move_below(self, k):
+        """Position below element with key k"""
+        self.layout.move_below(k)
+        return self
+
+    def move_over(self, k):
+        """Position over (on top of) element with key k"""
+        self.layout.move_over(k)
+        return self
+
+    def set_row_height(self, height):
+        """Set current row height"""
+        self.layout.row_height = height
+        return self
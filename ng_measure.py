@@ -0,0 +1,199 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import collections
+import hashlib
+import json
+import os
+
+# Bump when the meaning of cached sizes changes
+LAYOUT_CACHE_VERSION = 1
+
+
+def _as_tuple(value):
+    """Turn the lists JSON made of cache keys back into tuples"""
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+class NgTextMetrics:
+    """Text sizes from font metrics (Font.measure, linespace), memoized in an LRU
+
+    Sizes are keyed by (font spec, text, width_chars, height_lines), so repeated
+    captions cost a dictionary lookup instead of a Tk layout pass"""
+
+    def __init__(self, root, font_module, maxsize=4096):
+        self._root = root
+        self._font_module = font_module
+        self._fonts = {}
+        self._sizes = collections.OrderedDict()
+        self.maxsize = maxsize
+
+    def font(self, spec=None):
+        """Return the Font object for a font option, None meaning TkDefaultFont"""
+        font = self._fonts.get(spec)
+        if font is None:
+            if spec is None:
+                font = self._font_module.Font(root=self._root, name='TkDefaultFont', exists=True)
+            else:
+                font = self._font_module.Font(root=self._root, font=spec)
+            self._fonts[spec] = font
+        return font
+
+    def text_size(self, spec, text, width_chars=None, height_lines=None):
+        """Return the (width, height) of text laid out like a Tk Label, without padding"""
+        key = (spec, text, width_chars, height_lines)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            return size
+
+        font = self.font(spec)
+        lines = str(text).split('\n')
+        if width_chars:
+            width = width_chars * font.measure('0')
+        else:
+            width = max(font.measure(line) for line in lines)
+        height = (height_lines or len(lines)) * font.metrics('linespace')
+
+        size = self._sizes[key] = (width, height)
+        if len(self._sizes) > self.maxsize:
+            self._sizes.popitem(last=False)
+        return size
+
+    def clear(self):
+        """Forget cached sizes, e.g. after named fonts were reconfigured"""
+        self._sizes.clear()
+
+    def entries(self):
+        """Return the cached sizes as [key, size] pairs, oldest first"""
+        return [[key, size] for key, size in self._sizes.items()]
+
+    def add_entries(self, entries):
+        """Add [key, size] pairs returned by entries()"""
+        for key, size in entries:
+            self._sizes[_as_tuple(key)] = tuple(size)
+
+
+class NgMeasure:
+    """Element sizing from cached font metrics instead of Tk layout flushes"""
+
+    def _init_measure(self):
+        """Initialize the measurement service"""
+        self.text_metrics = NgTextMetrics(self.root, self._tkfont)
+        # font spec -> (dx, dy) padding a Label adds around its text
+        self._label_chrome = {}
+        # (widget class, *signature) -> requested (width, height)
+        self._widget_sizes = {}
+        # See set_layout_cache()
+        self.layout_cache_path = None
+        self._layout_cache_signature = None
+
+    @staticmethod
+    def _font_option(font):
+        """Convert a font parameter ('Arial 12 bold', ('Arial', 12, 'bold', ...)) to a Tk font option"""
+        if isinstance(font, str):
+            return font
+        if isinstance(font, tuple):
+            if len(font) == 2:
+                return font
+            if len(font) >= 3:
+                return (font[0], font[1], ' '.join(font[2:]))
+        return None
+
+    def _label_size(self, label, text, font=None, width_chars=None, height_lines=None):
+        """Return the requested (width, height) of a Label showing text with font
+
+        Only the first Label of each font is measured by Tk, to learn the
+        padding around its text; label may be None, a temporary Label is then
+        created for that measurement"""
+        text_width, text_height = self.text_metrics.text_size(font, text, width_chars, height_lines)
+
+        chrome = self._label_chrome.get(font)
+        if chrome is None:
+            probe = label
+            if probe is None:
+                probe = self._tk.Label(self.root, text=text, font=font) if font else self._tk.Label(self.root, text=text)
+                if width_chars:
+                    probe.config(width=width_chars)
+                if height_lines:
+                    probe.config(height=height_lines)
+            self._sync_geometry(probe)
+            chrome = (probe.winfo_reqwidth() - text_width, probe.winfo_reqheight() - text_height)
+            self._label_chrome[font] = chrome
+            if probe is not label:
+                probe.destroy()
+
+        return text_width + chrome[0], text_height + chrome[1]
+
+    def _widget_size(self, widget, *signature):
+        """Return the requested (width, height) of widget, measured once per signature
+
+        signature lists the options the size depends on (width in chars,
+        font, ...); widgets of the same class and signature share the size"""
+        key = (type(widget).__name__,) + signature
+        size = self._widget_sizes.get(key)
+        if size is None:
+            self._sync_geometry(widget)
+            size = self._widget_sizes[key] = (widget.winfo_reqwidth(), widget.winfo_reqheight())
+        return size
+
+    def set_layout_cache(self, path):
+        """Keep the measured sizes in the file path between runs
+
+        Later starts take sizes from the file instead of asking Tk, so element
+        boxes come straight from the layout engine. The file is saved by
+        finalize_layout() and close(), and ignored when Tk scaling, the
+        standard fonts, the theme or the Tk version have changed"""
+        self.layout_cache_path = path
+        self._layout_cache_signature = hashlib.sha256(
+            repr((LAYOUT_CACHE_VERSION, self._measure_environment())).encode('utf-8')).hexdigest()
+        self._load_layout_cache()
+        return self
+
+    def _measure_environment(self):
+        """Return what measured sizes depend on besides the widget options"""
+        call = self.root.tk.call
+        return [call('tk', 'scaling'), call('tk', 'windowingsystem'), call('info', 'patchlevel'),
+                self._ttk.Style(self.root).theme_use()] + \
+               [call('font', 'actual', name) for name in ('TkDefaultFont', 'TkTextFont', 'TkHeadingFont')]
+
+    def _load_layout_cache(self):
+        """Add the sizes saved in the layout cache file, if its signature matches"""
+        try:
+            with open(self.layout_cache_path, encoding='utf-8') as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Layout cache {self.layout_cache_path} ignored: {e}")
+            return
+
+        if not isinstance(cache, dict) or cache.get('signature') != self._layout_cache_signature:
+            return
+
+        for key, size in cache.get('widgets', ()):
+            self._widget_sizes[_as_tuple(key)] = tuple(size)
+        for font, chrome in cache.get('labels', ()):
+            self._label_chrome[_as_tuple(font)] = tuple(chrome)
+        self.text_metrics.add_entries(cache.get('texts', ()))
+
+    def _save_layout_cache(self):
+        """Write the measured sizes to the layout cache file, if one is set"""
+        if not self.layout_cache_path:
+            return
+
+        cache = {
+            'signature': self._layout_cache_signature,
+            'widgets': [[key, size] for key, size in self._widget_sizes.items()],
+            'labels': [[font, chrome] for font, chrome in self._label_chrome.items()],
+            'texts': self.text_metrics.entries(),
+        }
+        temp_path = f"{self.layout_cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temp_path, self.layout_cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Layout cache {self.layout_cache_path} not saved: {e}")
@@ -0,0 +1,126 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import inspect
+import json
+
+from ng_registry import NgOptions
+
+# Bump when the saved plan format changes
+PLAN_VERSION = 1
+
+
+def _encode(value):
+    """Make plan arguments JSON-safe, keeping tuples and pre-split options"""
+    if isinstance(value, NgOptions):
+        return {'__options__': [list(pair) for pair in value]}
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode(value):
+    """Inverse of _encode()"""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        if '__options__' in value:
+            return NgOptions(tuple(pair) for pair in value['__options__'])
+        if '__tuple__' in value:
+            return tuple(_decode(item) for item in value['__tuple__'])
+        return {key: _decode(item) for key, item in value.items()}
+    return value
+
+
+class NgBuildPlan:
+    """Layout compiled from a spec by compile_layout(): checked calls with their arguments already parsed"""
+
+    __slots__ = ('steps',)
+
+    def __init__(self, steps):
+        self.steps = steps      # list of (method name, args, kwargs)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def save(self, path):
+        """Write the plan to a JSON file, to be read back with NgBuildPlan.load()"""
+        plan = {'version': PLAN_VERSION,
+                'steps': [[name, _encode(list(args)), _encode(kwargs)] for name, args, kwargs in self.steps]}
+        with open(path, 'w', encoding='utf-8') as plan_file:
+            json.dump(plan, plan_file)
+
+    @classmethod
+    def load(cls, path):
+        """Read a plan saved by save()"""
+        with open(path, encoding='utf-8') as plan_file:
+            plan = json.load(plan_file)
+        if plan.get('version') != PLAN_VERSION:
+            raise ValueError(f"{path}: layout plan version {plan.get('version')}, expected {PLAN_VERSION}")
+        return cls([(name, tuple(_decode(args)), _decode(kwargs)) for name, args, kwargs in plan['steps']])
+
+
+class NgBuildPlans:
+    """Declarative layouts: compile a spec once, build it on any number of windows"""
+
+    # Methods a spec can call
+    _plan_methods = frozenset((
+        'text', 'input', 'button', 'rectangle', 'checkboxes', 'radio', 'listbox', 'combobox',
+        'multiline', 'table', 'image', 'panel', 'navtable', 'scroll_rows',
+        'br', 'move_to', 'move_y', 'move_below', 'move_over', 'set_x', 'set_y', 'set_row_height',
+        'set_text_size', 'set_input_size', 'set', 'reset_defaults', 'win_title', 'win_size'))
+
+    # Builders whose option list is split into (display, value) pairs at compile time
+    _plan_option_methods = frozenset(('checkboxes', 'radio', 'listbox', 'combobox'))
+
+    @classmethod
+    def compile_layout(cls, spec):
+        """Compile a spec of 'br', [name, *args, kwargs] or {'call': name, 'args': [...], **kwargs} steps into a plan"""
+        steps = []
+        for index, step in enumerate(spec):
+            name, args, kwargs = cls._plan_step(step)
+            if name not in cls._plan_methods:
+                raise ValueError(f"Layout step {index}: unknown element '{name}'")
+
+            try:
+                bound = inspect.signature(getattr(cls, name)).bind(None, *args, **kwargs)
+            except TypeError as e:
+                raise ValueError(f"Layout step {index} ({name}): {e}") from None
+
+            arguments = bound.arguments
+            if arguments.get('font') is not None:
+                arguments['font'] = cls._font_option(arguments['font'])
+            if name in cls._plan_option_methods:
+                options_name = 'options' if arguments.get('options') is not None else 'title_or_options'
+                arguments[options_name] = NgOptions.parse(arguments[options_name])
+
+            steps.append((name, bound.args[1:], bound.kwargs))
+        return NgBuildPlan(steps)
+
+    @staticmethod
+    def _plan_step(step):
+        """Return (name, args, kwargs) of a spec step"""
+        if isinstance(step, str):
+            return step, (), {}
+        if isinstance(step, dict):
+            kwargs = dict(step)
+            name = kwargs.pop('call', '')
+            return name, tuple(kwargs.pop('args', ())), kwargs
+        name, *args = step
+        if args and isinstance(args[-1], dict):
+            return name, tuple(args[:-1]), args[-1]
+        return name, tuple(args), {}
+
+    def build(self, plan):
+        """Add the elements of a plan, or of a spec, to the window; placed together in one batch"""
+        if not isinstance(plan, NgBuildPlan):
+            plan = self.compile_layout(plan)
+
+        with self.batch():
+            for name, args, kwargs in plan.steps:
+                getattr(self, name)(*args, **kwargs)
+        return self
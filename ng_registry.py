@@ -0,0 +1,218 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+class ElementRecord:
+    """Everything the window tracks about one widget"""
+
+    __slots__ = ('widget', 'key', 's', 'group', 'position', 'visible', 'generation')
+
+    def __init__(self, widget, generation=0):
+        self.widget = widget
+        self.key = None             # first key the widget was registered with
+        self.s = ''                 # selection string
+        self.group = None           # key of the group (checkbox, table, ...) the widget belongs to
+        self.position = None        # (x, y) of the widget inside its group
+        self.visible = True
+        self.generation = generation  # registration order, compared against checkpoints
+
+
+class GroupKind:
+    """How groups of one kind are read into values, written and deleted"""
+
+    __slots__ = ('kind', 'reader', 'cleanup', 'writer')
+
+    def __init__(self, kind, reader=None, cleanup=None, writer=None):
+        self.kind = kind
+        self.reader = reader        # reader(group) -> value, None if the kind has no value
+        self.cleanup = cleanup      # cleanup(key), None to delete it as a single element
+        self.writer = writer        # writer(group, value), the inverse of reader
+
+
+class GroupRecord:
+    """Element made of several widgets: members are (widget, (x, y)) pairs"""
+
+    __slots__ = ('key', 'members', 'generation')
+    kind = ''
+
+    def __init__(self, key):
+        self.key = key
+        self.members = []
+        self.generation = 0
+
+    def widgets(self):
+        """Return the member widgets"""
+        return [widget for widget, _ in self.members]
+
+
+class CheckboxGroup(GroupRecord):
+    """Checkbox group: vars is a list of (BooleanVar, value)"""
+
+    __slots__ = ('vars',)
+    kind = 'checkbox'
+
+    def __init__(self, key, checkbox_vars):
+        super().__init__(key)
+        self.vars = checkbox_vars
+
+
+class RadioGroup(GroupRecord):
+    """Radio group sharing one StringVar"""
+
+    __slots__ = ('var',)
+    kind = 'radio'
+
+    def __init__(self, key, radio_var):
+        super().__init__(key)
+        self.var = radio_var
+
+
+class ListboxGroup(GroupRecord):
+    """Listbox: options is a list of (label, value)"""
+
+    __slots__ = ('widget', 'options', 'multi_select')
+    kind = 'listbox'
+
+    def __init__(self, key, widget, options, multi_select=False):
+        super().__init__(key)
+        self.widget = widget
+        self.options = options
+        self.multi_select = multi_select
+
+
+class ComboboxGroup(GroupRecord):
+    """Combobox: options is a list of (label, value)"""
+
+    __slots__ = ('widget', 'options')
+    kind = 'combobox'
+
+    def __init__(self, key, widget, options):
+        super().__init__(key)
+        self.widget = widget
+        self.options = options
+
+
+class MultilineGroup(GroupRecord):
+    """Multiline Text widget with its scrollbar"""
+
+    __slots__ = ('widget',)
+    kind = 'multiline'
+
+    def __init__(self, key, widget):
+        super().__init__(key)
+        self.widget = widget
+
+
+class TableGroup(GroupRecord):
+    """Treeview table with its scrollbars"""
+
+    __slots__ = ('widget', 'column_keys')
+    kind = 'table'
+
+    def __init__(self, key, widget, column_keys):
+        super().__init__(key)
+        self.widget = widget
+        self.column_keys = column_keys
+
+
+class NavtableGroup(GroupRecord):
+    """Navigable table: state holds paging, data and row widgets"""
+
+    __slots__ = ('state',)
+    kind = 'navtable'
+
+    def __init__(self, key, state):
+        super().__init__(key)
+        self.state = state
+
+
+class PanelGroup(GroupRecord):
+    """Panel: state holds its frame, controls and contained elements"""
+
+    __slots__ = ('state',)
+    kind = 'panel'
+
+    def __init__(self, key, state):
+        super().__init__(key)
+        self.state = state
+
+
+class ScrollSlot:
+    """Widgets showing one row of a scroll area, keyed with prefix + field"""
+
+    __slots__ = ('prefix', 'widgets', 'group_keys')
+
+    def __init__(self, prefix, widgets, group_keys):
+        self.prefix = prefix
+        self.widgets = widgets
+        self.group_keys = group_keys
+
+
+class ScrollRowsGroup(GroupRecord):
+    """Scroll area: the row model and the slots showing rows[first:first + len(slots)]"""
+
+    __slots__ = ('rows', 'fields', 'defaults', 'slots', 'first', 'scrollbar')
+    kind = 'scroll_rows'
+
+    def __init__(self, key, rows, fields, defaults, slots, scrollbar):
+        super().__init__(key)
+        self.rows = rows
+        self.fields = fields
+        self.defaults = defaults    # field -> value of a freshly built row
+        self.slots = slots
+        self.first = 0
+        self.scrollbar = scrollbar
+
+
+class NgOptions(tuple):
+    """Options already split into (display, value) pairs, e.g. by a build plan"""
+
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, options):
+        """Split 'display|value' strings; other options are both display and value"""
+        parsed = []
+        for option in options:
+            if isinstance(option, str) and '|' in option:
+                display_text, value = option.split('|', 1)
+            else:
+                display_text = value = str(option)
+            parsed.append((display_text, value))
+        return cls(parsed)
+
+
+class NgElementList:
+    """Registered widgets in creation order, with O(1) append, membership and removal"""
+
+    __slots__ = ('_widgets',)
+
+    def __init__(self, widgets=()):
+        self._widgets = dict.fromkeys(widgets)
+
+    def append(self, widget):
+        self._widgets[widget] = None
+
+    def remove(self, widget):
+        try:
+            del self._widgets[widget]
+        except KeyError:
+            raise ValueError(f"{widget!r} not in elements") from None
+
+    def discard(self, widget):
+        self._widgets.pop(widget, None)
+
+    def __contains__(self, widget):
+        return widget in self._widgets
+
+    def __iter__(self):
+        return iter(self._widgets)
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def __reversed__(self):
+        return reversed(self._widgets)
+
+    def __getitem__(self, index):
+        return list(self._widgets)[index]
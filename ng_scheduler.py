@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import time
+import tkinter as tk
+import traceback
+
+
+class NgScheduler:
+    """Idle-time scheduler: spread heavy UI work across frames with cooperative generators"""
+
+    def _init_scheduler(self):
+        """Initialize scheduler variables"""
+        self.schedule_budget_ms = 8
+        self._scheduled_jobs = {}
+        self._schedule_slice_id = None
+        self._schedule_job_counter = 0
+
+    def schedule(self, generator_fn, *args, budget_ms=None, k='', **kwargs):
+        """Run generator_fn(*args, **kwargs) a slice at a time during idle time
+
+        The generator should yield often (e.g. after every row it creates).
+        Jobs take turns in idle slices of at most budget_ms (schedule_budget_ms
+        by default, the smallest budget of the running jobs), then Tk gets
+        control back and repaints. Builders and update() taking budget_ms
+        fill their widgets this way. When the generator ends,
+        (k, {'result': ..., 'error': ...}) is queued if k is given. Returns a
+        job id usable with unschedule()"""
+        return self._schedule_job(generator_fn(*args, **kwargs), budget_ms=budget_ms, k=k)
+
+    def unschedule(self, job_id):
+        """Stop a scheduled job before it finishes"""
+        job = self._scheduled_jobs.pop(job_id, None)
+        if job is not None:
+            job[0].close()
+        return self
+
+    def scheduled_jobs(self):
+        """Return the number of unfinished scheduled jobs"""
+        return len(self._scheduled_jobs)
+
+    def _schedule_job(self, generator, budget_ms=None, k='', job_id=None):
+        """Add a generator to the idle work list, replacing any job with the same id"""
+        if job_id is None:
+            job_id = f"__job_{self._schedule_job_counter}"
+            self._schedule_job_counter += 1
+        else:
+            self.unschedule(job_id)
+
+        budget = (budget_ms if budget_ms is not None else self.schedule_budget_ms) / 1000.0
+        self._scheduled_jobs[job_id] = (generator, budget, k)
+
+        if self._schedule_slice_id is None:
+            try:
+                self._schedule_slice_id = self.root.after_idle(self._run_schedule_slice)
+            except tk.TclError:
+                self._schedule_slice_id = None
+
+        return job_id
+
+    def _run_schedule_slice(self):
+        """Advance the scheduled jobs in turn until the slice budget is spent, then yield to Tk"""
+        self._schedule_slice_id = None
+        if self.window_closed:
+            return
+
+        # One deadline for the whole slice, from the smallest budget of the jobs
+        jobs = self._scheduled_jobs
+        deadline = time.perf_counter() + min(budget for _, budget, _ in jobs.values())
+
+        for job_id in list(jobs):
+            job = jobs.get(job_id)
+            if job is None:
+                continue
+            generator, budget, k = job
+
+            # Back of the line, so the next slice starts with the following job
+            del jobs[job_id]
+            jobs[job_id] = job
+
+            # At least one step, so a tiny budget still makes progress
+            try:
+                next(generator)
+                while time.perf_counter() < deadline:
+                    next(generator)
+            except StopIteration as stop:
+                jobs.pop(job_id, None)
+                if k:
+                    self.event_queue.put((k, {'result': stop.value, 'error': None}))
+            except Exception as e:
+                jobs.pop(job_id, None)
+                if k:
+                    self.event_queue.put((k, {'result': None, 'error': e}))
+                else:
+                    print(f"Error in scheduled job {job_id}: {e}")
+                    traceback.print_exc()
+
+            if time.perf_counter() >= deadline:
+                break
+
+        # A timer rather than another idle callback: update_idletasks() runs idle
+        # callbacks added while it works, so it would drain the jobs in one go
+        if self._scheduled_jobs:
+            try:
+                self._schedule_slice_id = self.root.after(1, self._run_schedule_slice)
+            except tk.TclError:
+                self._schedule_slice_id = None
@@ -0,0 +1,218 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import itertools
+import tkinter as tk
+
+from ng_plan import NgBuildPlan
+from ng_registry import ScrollRowsGroup, ScrollSlot
+
+
+class NgScrollRows:
+    """Scroll areas: many rows shown with the widgets of the visible ones only"""
+
+    def scroll_rows(self, row_spec, rows, k='', s='', height=300):
+        """Show rows (dicts keyed like row_spec) in a scrolling area that only builds widgets for the visible rows"""
+        s, _, _, k = self._merge_defaults(s, '', '', k)
+
+        if k:
+            effective_key = k
+        else:
+            effective_key = f"__auto_key_{self.element_counter}"
+            self.element_counter += 1
+
+        plan = row_spec if isinstance(row_spec, NgBuildPlan) else self.compile_layout(row_spec)
+        start_x = self.current_x
+        start_y = self.current_y
+        saved_layout = self._save_attrs(self._checkpoint_layout_attrs)
+        saved_prefix = self.default_k_prefix
+
+        with self.batch():
+            # The first row gives the row size, then as many rows as fit in height are built
+            first_slot, row_height = self._build_scroll_slot(plan, f"{effective_key}_0_", start_x, start_y)
+            slots = [first_slot]
+            for i in range(1, max(1, height // row_height)):
+                slot, _ = self._build_scroll_slot(plan, f"{effective_key}_{i}_", start_x, start_y + i * row_height)
+                slots.append(slot)
+
+            self.default_k_prefix = saved_prefix
+            for name, value in saved_layout.items():
+                setattr(self, name, value)
+
+            fields = self._scroll_slot_fields(first_slot)
+            defaults = self._scroll_slot_values(first_slot, fields)
+            row_width = self._scroll_slot_width(first_slot, start_x)
+            area_height = len(slots) * row_height
+
+            scrollbar = self._tk.Scrollbar(self.root, orient=tk.VERTICAL,
+                                           command=lambda *args: self._scroll_rows_command(effective_key, *args))
+            scrollbar_x = start_x + row_width + 5
+            self._place_element(scrollbar, x=scrollbar_x, y=start_y, height=area_height)
+
+            def wheel_handler(event):
+                # <MouseWheel> carries delta (Windows, macOS), X11 sends buttons 4 and 5
+                num, delta = getattr(event, 'num', None), getattr(event, 'delta', 0)
+                if num == 4 or delta > 0:
+                    self._scroll_rows_by(effective_key, -1)
+                elif num == 5 or delta < 0:
+                    self._scroll_rows_by(effective_key, 1)
+
+            for widget in itertools.chain([scrollbar], *(slot.widgets for slot in slots)):
+                for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                    widget.bind(sequence, wheel_handler, add='+')
+
+            group = ScrollRowsGroup(effective_key, [], fields, defaults, slots, scrollbar)
+            self._register_group_kind('scroll_rows', self._scroll_rows_value, self._cleanup_scroll_rows,
+                                      self._set_scroll_rows_value)
+            self._register_group(group, [scrollbar], [(scrollbar_x, start_y)])
+            self._register_element(scrollbar, '', s)
+            self._set_scroll_rows_value(group, rows)
+
+        total_width = row_width + 5 + 20
+        self._register_element_position(effective_key, start_x, start_y, total_width, area_height)
+        if s:
+            self.element_strings[effective_key] = s
+
+        self._update_row_height(area_height)
+        self.current_x = start_x + total_width + 10
+        self.current_y = start_y
+
+        return self
+
+    def scroll_row_index(self, event):
+        """Return the index of the row an event from a scroll area widget refers to, None for other events"""
+        if not event:
+            return None
+        for group in self._groups.values():
+            if group.kind == 'scroll_rows':
+                for i, slot in enumerate(group.slots):
+                    if event.startswith(slot.prefix):
+                        return group.first + i
+        return None
+
+    def _build_scroll_slot(self, plan, prefix, x, y):
+        """Build one row of plan at (x, y) with keys prefixed by prefix, return (slot, row height)"""
+        generation = self._generation
+        self.default_k_prefix = prefix
+        self.move_to(x, y)
+        self.build(plan)
+        self.layout.br()
+
+        widgets = list(itertools.takewhile(lambda element: self._element_generation(element) > generation,
+                                           reversed(self.elements)))
+        group_keys = list(itertools.takewhile(lambda key: self._groups[key].generation > generation,
+                                              reversed(self._groups)))
+        return ScrollSlot(prefix, widgets[::-1], group_keys[::-1]), self.current_y - y
+
+    def _scroll_slot_fields(self, slot):
+        """Return the fields of a row: the keys given in the row spec"""
+        records = (self._records[widget] for widget in slot.widgets)
+        keys = [record.group or record.key for record in records]
+        return [key[len(slot.prefix):] for key in dict.fromkeys(keys) if key.startswith(slot.prefix)]
+
+    def _scroll_slot_values(self, slot, fields):
+        """Return field -> value shown by the widgets of slot (text for labels and buttons)"""
+        values = {}
+        for field in fields:
+            key = slot.prefix + field
+            if self._has_value(key):
+                values[field] = self._read_value(key)
+            elif isinstance(self.element_keys.get(key), (self._tk.Label, self._tk.Button)):
+                values[field] = self.element_keys[key].cget('text')
+        return values
+
+    def _scroll_slot_width(self, slot, start_x):
+        """Return the width of a row, from the boxes of its elements"""
+        right = start_x
+        for widget in slot.widgets:
+            record = self._records[widget]
+            box = self.element_positions.get(record.group or record.key)
+            if box is not None:
+                right = max(right, box[0] + box[2])
+        return right - start_x
+
+    def _scroll_rows_command(self, key, action, amount, unit=''):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units' or 'pages')"""
+        group = self._group(key, 'scroll_rows')
+        if group is None:
+            return
+        if action == 'moveto':
+            self._show_scroll_rows(group, round(float(amount) * len(group.rows)))
+        elif unit == 'pages':
+            self._show_scroll_rows(group, group.first + int(amount) * len(group.slots))
+        else:
+            self._show_scroll_rows(group, group.first + int(amount))
+
+    def _scroll_rows_by(self, key, nr_rows):
+        group = self._group(key, 'scroll_rows')
+        if group is not None:
+            self._show_scroll_rows(group, group.first + nr_rows)
+
+    def _show_scroll_rows(self, group, first, reload=False):
+        """Show rows from index first, storing the values edited in the rows scrolled away"""
+        first = max(0, min(first, len(group.rows) - len(group.slots)))
+        if first == group.first and not reload:
+            return
+
+        with self.batch():
+            if not reload:
+                self._store_scroll_rows(group)
+            group.first = first
+
+            for i, slot in enumerate(group.slots):
+                row_index = first + i
+                is_visible = row_index < len(group.rows)
+                for widget in slot.widgets:
+                    if self._records[widget].visible != is_visible:
+                        self._set_visible_impl(widget, is_visible)
+                if is_visible:
+                    row = group.rows[row_index]
+                    for field in group.fields:
+                        if field in row:
+                            self._write_value(slot.prefix + field, row[field])
+
+        rows_count = len(group.rows)
+        if rows_count:
+            group.scrollbar.set(first / rows_count, min(1.0, (first + len(group.slots)) / rows_count))
+        else:
+            group.scrollbar.set(0.0, 1.0)
+
+    def _store_scroll_rows(self, group):
+        """Copy the values of the visible rows from their widgets to the row model"""
+        for i, slot in enumerate(group.slots):
+            row_index = group.first + i
+            if row_index >= len(group.rows):
+                break
+            row = group.rows[row_index]
+            for field in group.fields:
+                key = slot.prefix + field
+                if self._has_value(key):
+                    row[field] = self._read_value(key)
+
+    def _scroll_rows_value(self, group):
+        """Read a scroll area as the list of its rows"""
+        self._store_scroll_rows(group)
+        return [dict(row) for row in group.rows]
+
+    def _set_scroll_rows_value(self, group, rows):
+        """Replace the rows of a scroll area; missing fields take the values of a new row"""
+        group.rows = [{**group.defaults, **row} for row in rows]
+        self._show_scroll_rows(group, group.first, reload=True)
+
+    def _cleanup_scroll_rows(self, key):
+        """Delete a scroll area with the widgets of all its rows"""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        with self.batch():
+            for slot in group.slots:
+                for group_key in slot.group_keys:
+                    if group_key in self._groups:
+                        self._delete_key(group_key)
+                for widget in slot.widgets:
+                    if widget in self.elements:
+                        self._remove_element(widget)
+            if group.scrollbar in self.elements:
+                self._remove_element(group.scrollbar)
+        self.element_positions.pop(key, None)
+        self.element_strings.pop(key, None)
@@ -0,0 +1,119 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import sys
+import tkinter as tk
+
+
+class NgHistogram:
+    """Latency histogram with power-of-two buckets in microseconds"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = {}
+
+    def record(self, seconds):
+        """Add one sample"""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+        bucket = max(int(seconds * 1000000), 1).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        """Return the upper bound, in ms, of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+
+        wanted = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= wanted:
+                return min((1 << bucket) / 1000.0, self.max * 1000)
+        return self.max * 1000
+
+    def summary(self):
+        """Return count, average, percentiles and maximum in milliseconds"""
+        return {
+            'count': self.count,
+            'avg_ms': self.total * 1000 / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max * 1000
+        }
+
+
+class NgStats:
+    """Event latency instrumentation: queue wait, values collection and handler time"""
+
+    def _init_stats(self):
+        """Initialize statistics variables"""
+        self._stats = {
+            'queue_wait': NgHistogram(),
+            'values': NgHistogram(),
+            'handler': NgHistogram()
+        }
+        self._stats_dump_id = None
+
+    def _record_stat(self, name, seconds):
+        """Add a sample to the named histogram"""
+        histogram = self._stats.get(name)
+        if histogram is None:
+            histogram = self._stats[name] = NgHistogram()
+        histogram.record(seconds)
+
+    def stats(self):
+        """Return latency statistics
+
+        queue_wait: time from the widget callback to read() returning the event
+        values: time spent reading widgets for events: each snapshot, or each key read from lazy values
+        handler: time spent in handlers run by process_event()
+        handlers: the same per registered key or pattern"""
+        report = {name: histogram.summary() for name, histogram in self._stats.items()}
+        report['handlers'] = self.event_handler_stats()
+        return report
+
+    def reset_stats(self):
+        """Clear all recorded samples"""
+        for name in self._stats:
+            self._stats[name] = NgHistogram()
+        self.reset_event_handler_stats()
+        return self
+
+    def stats_dump(self, interval_ms=10000, file=None):
+        """Print stats() every interval_ms milliseconds, interval_ms=0 stops dumping"""
+        if self._stats_dump_id is not None:
+            try:
+                self.root.after_cancel(self._stats_dump_id)
+            except tk.TclError:
+                pass
+            self._stats_dump_id = None
+
+        if interval_ms > 0:
+            def dump():
+                self._print_stats(file)
+                self._stats_dump_id = self.root.after(interval_ms, dump)
+
+            self._stats_dump_id = self.root.after(interval_ms, dump)
+
+        return self
+
+    def _print_stats(self, file=None):
+        """Print a one-line summary per histogram and per handler"""
+        out = file if file is not None else sys.stdout
+        report = self.stats()
+        for name, summary in report.items():
+            if name == 'handlers':
+                continue
+            print(f"[stats] {name}: n={summary['count']} avg={summary['avg_ms']:.2f}ms "
+                  f"p95={summary['p95_ms']:.2f}ms p99={summary['p99_ms']:.2f}ms "
+                  f"max={summary['max_ms']:.2f}ms", file=out)
+        for pattern, summary in report['handlers'].items():
+            print(f"[stats] handler {pattern}: calls={summary['calls']} total={summary['total_ms']:.2f}ms "
+                  f"avg={summary['avg_ms']:.2f}ms max={summary['max_ms']:.2f}ms", file=out)
@@ -0,0 +1,80 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import concurrent.futures
+import threading
+
+
+class NgTasks:
+    """Background tasks: run slow work off the Tk thread and report results as events"""
+
+    def _init_tasks(self):
+        """Initialize task runner variables"""
+        self.max_tasks = 4
+        self._executors = {}
+        self._tasks = {}
+        self._tasks_lock = threading.Lock()
+
+    def run_task(self, fn, *args, k='RESULT', executor='thread', **kwargs):
+        """Run fn(*args, **kwargs) on a managed pool and report the outcome as an event
+
+        When the task finishes (k, {'result': ..., 'error': ...}) is put on the
+        event queue, error being None on success and the raised exception
+        otherwise. executor is 'thread' or 'process' (fn and its arguments must
+        then be picklable). At most max_tasks tasks of each executor kind run
+        at once, the others wait their turn. Returns the Future"""
+        if executor not in ('thread', 'process'):
+            raise ValueError("executor must be 'thread' or 'process'")
+
+        future = self._get_executor(executor).submit(fn, *args, **kwargs)
+
+        with self._tasks_lock:
+            self._tasks[future] = k
+
+        future.add_done_callback(self._task_done)
+        return future
+
+    def cancel_tasks(self, k=''):
+        """Cancel tasks not started yet, all of them or only those reporting to key k
+
+        Running tasks cannot be interrupted and still report when they finish.
+        Returns the number of cancelled tasks"""
+        with self._tasks_lock:
+            futures = [future for future, key in self._tasks.items() if not k or key == k]
+
+        return sum(1 for future in futures if future.cancel())
+
+    def running_tasks(self, k=''):
+        """Return the number of unfinished tasks, all of them or only those reporting to key k"""
+        with self._tasks_lock:
+            return sum(1 for key in self._tasks.values() if not k or key == k)
+
+    def _get_executor(self, executor):
+        """Return the pool for an executor kind, creating it on first use"""
+        if executor not in self._executors:
+            if executor == 'process':
+                self._executors[executor] = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_tasks)
+            else:
+                self._executors[executor] = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_tasks, thread_name_prefix='ng_task')
+        return self._executors[executor]
+
+    def _task_done(self, future):
+        """Post the task outcome on the event queue (runs in the finishing thread)"""
+        with self._tasks_lock:
+            k = self._tasks.pop(future, None)
+
+        # Cancelled tasks never ran, there is nothing to report
+        if k is None or future.cancelled():
+            return
+
+        error = future.exception()
+        result = None if error is not None else future.result()
+        self.event_queue.put((k, {'result': result, 'error': error}))
+
+    def _shutdown_tasks(self):
+        """Drop queued tasks and release the pools without waiting for running ones"""
+        self.cancel_tasks()
+        for pool in self._executors.values():
+            pool.shutdown(wait=False)
+        self._executors = {}
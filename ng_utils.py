@@ -1,9 +1,20 @@
 # Copyright (c) 2025 Dario Giacomelli
 # Licensed under the MIT License
 
+import contextlib
+import tkinter as tk
+
+
 class NgUtils:
     """Utility functions mixin"""
 
+    def _init_batch(self):
+        """Initialize batched widget mutations"""
+        self._batch_depth = 0
+        self._batch_places = {}      # widget -> place() options, None for place_forget()
+        self._batch_destroys = {}    # widgets to destroy, in order
+        self._batch_redraw = False
+
     def set_keys(self, max_nr_keys=100, key_start_with_string=''):
         """Generate a list of keys"""
         return [key_start_with_string + str(i) for i in range(max_nr_keys)]
@@ -23,168 +34,176 @@ class NgUtils:
         # Get all keys matching the criteria
         matching_keys = []
         if k:
-            # For tables, bypass the exists() check
-            if hasattr(self, '_table_groups') and k in self._table_groups:
+            # For groups (tables, checkboxes, ...), bypass the exists() check
+            if k in self._groups:
                 matching_keys.append(k)
             elif self.exists(k):
                 matching_keys.append(k)
-            # Debugging output
-            print(
-                f"Delete requested for key: {k}, Found in _table_groups: {hasattr(self, '_table_groups') and k in self._table_groups}")
         elif kstart:
-            matching_keys = [key for key in self.element_keys.keys()
-                             if not key.startswith('__auto_key_') and key.startswith(kstart)]
+            matching_keys = self.element_keys.keys_starting_with(kstart)
         elif shas:
-            matching_keys = [key for key, s_val in self.element_strings.items()
-                             if shas in s_val]
-
-        # Print matching keys for debugging
-        print(f"Matching keys for deletion: {matching_keys}")
-
-        # Process each key
-        for key in matching_keys:
-            # Special handling for table groups - most comprehensive approach
-            if hasattr(self, '_table_groups') and key in self._table_groups:
-                print(f"Cleaning up table with key: {key}")
-                self._cleanup_table(key)
-                continue  # Skip standard element deletion since we've handled it comprehensively
-
-            # Special handling for navtable groups
-            if hasattr(self, '_navtable_groups') and key in self._navtable_groups:
-                self._cleanup_navtable(key)
-                continue  # Skip standard element deletion
-
-            # Special handling for checkbox groups
-            if hasattr(self, '_checkbox_groups') and key in self._checkbox_groups:
-                self._cleanup_element_group(key, '_checkbox_groups', '_checkbox_element_positions')
-                continue
+            matching_keys = self.element_strings.keys_containing(shas)
 
-            # Special handling for radio groups
-            if hasattr(self, '_radio_groups') and key in self._radio_groups:
-                self._cleanup_element_group(key, '_radio_groups', '_radio_element_positions')
-                continue
+        # Process each key, destroying the widgets in one pass at the end
+        with self.batch():
+            for key in matching_keys:
+                self._delete_key(key)
 
-            # Special handling for listbox groups
-            if hasattr(self, '_listbox_groups') and key in self._listbox_groups:
-                self._cleanup_element_group(key, '_listbox_groups', '_listbox_element_positions')
-                continue
+        return self
 
-            # Special handling for multiline groups
-            if hasattr(self, '_multiline_groups') and key in self._multiline_groups:
-                self._cleanup_element_group(key, '_multiline_groups', '_multiline_element_positions')
-                continue
+    def delete_many(self, keys):
+        """Delete the elements of all keys in a single pass with one redraw"""
+        with self.batch():
+            for key in keys:
+                self._delete_key(key)
+        return self
 
-            # Special handling for combobox groups
-            if hasattr(self, '_combobox_groups') and key in self._combobox_groups:
-                self._cleanup_element_group(key, '_combobox_groups', '_combobox_element_positions')
-                continue
+    def _delete_key(self, key):
+        """Delete the element or group registered under key"""
+        # Groups are deleted by the cleanup registered for their kind
+        group = self._groups.get(key)
+        if group is not None:
+            cleanup = self._group_kinds[group.kind].cleanup
+            if cleanup is not None:
+                cleanup(key)
+                return
+
+        # Handle single elements
+        if key in self.element_keys:
+            element_to_remove = self.element_keys[key]
+            self._safe_destroy_element(element_to_remove)
+            self.elements.discard(element_to_remove)
+            del self.element_keys[key]
 
-            # Handle single elements
-            if key in self.element_keys:
-                element_to_remove = self.element_keys[key]
-                self._safe_destroy_element(element_to_remove)
-                if element_to_remove in self.elements:
-                    self.elements.remove(element_to_remove)
-                del self.element_keys[key]
+        # Clean up positions and strings
+        if key in self.element_positions:
+            del self.element_positions[key]
+        if key in self.element_strings:
+            del self.element_strings[key]
 
-            # Clean up positions and strings
-            if key in self.element_positions:
-                del self.element_positions[key]
-            if key in self.element_strings:
-                del self.element_strings[key]
+    @contextlib.contextmanager
+    def batch(self):
+        """Collect deletes, moves and visibility changes, then apply them in one pass with a single redraw
 
-        return self
+            with window.batch():
+                window.delete(kstart='ROW')
+                window.visible(True, shas='results')
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+
+    def _place_element(self, element, **placement):
+        """place() a widget now, or at the end of the current batch"""
+        if self._batch_depth:
+            # place() merges with the options already set, unless the widget was forgotten
+            pending = self._batch_places.get(element)
+            self._batch_places[element] = {**pending, **placement} if pending else placement
+        else:
+            element.place(**placement)
+
+    def _unplace_element(self, element):
+        """place_forget() a widget now, or at the end of the current batch"""
+        if self._batch_depth:
+            self._batch_places[element] = None
+        else:
+            element.place_forget()
+
+    def _flush_batch(self):
+        """Apply the placements and destroys collected by batch(), then redraw once"""
+        places, destroys = self._batch_places, self._batch_destroys
+        redraw = self._batch_redraw
+        self._batch_places, self._batch_destroys, self._batch_redraw = {}, {}, False
+
+        for element, placement in places.items():
+            if element in destroys:
+                continue
+            try:
+                if placement is None:
+                    element.place_forget()
+                else:
+                    element.place(**placement)
+            except tk.TclError:
+                pass
 
-    def _cleanup_table(self, key):
-        """Thoroughly clean up a table and all its elements"""
-        print(f"Starting _cleanup_table for key: {key}")
+        for element in destroys:
+            try:
+                element.destroy()
+            except Exception:
+                pass
 
-        if not hasattr(self, '_table_groups'):
-            print("No _table_groups attribute found")
+        if self.window_closed:
             return
+        if redraw:
+            self._refresh_window()
+        elif places or destroys:
+            try:
+                self.root.update_idletasks()
+            except tk.TclError:
+                pass
 
-        if key not in self._table_groups:
-            print(f"Key {key} not found in _table_groups")
-            print(f"Available keys in _table_groups: {list(self._table_groups.keys())}")
+    def _cleanup_table(self, key):
+        """Thoroughly clean up a table and all its elements"""
+        group = self._group(key, 'table')
+        if group is None:
             return
 
+        # Stop rows still being inserted by the idle scheduler
+        if hasattr(self, 'unschedule'):
+            self.unschedule(('table_rows', key))
+
         # First, get the main table widget and all related widgets
         try:
-            table_widget, _ = self._table_groups[key]
-            print(f"Table widget found: {table_widget}")
+            table_widget = group.widget
 
             # CRITICAL: Hide the widget first before destroying it
             if hasattr(table_widget, 'place_forget'):
-                table_widget.place_forget()
-                print("Table widget hidden")
+                self._unplace_element(table_widget)
 
-            # Get all the elements from the positions dict
-            if hasattr(self, '_table_element_positions') and key in self._table_element_positions:
-                elements_positions = self._table_element_positions[key]
-                print(f"Found {len(elements_positions)} elements in positions")
-
-                for element, _ in elements_positions:
-                    # CRITICAL: Hide each element first
-                    if hasattr(element, 'place_forget'):
-                        element.place_forget()
-
-                    # Then destroy it
-                    self._safe_destroy_element(element)
-                    if element in self.elements:
-                        self.elements.remove(element)
+            for element, _ in group.members:
+                # CRITICAL: Hide each element first
+                if hasattr(element, 'place_forget'):
+                    self._unplace_element(element)
 
-                # Remove the positions entry
-                del self._table_element_positions[key]
-                print("Table element positions cleaned up")
+                # Then destroy it
+                self._safe_destroy_element(element)
+                self.elements.discard(element)
 
             # Destroy the main table widget
             self._safe_destroy_element(table_widget)
-            if table_widget in self.elements:
-                self.elements.remove(table_widget)
-                print("Table widget removed from elements list")
+            self.elements.discard(table_widget)
 
-            # Remove from table groups
-            del self._table_groups[key]
-            print(f"Key {key} removed from _table_groups")
+            # Remove from groups
+            del self._groups[key]
 
             # Clean up from main tracking structures
             if key in self.element_keys:
                 del self.element_keys[key]
-                print(f"Key {key} removed from element_keys")
 
             if key in self.element_positions:
                 del self.element_positions[key]
-                print(f"Key {key} removed from element_positions")
 
             if key in self.element_strings:
                 del self.element_strings[key]
-                print(f"Key {key} removed from element_strings")
-
-            print(f"Table cleanup for key {key} completed successfully")
         except Exception as e:
             print(f"Error cleaning up table {key}: {e}")
 
-    def _cleanup_element_group(self, key, groups_attr, positions_attr):
+    def _cleanup_element_group(self, key):
         """Clean up a group of elements"""
-        # Delete from positions
-        if hasattr(self, positions_attr) and key in getattr(self, positions_attr):
-            elements_positions = getattr(self, positions_attr)[key]
-            for element, _ in elements_positions:
+        group = self._groups.pop(key, None)
+        if group is not None:
+            for element, _ in group.members:
                 # CRITICAL: Hide the element first
                 if hasattr(element, 'place_forget'):
-                    element.place_forget()
+                    self._unplace_element(element)
 
                 # Then destroy it
                 self._safe_destroy_element(element)
-                if element in self.elements:
-                    self.elements.remove(element)
-
-            # Remove from positions
-            delattr(getattr(self, positions_attr), key)
-
-        # Remove from groups
-        if hasattr(self, groups_attr) and key in getattr(self, groups_attr):
-            del getattr(self, groups_attr)[key]
+                self.elements.discard(element)
 
         # Clean up from main tracking structures
         if key in self.element_keys:
@@ -195,7 +214,11 @@ class NgUtils:
             del self.element_strings[key]
 
     def _safe_destroy_element(self, element):
-        """Safely destroy a Tkinter element"""
+        """Safely destroy a Tkinter element, at the end of the current batch if any"""
+        self._forget_element(element)
+        if self._batch_depth:
+            self._batch_destroys[element] = None
+            return
         try:
             # Important: always check if element exists before destroying
             if hasattr(element, 'winfo_exists'):
@@ -209,38 +232,17 @@ class NgUtils:
             pass
 
     def finalize_layout(self):
-        """Store initial element count"""
+        """Store initial element count and the checkpoint clear_error_messages() rolls back to"""
+        self._flush_deferred_layout()
         self.initial_elements_count = len(self.elements)
+        self._layout_checkpoint = self.checkpoint()
+        self._save_layout_cache()
         return self
 
     def clear_error_messages(self):
-        """Remove dynamically added elements"""
-        if self.initial_elements_count > 0:
-            elements_to_remove = self.elements[self.initial_elements_count:]
-
-            for element in elements_to_remove:
-                # CRITICAL: Hide the element first
-                if hasattr(element, 'place_forget'):
-                    element.place_forget()
-
-                # Then destroy it
-                self._safe_destroy_element(element)
-
-            self.elements = self.elements[:self.initial_elements_count]
-
-            keys_to_remove = []
-            for key in list(self.element_keys.keys()):
-                element = self.element_keys[key]
-                if element not in self.elements:
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                if key in self.element_keys:
-                    del self.element_keys[key]
-                if key in self.element_positions:
-                    del self.element_positions[key]
-                if key in self.element_strings:
-                    del self.element_strings[key]
+        """Remove elements added after finalize_layout(), layout cursor unchanged"""
+        if self.initial_elements_count > 0 and self._layout_checkpoint is not None:
+            self._remove_elements_after(self._layout_checkpoint.generation)
         return self
 
     def set_focus(self, k=''):
@@ -16,61 +16,61 @@ class NgVisibility:
             if self.exists(k):
                 matching_keys.append(k)
         elif kstart:
-            matching_keys = [key for key in self.element_keys.keys()
-                             if not key.startswith('__auto_key_') and key.startswith(kstart)]
+            matching_keys = self.element_keys.keys_starting_with(kstart)
         elif shas:
-            matching_keys = [key for key, s_val in self.element_strings.items()
-                             if shas in s_val]
+            matching_keys = self.element_strings.keys_containing(shas)
 
         return matching_keys
 
     def visible(self, is_visible, shas='', k='', kstart=''):
-        """Set visibility of elements"""
+        """Set visibility of elements, applied together with at most one redraw"""
         matching_keys = self._get_matching_keys(k=k, kstart=kstart, shas=shas)
 
-        for key in matching_keys:
-            if key in self.element_keys:
-                element = self.element_keys[key]
-                self._set_visible_impl(element, is_visible)
+        with self.batch():
+            for key in matching_keys:
+                if key in self.element_keys:
+                    element = self.element_keys[key]
+                    self._set_visible_impl(element, is_visible)
 
         return self
 
     def _set_visible_impl(self, element, is_visible):
         """Tkinter visibility implementation"""
+        record = self._records.get(element)
+
         if hasattr(element, 'place'):
             if is_visible:
-                element_found = False
-                for key, el in self.element_keys.items():
-                    if el == element and key in self.element_positions:
-                        x, y, width, height = self.element_positions[key]
-                        element.place(x=x, y=y, width=width, height=height)
-                        element_found = True
-                        break
-
-                # Check in group-specific element positions
-                position_attributes = [
-                    '_combobox_element_positions',
-                    '_checkbox_element_positions',
-                    '_radio_element_positions',
-                    '_listbox_element_positions',
-                    '_multiline_element_positions'
-                ]
-
-                for attr_name in position_attributes:
-                    if not element_found and hasattr(self, attr_name):
-                        for group_key, elements_positions in getattr(self, attr_name).items():
-                            for el, pos in elements_positions:
-                                if el == element:
-                                    x, y = pos
-                                    element.place(x=x, y=y)
-                                    element_found = True
-                                    break
-                            if element_found:
-                                break
+                if record is not None:
+                    if record.key in self.element_positions:
+                        x, y, width, height = self.element_positions[record.key]
+                        self._place_element(element, x=x, y=y, width=width, height=height)
+                    elif record.position is not None:
+                        x, y = record.position
+                        self._place_element(element, x=x, y=y)
             else:
-                element.place_forget()
+                self._unplace_element(element)
+
+        if record is not None:
+            record.visible = is_visible
+
+        if self._batch_depth:
+            self._batch_redraw = True
+        else:
+            self._refresh_window()
+
+    def _needs_redraw_nudge(self):
+        """Check if shown and hidden widgets are only repainted after a window resize (Aqua, macOS)"""
+        nudge = getattr(self, '_redraw_nudge', None)
+        if nudge is None:
+            nudge = self._redraw_nudge = self.root.tk.call('tk', 'windowingsystem') == 'aqua'
+        return nudge
+
+    def _refresh_window(self):
+        """Redraw after visibility changes: micro-resize on macOS, idle flush elsewhere"""
+        if not self._needs_redraw_nudge():
+            self.root.update_idletasks()
+            return
 
-        # Force window refresh on macOS with micro-resize
         geo_parts = self.root.geometry().split('+')
         size_part = geo_parts[0]  # e.g., "300x300"
         width, height = size_part.split('x')
@@ -123,7 +123,7 @@ class NgVisibility:
     def _move_element_impl(self, element, new_x, new_y):
         """Tkinter movement implementation"""
         if hasattr(element, 'place'):
-            element.place(x=new_x, y=new_y)
+            self._place_element(element, x=new_x, y=new_y)
 
     def to_front(self, shas='', k='', kstart=''):
         """Bring elements matching criteria to front of stacking order"""
@@ -133,15 +133,11 @@ class NgVisibility:
         elements_to_lift = []
 
         # Check if any of the matching keys are panels
-        panel_keys = []
-        if hasattr(self, '_panel_groups'):
-            for key in matching_keys:
-                if key in self._panel_groups:
-                    panel_keys.append(key)
+        panels = [self._group(key, 'panel') for key in matching_keys]
 
         # For panel keys, we need to lift the rect first, then all elements
-        for panel_key in panel_keys:
-            panel_data = self._panel_groups[panel_key]
+        for panel in filter(None, panels):
+            panel_data = panel.state
 
             # Add rect first (it should be at the bottom)
             if 'rect' in panel_data and panel_data['rect']:
@@ -0,0 +1,645 @@
+# ngheadless_widgets.py
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+"""
+In-memory stand-ins for the Tkinter widgets used by pyNaviGui
+
+No display is needed: widgets only store their options, placement and
+content. Requested sizes come from fixed character metrics, so layouts are
+identical on every machine. Time is virtual: after() timers run when the
+clock is advanced, never by waiting.
+"""
+
+import itertools
+import tkinter as tk
+import types
+
+CHAR_WIDTH = 7
+LINE_HEIGHT = 17
+
+
+def _text_size(text, width_chars=None, height_lines=None):
+    """Return (width, height) of text with the fixed metrics"""
+    lines = str(text).split('\n') if text != '' else ['']
+    chars = width_chars if width_chars else max(len(line) for line in lines)
+    nr_lines = height_lines if height_lines else len(lines)
+    return chars * CHAR_WIDTH, nr_lines * LINE_HEIGHT
+
+
+class HeadlessEvent:
+    """Event object passed to bound callbacks"""
+
+    def __init__(self, widget, **kwargs):
+        self.widget = widget
+        self.x = 0
+        self.y = 0
+        self.keysym = ''
+        self.char = ''
+        self.__dict__.update(kwargs)
+
+
+class HeadlessInterp:
+    """Stand-in for root.tk, the Tcl interpreter"""
+
+    def __init__(self, root):
+        self._root = root
+
+    def dooneevent(self, flags=0):
+        """Run one idle callback or timer, jumping the virtual clock if needed"""
+        return 1 if self._root.run_next(wait=not flags & 2) else 0
+
+    def call(self, *args):
+        """Accept raw Tcl commands (only 'raise' is used) without effect"""
+        return ''
+
+
+class HeadlessRoot:
+    """Stand-in for tk.Tk with a virtual clock"""
+
+    def __init__(self):
+        self.clock_ms = 0
+        self.destroyed = False
+        self.focus = None
+        self.stacking = []
+        self.tk = HeadlessInterp(self)
+        self._w = '.'
+        self._title = 'tk'
+        self._geometry = '200x200+0+0'
+        self._protocols = {}
+        self._timers = {}
+        self._idle = {}
+        self._ids = itertools.count(1)
+
+    def _check_alive(self):
+        if self.destroyed:
+            raise tk.TclError("can't invoke command: application has been destroyed")
+
+    def title(self, title=None):
+        if title is None:
+            return self._title
+        self._title = title
+
+    def geometry(self, geometry=None):
+        if geometry is None:
+            self._check_alive()
+            return self._geometry
+        size, _, position = geometry.partition('+')
+        self._geometry = f"{size}+{position or '0+0'}"
+
+    def protocol(self, name, func=None):
+        self._protocols[name] = func
+
+    def cget(self, option):
+        return {'bg': '#d9d9d9', 'background': '#d9d9d9'}.get(option, '')
+
+    def after(self, ms, func=None, *args):
+        self._check_alive()
+        timer_id = f"after#{next(self._ids)}"
+        self._timers[timer_id] = (self.clock_ms + int(ms), timer_id, lambda: func(*args))
+        return timer_id
+
+    def after_idle(self, func, *args):
+        self._check_alive()
+        timer_id = f"after#{next(self._ids)}"
+        self._idle[timer_id] = lambda: func(*args)
+        return timer_id
+
+    def after_cancel(self, timer_id):
+        self._check_alive()
+        self._timers.pop(timer_id, None)
+        self._idle.pop(timer_id, None)
+
+    def run_next(self, wait=True, until=None):
+        """Run one pending callback: idle first, then the earliest timer
+
+        Due timers run at once. With wait=True the clock jumps forward to the
+        next timer, but not past until. Returns False when nothing ran"""
+        self._check_alive()
+        if self._idle:
+            timer_id = next(iter(self._idle))
+            self._idle.pop(timer_id)()
+            return True
+
+        if not self._timers:
+            return False
+
+        due, timer_id, func = min(self._timers.values())
+        if due > self.clock_ms:
+            if not wait:
+                return False
+            if until is not None and due > until:
+                self.clock_ms = until
+                return False
+            self.clock_ms = due
+
+        del self._timers[timer_id]
+        func()
+        return True
+
+    def advance(self, ms):
+        """Move the virtual clock forward, running every timer that falls due"""
+        until = self.clock_ms + ms
+        while not self.destroyed and self.run_next(until=until):
+            pass
+        if not self.destroyed:
+            self.clock_ms = until
+
+    def update_idletasks(self):
+        self._check_alive()
+        while self._idle:
+            self.run_next(wait=False)
+
+    def update(self):
+        self._check_alive()
+        while not self.destroyed and self.run_next(wait=False):
+            pass
+
+    def mainloop(self):
+        while not self.destroyed and self.run_next():
+            pass
+
+    def quit(self):
+        pass
+
+    def destroy(self):
+        for widget in list(self.stacking):
+            widget.destroy()
+        self.destroyed = True
+
+
+class HeadlessWidget:
+    """Base stand-in widget: options, placement, bindings and stacking"""
+
+    _defaults = {}
+    _chrome = (6, 4)
+    _counter = itertools.count(1)
+
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.root = master if isinstance(master, HeadlessRoot) else master.root
+        self.tk = self.root.tk
+        self._w = f".!{type(self).__name__.lower()}{next(self._counter)}"
+        self.options = dict(self._defaults)
+        self.options.update(options)
+        self.bindings = {}
+        self.placement = None
+        self.packed = False
+        self.destroyed = False
+        self.root.stacking.append(self)
+
+    def configure(self, cnf=None, **options):
+        if cnf is None and not options:
+            return dict(self.options)
+        if cnf:
+            options.update(cnf)
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, option):
+        return self.options.get(option, '')
+
+    def __getitem__(self, option):
+        return self.cget(option)
+
+    def __setitem__(self, option, value):
+        self.options[option] = value
+
+    def place(self, **placement):
+        self.placement = placement
+
+    def place_forget(self):
+        self.placement = None
+
+    def place_info(self):
+        return dict(self.placement or {})
+
+    def pack(self, **options):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def bind(self, sequence, func=None, add=None):
+        self.bindings[sequence] = func
+
+    def event_generate(self, sequence, **kwargs):
+        """Call the callback bound to sequence, as a user interaction would"""
+        func = self.bindings.get(sequence)
+        if func is not None:
+            return func(HeadlessEvent(self, **kwargs))
+
+    def update_idletasks(self):
+        self.root.update_idletasks()
+
+    def update(self):
+        self.root.update()
+
+    def winfo_exists(self):
+        return 0 if self.destroyed else 1
+
+    def winfo_viewable(self):
+        return 1 if not self.destroyed and (self.placement is not None or self.packed) else 0
+
+    def winfo_reqwidth(self):
+        return self._req_size()[0]
+
+    def winfo_reqheight(self):
+        return self._req_size()[1]
+
+    def winfo_width(self):
+        return (self.placement or {}).get('width') or self.winfo_reqwidth()
+
+    def winfo_height(self):
+        return (self.placement or {}).get('height') or self.winfo_reqheight()
+
+    def winfo_x(self):
+        return (self.placement or {}).get('x', 0)
+
+    def winfo_y(self):
+        return (self.placement or {}).get('y', 0)
+
+    def lift(self, above=None):
+        if self in self.root.stacking:
+            self.root.stacking.remove(self)
+            self.root.stacking.append(self)
+
+    tkraise = lift
+
+    def lower(self, below=None):
+        if self in self.root.stacking:
+            self.root.stacking.remove(self)
+            self.root.stacking.insert(0, self)
+
+    def focus_set(self):
+        self.root.focus = self
+
+    def destroy(self):
+        self.destroyed = True
+        self.placement = None
+        if self in self.root.stacking:
+            self.root.stacking.remove(self)
+
+    def _req_size(self):
+        """Requested (width, height) from options and fixed metrics"""
+        if self.options.get('image') is not None and self.options.get('image') != '':
+            image = self.options['image']
+            return image.width() + self._chrome[0], image.height() + self._chrome[1]
+
+        width, height = _text_size(self.options.get('text', ''), self.options.get('width'),
+                                   self.options.get('height'))
+        return width + self._chrome[0], height + self._chrome[1]
+
+
+class Label(HeadlessWidget):
+    pass
+
+
+class Button(HeadlessWidget):
+    _chrome = (18, 10)
+
+    def invoke(self):
+        command = self.options.get('command')
+        if command:
+            return command()
+
+
+class Checkbutton(HeadlessWidget):
+    _chrome = (25, 4)
+
+    def invoke(self):
+        variable = self.options.get('variable')
+        if variable is not None:
+            variable.set(not variable.get())
+        command = self.options.get('command')
+        if command:
+            return command()
+
+
+class Radiobutton(HeadlessWidget):
+    _chrome = (25, 4)
+
+    def invoke(self):
+        variable = self.options.get('variable')
+        if variable is not None:
+            variable.set(self.options.get('value', ''))
+        command = self.options.get('command')
+        if command:
+            return command()
+
+
+class Frame(HeadlessWidget):
+
+    def _req_size(self):
+        return int(self.options.get('width', 0)), int(self.options.get('height', 0))
+
+
+class Canvas(Frame):
+    _item_ids = itertools.count(1)
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.items = {}
+
+    def create_rectangle(self, *coords, **options):
+        item_id = next(self._item_ids)
+        self.items[item_id] = ('rectangle', coords, options)
+        return item_id
+
+    def create_text(self, *coords, **options):
+        item_id = next(self._item_ids)
+        self.items[item_id] = ('text', coords, options)
+        return item_id
+
+
+class Scrollbar(HeadlessWidget):
+
+    def set(self, *args):
+        self.position = args
+
+    def _req_size(self):
+        return 16, 16
+
+
+def _index(index, length):
+    """Turn a Tk index (int, 'end', 'line.char') into a position"""
+    if index in ('end', tk.END):
+        return length
+    if isinstance(index, str) and '.' in index:
+        return 0 if index == '1.0' else length
+    return min(int(index), length)
+
+
+class Entry(HeadlessWidget):
+    _defaults = {'width': 20}
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.content = ''
+        self.cursor = 0
+
+    def get(self):
+        return self.content
+
+    def insert(self, index, text):
+        position = _index(index, len(self.content))
+        self.content = self.content[:position] + str(text) + self.content[position:]
+
+    def delete(self, first, last=None):
+        start = _index(first, len(self.content))
+        end = start + 1 if last is None else _index(last, len(self.content))
+        self.content = self.content[:start] + self.content[end:]
+
+    def icursor(self, index):
+        self.cursor = _index(index, len(self.content))
+
+    def _req_size(self):
+        width, height = _text_size('', self.options.get('width'), 1)
+        return width + self._chrome[0], height + self._chrome[1]
+
+
+class Text(HeadlessWidget):
+    _defaults = {'width': 80, 'height': 24}
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.content = ''
+
+    def get(self, first='1.0', last='end-1c'):
+        return self.content
+
+    def insert(self, index, text):
+        if _index(index, len(self.content)) == 0:
+            self.content = str(text) + self.content
+        else:
+            self.content += str(text)
+
+    def delete(self, first='1.0', last='end'):
+        self.content = ''
+
+    def yview(self, *args):
+        pass
+
+    def _req_size(self):
+        width, height = _text_size('', self.options.get('width'), self.options.get('height'))
+        return width + self._chrome[0], height + self._chrome[1]
+
+
+class Listbox(HeadlessWidget):
+    _defaults = {'width': 20, 'height': 10}
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.items = []
+        self.selected = set()
+
+    def insert(self, index, *items):
+        position = _index(index, len(self.items))
+        self.items[position:position] = [str(item) for item in items]
+
+    def delete(self, first, last=None):
+        start = _index(first, len(self.items))
+        end = start + 1 if last is None else _index(last, len(self.items)) + 1
+        del self.items[start:end]
+        self.selected = {i for i in self.selected if i < len(self.items)}
+
+    def get(self, first, last=None):
+        if last is None:
+            return self.items[_index(first, len(self.items))]
+        return tuple(self.items[_index(first, len(self.items)):_index(last, len(self.items)) + 1])
+
+    def size(self):
+        return len(self.items)
+
+    def curselection(self):
+        return tuple(sorted(self.selected))
+
+    def selection_set(self, first, last=None):
+        end = first if last is None else _index(last, len(self.items))
+        self.selected.update(range(int(first), int(end) + 1))
+
+    def selection_clear(self, first, last=None):
+        end = first if last is None else _index(last, len(self.items))
+        self.selected.difference_update(range(int(first), int(end) + 1))
+
+    def see(self, index):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def _req_size(self):
+        width, height = _text_size('', self.options.get('width'), self.options.get('height'))
+        return width + self._chrome[0], height + self._chrome[1]
+
+
+class Variable:
+    """Stand-in for tk.Variable"""
+
+    _default = ''
+
+    def __init__(self, master=None, value=None, name=None):
+        self._value = self._default if value is None else value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class StringVar(Variable):
+    _default = ''
+
+
+class BooleanVar(Variable):
+    _default = False
+
+    def get(self):
+        return bool(self._value)
+
+
+class Combobox(HeadlessWidget):
+    _defaults = {'width': 20, 'values': ()}
+    _chrome = (26, 7)
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.selected_index = -1
+        self.text = ''
+
+    def current(self, index=None):
+        if index is None:
+            return self.selected_index
+        self.selected_index = int(index)
+        self.text = list(self.options.get('values', ()))[self.selected_index]
+
+    def get(self):
+        return self.text
+
+    def set(self, value):
+        self.text = value
+        values = list(self.options.get('values', ()))
+        self.selected_index = values.index(value) if value in values else -1
+
+    def _req_size(self):
+        width, height = _text_size('', self.options.get('width'), 1)
+        return width + self._chrome[0], height + self._chrome[1]
+
+
+class Treeview(HeadlessWidget):
+    _defaults = {'height': 10, 'columns': ()}
+    _row_height = 20
+    _heading_height = 26
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.headings = {}
+        self.column_widths = {}
+        self.rows = {}
+        self.order = []
+        self.tags = {}
+        self.selected = ()
+        self._iids = itertools.count(1)
+
+    def heading(self, column, **options):
+        self.headings.setdefault(column, {}).update(options)
+
+    def column(self, column, **options):
+        if 'width' in options:
+            self.column_widths[column] = options['width']
+
+    def insert(self, parent, index, iid=None, values=(), tags=(), **options):
+        iid = iid or f"I{next(self._iids):03X}"
+        self.rows[iid] = {'values': tuple(values), 'tags': tuple(tags), 'text': options.get('text', '')}
+        if index in ('end', tk.END):
+            self.order.append(iid)
+        else:
+            self.order.insert(int(index), iid)
+        return iid
+
+    def get_children(self, item=''):
+        return tuple(self.order)
+
+    def delete(self, *items):
+        for iid in items:
+            if iid in self.rows:
+                del self.rows[iid]
+                self.order.remove(iid)
+        self.selected = tuple(iid for iid in self.selected if iid in self.rows)
+
+    def item(self, iid, option=None, **options):
+        if options:
+            self.rows[iid].update(options)
+            return
+        if option is None:
+            return dict(self.rows[iid])
+        return self.rows[iid][option]
+
+    def tag_configure(self, tagname, **options):
+        self.tags.setdefault(tagname, {}).update(options)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, *items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        self.selected = tuple(items)
+
+    def index(self, iid):
+        return self.order.index(iid)
+
+    def yview(self, *args):
+        pass
+
+    def xview(self, *args):
+        pass
+
+    def _req_size(self):
+        columns = list(self.options.get('columns', ()))
+        width = sum(self.column_widths.get(column, 200) for column in columns) + 2
+        height = int(self.options.get('height', 10)) * self._row_height + self._heading_height
+        return width, height
+
+
+class PhotoImage:
+    """Stand-in for ImageTk.PhotoImage: keeps the path and size only"""
+
+    def __init__(self, width, height, path=''):
+        self._width = width
+        self._height = height
+        self.path = path
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+
+class Font:
+    """Stand-in for tkinter.font.Font with the fixed metrics"""
+
+    def __init__(self, root=None, font=None, name=None, exists=False, **options):
+        self.name = name or str(font)
+
+    def measure(self, text):
+        return len(str(text)) * CHAR_WIDTH
+
+    def metrics(self, *options):
+        metrics = {'ascent': LINE_HEIGHT - 4, 'descent': 4, 'linespace': LINE_HEIGHT, 'fixed': 1}
+        if len(options) == 1:
+            return metrics[options[0]]
+        return metrics
+
+
+headless_tk = types.SimpleNamespace(
+    Tk=HeadlessRoot, Label=Label, Button=Button, Checkbutton=Checkbutton, Radiobutton=Radiobutton,
+    Frame=Frame, Canvas=Canvas, Scrollbar=Scrollbar, Entry=Entry, Text=Text, Listbox=Listbox,
+    StringVar=StringVar, BooleanVar=BooleanVar, TclError=tk.TclError)
+
+headless_ttk = types.SimpleNamespace(Combobox=Combobox, Treeview=Treeview, Scrollbar=Scrollbar)
+
+headless_font = types.SimpleNamespace(Font=Font)
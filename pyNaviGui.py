@@ -18,12 +18,21 @@ from ng_elements_nav import NgNavElements
 from ng_elements_update import NgElementsUpdate
 from ng_visibility import NgVisibility
 from ng_utils import NgUtils
+from ng_async import NgAsync
+from ng_tasks import NgTasks
+from ng_scheduler import NgScheduler
+from ng_stats import NgStats
+from ng_checkpoint import NgCheckpoints
+from ng_measure import NgMeasure
+from ng_plan import NgBuildPlans
+from ng_scroll import NgScrollRows
 
 
 class Ng(NgCore, NgDefaults, NgLayout,
          NgElementsBase00, NgElementsBase05, NgElementsBase10, NgElementsBase20, NgElementsBase30,
          NgElementsBase40, NgElementsBase50, NgElementsBase60, NgElementsBase90,
-         NgNavElements, NgElementsUpdate, NgVisibility, NgUtils):
+         NgNavElements, NgElementsUpdate, NgVisibility, NgUtils, NgAsync, NgTasks, NgScheduler, NgStats,
+         NgCheckpoints, NgMeasure, NgBuildPlans, NgScrollRows):
     """Tkinter-based GUI implementation - Unified modular version
 
     Combines all mixins to provide complete pyNaviGui interface"""
@@ -0,0 +1,149 @@
+# pyNaviGuiHeadless.py
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+"""
+Headless pyNaviGui for tests and benchmarks
+
+Same API as Ng, without a display: widgets are in-memory stand-ins with
+deterministic sizes and time is virtual. Usage:
+
+    from pyNaviGuiHeadless import NgHeadless
+
+    window = NgHeadless()
+    window.text('Name:').input('', k='name').button('OK', k='ok')
+    window.type_text('name', 'Dario').click('ok')
+    event, values = window.read(timeout=0)     # ('ok', {'name': 'Dario'})
+"""
+
+import time
+
+from pyNaviGui import Ng
+from ngheadless_widgets import headless_tk, headless_ttk, headless_font, PhotoImage, CHAR_WIDTH, LINE_HEIGHT
+
+
+class NgHeadless(Ng):
+    """pyNaviGui backed by in-memory widgets, with helpers to simulate user interaction"""
+
+    _tk = headless_tk
+    _ttk = headless_ttk
+    _tkfont = headless_font
+    _redraw_nudge = False
+
+    def __init__(self, geometry='800x600', embed_mode=False, parent_root=None):
+        """Initialize headless pyNaviGui"""
+        # Longest virtual time a blocking read() waits before reporting that nothing can arrive
+        self.block_limit_ms = 60000
+        super().__init__(geometry, embed_mode, parent_root)
+
+    def _measure_environment(self):
+        """Sizes only depend on the fixed character metrics"""
+        return ['headless', CHAR_WIDTH, LINE_HEIGHT]
+
+    def _load_photo_image(self, image_path, width, height):
+        """Images are not decoded, only their size is kept"""
+        return PhotoImage(width, height, image_path)
+
+    def _wait_for_event(self, timeout=None):
+        """Run virtual time until an event is queued or timeout (ms) expires"""
+        limit = timeout if timeout is not None else self.block_limit_ms
+        deadline = self.root.clock_ms + max(int(limit), 1)
+
+        while self.event_queue.empty() and not self.window_closed:
+            if not self.root.run_next(until=deadline):
+                if timeout is None:
+                    raise RuntimeError(f"read() would block forever: no event within {limit} ms")
+                return
+
+    def _pump_async(self):
+        """Also run virtual time, up to block_limit_ms, until an event is queued or no timer is left"""
+        super()._pump_async()
+        deadline = self.root.clock_ms + self.block_limit_ms
+        while self.event_queue.empty() and not self.window_closed and self.root.run_next(until=deadline):
+            pass
+
+    def advance(self, ms):
+        """Move the virtual clock forward, running timers that fall due (debounces, delayed clicks)"""
+        self.root.advance(ms)
+        return self
+
+    def widget(self, k):
+        """Return the main stand-in widget of element k"""
+        group = self._groups.get(k)
+        if group is not None and hasattr(group, 'widget'):
+            return group.widget
+        return self.element_keys.get(k)
+
+    def inject_event(self, k, values=None):
+        """Queue a synthetic event, with the current values unless values is given"""
+        if values is None:
+            self._post_widget_event(k)
+        else:
+            self.event_queue.put((k, values, time.monotonic()))
+        return self
+
+    def click(self, k):
+        """Click element k: button command or bound mouse click"""
+        element = self.widget(k)
+        if element is None:
+            raise KeyError(k)
+
+        if element.options.get('command'):
+            element.invoke()
+        elif '<ButtonRelease-1>' in element.bindings:
+            element.event_generate('<ButtonRelease-1>')
+        else:
+            element.event_generate('<Button-1>')
+        return self
+
+    def double_click(self, k):
+        """Double-click element k (listbox or table)"""
+        self.widget(k).event_generate('<Double-Button-1>')
+        return self
+
+    def type_text(self, k, text, enter=False, tab=False):
+        """Replace the text of input k as if typed, then optionally press Enter or Tab"""
+        entry = self.widget(k)
+        entry.delete(0, 'end')
+        entry.insert(0, text)
+        entry.event_generate('<KeyRelease>')
+        if enter:
+            entry.event_generate('<Return>')
+        if tab:
+            entry.event_generate('<Tab>')
+        return self
+
+    def select(self, k, value):
+        """Select value in a listbox, combobox, radio or checkbox group, or row index in a table"""
+        group = self._groups.get(k)
+        kind = group.kind if group is not None else ''
+        wanted = value if isinstance(value, (list, tuple)) else [value]
+
+        if kind == 'listbox':
+            group.widget.selection_clear(0, 'end')
+            for i, (_, option_value) in enumerate(group.options):
+                if option_value in wanted:
+                    group.widget.selection_set(i)
+            group.widget.event_generate('<<ListboxSelect>>')
+        elif kind == 'combobox':
+            for i, (_, option_value) in enumerate(group.options):
+                if option_value == value:
+                    group.widget.current(i)
+            group.widget.event_generate('<<ComboboxSelected>>')
+        elif kind == 'radio':
+            group.var.set(value)
+        elif kind == 'checkbox':
+            for var, option_value in group.vars:
+                var.set(option_value in wanted)
+        elif kind == 'table':
+            rows = group.widget.get_children()
+            group.widget.selection_set([rows[i] for i in wanted])
+            group.widget.event_generate('<<TreeviewSelect>>')
+        else:
+            raise KeyError(k)
+        return self
+
+    def close_window(self):
+        """Simulate the user closing the window"""
+        self._on_closing()
+        return self
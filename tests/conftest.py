@@ -0,0 +1,37 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyNaviGuiHeadless import NgHeadless
+
+
+@pytest.fixture
+def window():
+    """Headless window, closed after the test"""
+    window = NgHeadless()
+    yield window
+    if not window.window_closed:
+        window.close()
+
+
+@pytest.fixture
+def count_calls(window, monkeypatch):
+    """Return a function wrapping a window method so its calls are recorded"""
+    def count(name):
+        calls = []
+        method = getattr(window, name)
+
+        def counted(*args, **kwargs):
+            calls.append(args)
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(window, name, counted)
+        return calls
+
+    return count
@@ -0,0 +1,54 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import asyncio
+
+
+def _run(coroutine, timeout=5):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout))
+
+
+def test_read_async_returns_queued_event(window):
+    window.input('', k='name').button('OK', k='ok')
+    window.type_text('name', 'Dario').click('ok')
+
+    event, values = _run(window.read_async())
+
+    assert (event, dict(values)) == ('ok', {'name': 'Dario'})
+
+
+def test_read_async_times_out_without_events(window):
+    assert _run(window.read_async(timeout=10)) == ('', {})
+
+
+def test_read_async_runs_virtual_time_for_timers(window):
+    window.root.after(5000, lambda: window.inject_event('late', {}))
+
+    assert _run(window.read_async(), timeout=2) == ('late', {})
+
+
+def test_read_async_wakes_up_for_events_from_other_threads(window):
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, lambda: window.event_queue.put(('worker', {})))
+        return await window.read_async(fps=1)
+
+    assert _run(main()) == ('worker', {})
+
+
+def test_run_async_awaits_coroutine_handlers_until_the_window_closes(window):
+    calls = []
+
+    async def on_row(values):
+        await asyncio.sleep(0)
+        calls.append(values['_event'])
+        if len(calls) == 2:
+            window.close_window()
+
+    window.register_event_handler('row_*', on_row)
+    window.inject_event('row_1', {}).inject_event('row_2', {})
+
+    _run(window.run_async())
+
+    assert calls == ['row_1', 'row_2']
+    assert window.window_closed
@@ -0,0 +1,53 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+def test_batch_defers_placements_until_the_outermost_block_ends(window):
+    with window.batch():
+        window.text('a', k='a')
+        with window.batch():
+            window.text('b', k='b')
+        assert window.widget('a').place_info() == {}
+
+    assert window.widget('a').place_info()['x'] == 0
+    assert window.widget('b').place_info()['x'] > 0
+
+
+def test_delete_many_removes_elements_and_groups_in_one_flush(window, count_calls):
+    window.text('a', k='a').input('', k='b').listbox(['X|x'], k='c').text('d', k='d')
+    widget_a, listbox = window.widget('a'), window.widget('c')
+    flushes = count_calls('_flush_batch')
+
+    window.delete_many(['a', 'b', 'c'])
+
+    assert len(flushes) == 1
+    assert not window.exists('a') and not window.exists('b') and not window.exists('c')
+    assert 'c' not in window._groups and 'c' not in window.element_positions
+    assert widget_a.destroyed and listbox.destroyed
+    assert window.exists('d')
+
+
+def test_delete_by_prefix_and_selection_string(window):
+    window.text('1', k='row_1').text('2', k='row_2').text('3', k='other', s='results')
+    window.input('', k='row_x', s='results')
+
+    window.delete(kstart='row_')
+    assert window.element_keys.keys_starting_with('row_') == []
+    assert window.exists('other')
+
+    window.delete(shas='sult')
+    assert not window.exists('other')
+
+
+def test_deleting_groups_in_a_batch_unplaces_them_once_at_the_end(window, monkeypatch):
+    window.table({'N': ['N', 10]}, data=[[1], [2]], k='grid').checkboxes(['A|a', 'B|b'], k='flags')
+    widgets = [element for key in ('grid', 'flags') for element, _ in window._groups[key].members]
+    forgets = []
+    for widget in widgets:
+        monkeypatch.setattr(widget, 'place_forget', lambda widget=widget: forgets.append(widget))
+
+    with window.batch():
+        window.delete_many(['grid', 'flags'])
+        assert forgets == []
+
+    assert 'grid' not in window._groups and 'flags' not in window._groups
@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+def test_rollback_removes_newer_elements_and_restores_the_cursor(window):
+    window.text('Name:').input('', k='name').br()
+    x, y = window.current_x, window.current_y
+    cp = window.checkpoint()
+
+    window.set(fg='red').text('Name is required', k='error').listbox(['A|a'], k='choice').br()
+    window.rollback(cp)
+
+    assert not window.exists('error') and 'choice' not in window._groups
+    assert window.exists('name')
+    assert (window.current_x, window.current_y) == (x, y)
+    assert window.default_fg == ''
+
+
+def test_named_checkpoint_can_be_rolled_back_more_than_once(window):
+    window.checkpoint('form')
+
+    for _ in range(2):
+        window.text('temporary', k='tmp')
+        window.rollback('form')
+        assert not window.exists('tmp')
+
+
+def test_clear_error_messages_keeps_the_finalized_layout(window):
+    window.input('', k='name').button('OK', k='ok')
+    window.finalize_layout()
+    window.text('Error', k='error', fg='red')
+
+    window.clear_error_messages()
+
+    assert not window.exists('error')
+    assert window.exists('name') and window.exists('ok')
+
+
+def _build_panels(window):
+    window.panel('Filters', k='filters').input('', k='query').panel()
+    window.panel('Results', k='results').text('0 found', k='count').listbox(['A|a'], k='hits').panel()
+
+
+def test_deleting_a_panel_removes_its_frame_controls_and_children(window):
+    _build_panels(window)
+    window.text('after', k='after')
+    frame = window.widget('results')
+
+    window.delete('results')
+
+    assert 'results' not in window._groups and 'hits' not in window._groups
+    assert not any(window.exists(key) for key in ('results', 'results_close', 'results_title', 'count', 'hits'))
+    assert frame.destroyed
+    assert window.exists('filters') and window.exists('query') and window.exists('after')
+
+
+def test_rolling_back_a_panel_removes_it(window):
+    window.text('before', k='before')
+    cp = window.checkpoint()
+    _build_panels(window)
+
+    window.rollback(cp)
+
+    assert list(window._groups) == []
+    assert list(window.element_keys) == ['before']
+    assert window._current_panel_key is None
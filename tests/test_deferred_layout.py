@@ -0,0 +1,61 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+from pyNaviGuiHeadless import NgHeadless
+
+
+def _build(window):
+    window.text('Name:').input('', k='name').br()
+    window.checkboxes(['A|a', 'B|b'], k='flags').listbox(['X|x', 'Y|y'], k='list').br()
+    window.button('OK', k='ok')
+
+
+def _placements(window):
+    return [element.place_info() for element in window.elements]
+
+
+def test_deferred_layout_places_everything_at_the_first_read(window):
+    window.set_deferred_layout()
+    _build(window)
+
+    assert all(info == {} for info in _placements(window))
+
+    window.read(timeout=0)
+
+    assert all(info != {} for info in _placements(window))
+
+
+def test_deferred_layout_gives_the_same_placements_without_flushing_per_element(window, monkeypatch):
+    reference = NgHeadless()
+    _build(reference)
+
+    flushes = []
+    update_idletasks = window.root.update_idletasks
+    monkeypatch.setattr(window.root, 'update_idletasks', lambda: flushes.append(1) or update_idletasks())
+    window.set_deferred_layout()
+    _build(window)
+    window.finalize_layout()
+
+    assert _placements(window) == _placements(reference)
+    assert window.element_positions == reference.element_positions
+    assert len(flushes) <= 1
+
+
+def test_elements_added_after_the_pass_are_placed_at_once(window):
+    window.set_deferred_layout()
+    _build(window)
+    window.finalize_layout()
+
+    window.text('Error', k='error')
+
+    assert window.widget('error').place_info() != {}
+
+
+def test_disabling_deferred_layout_applies_pending_placements(window):
+    window.set_deferred_layout()
+    window.text('a', k='a')
+
+    window.set_deferred_layout(False)
+
+    assert window.widget('a').place_info() != {}
+    assert window._batch_depth == 0
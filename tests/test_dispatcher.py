@@ -0,0 +1,71 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+def test_exact_handler_wins_over_patterns(window):
+    calls = []
+    window.register_event_handler('row_*', lambda values: calls.append('prefix'))
+    window.register_event_handler('row_1', lambda values: calls.append('exact'))
+
+    window.process_event('row_1', {})
+    window.process_event('row_2', {})
+
+    assert calls == ['exact', 'prefix']
+
+
+def test_longest_pattern_wins_and_prefix_beats_suffix_of_same_length(window):
+    window.register_event_handler('row_*', lambda values: 'row')
+    window.register_event_handler('row_edit_*', lambda values: 'row_edit')
+    window.register_event_handler('*_CHANGE', lambda values: 'change')
+    window.register_event_handler('*_edit_CHANGE', lambda values: 'edit_change')
+    window.register_event_handler('*_end', lambda values: 'end')
+
+    assert window.process_event('row_edit_3', {}) == 'row_edit'
+    assert window.process_event('name_CHANGE', {}) == 'change'
+    assert window.process_event('x_edit_CHANGE', {}) == 'edit_change'
+    assert window.process_event('row_x_CHANGE', {}) == 'change'
+    assert window.process_event('row_end', {}) == 'row'
+    assert window.process_event('list_end', {}) == 'end'
+    assert window.process_event('other', {}) is None
+
+
+def test_pattern_handler_receives_the_event_key(window):
+    window.register_event_handler('btn_*', lambda values: values['_event'])
+
+    assert window.process_event('btn_save', {}) == 'btn_save'
+
+
+def test_unregistered_pattern_is_no_longer_resolved(window):
+    window.register_event_handler('row_*', lambda values: 'row')
+    assert window.process_event('row_1', {}) == 'row'
+
+    window.unregister_event_handler('row_*')
+
+    assert window.process_event('row_1', {}) is None
+
+
+def test_handler_cache_keeps_only_pattern_hits_and_is_bounded(window):
+    window.register_event_handler('ok', lambda values: None)
+    window.register_event_handler('row_*', lambda values: None)
+
+    for n in range(window._handler_cache_size + 100):
+        window.process_event(f'row_{n}', {})
+        window.process_event(f'miss_{n}', {})
+    window.process_event('ok', {})
+
+    assert len(window._handler_cache) == window._handler_cache_size
+    assert all(key.startswith('row_') for key in window._handler_cache)
+
+
+def test_unhashable_event_key_has_no_handler(window):
+    window.register_event_handler('row_*', lambda values: 'row')
+
+    assert window.process_event(['row_1'], {}) is None
+
+
+def test_handler_stats_count_calls(window):
+    window.register_event_handler('row_*', lambda values: None)
+    for n in range(3):
+        window.process_event(f'row_{n}', {})
+
+    assert window.event_handler_stats()['row_*']['calls'] == 3
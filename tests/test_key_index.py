@@ -0,0 +1,35 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+from ng_index import NgKeyIndex
+
+
+def test_key_index_prefix_query_in_insertion_order():
+    index = NgKeyIndex()
+    for key in ('row_2', 'name', 'row_10', 'row_1', '__auto_key_0'):
+        index[key] = object()
+
+    assert index.keys_starting_with('row_') == ['row_2', 'row_10', 'row_1']
+    assert index.keys_starting_with('') == ['row_2', 'name', 'row_10', 'row_1']
+    assert index.keys_starting_with('zz') == []
+
+
+def test_key_index_follows_deletes_and_replacements():
+    index = NgKeyIndex()
+    for key in ('a1', 'a2', 'a3'):
+        index[key] = key
+    del index['a2']
+    index['a1'] = 'replaced'
+    index.pop('a3')
+    index.setdefault('a4', 'new')
+
+    assert index.keys_starting_with('a') == ['a1', 'a4']
+    assert index['a1'] == 'replaced'
+
+
+def test_window_indexes_follow_element_lifecycle(window):
+    window.text('1', k='row_1', s='rows').text('2', k='row_2', s='rows').text('x', k='x')
+    window.delete('row_1')
+
+    assert window.element_keys.keys_starting_with('row_') == ['row_2']
+    assert window.element_strings.keys_containing('rows') == ['row_2']
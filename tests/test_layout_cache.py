@@ -0,0 +1,54 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+from pyNaviGuiHeadless import NgHeadless
+
+
+def _build(window):
+    window.text('Name:').input('Dario', k='name', font=('Arial', 12, 'bold')).br()
+    window.combobox('Country', ['Italy|IT', 'France|FR'], k='country', default='FR')
+    window.button('OK', k='ok')
+
+
+def test_layout_cache_skips_measurements_on_the_next_run(tmp_path, monkeypatch):
+    path = tmp_path / 'layout.json'
+
+    first = NgHeadless()
+    first.set_layout_cache(path)
+    _build(first)
+    first.finalize_layout()
+    assert path.exists()
+
+    second = NgHeadless()
+    syncs = []
+    monkeypatch.setattr(second, '_sync_geometry', syncs.append)
+    second.set_layout_cache(path)
+    _build(second)
+
+    assert syncs == []
+    assert second.element_positions == first.element_positions
+
+
+def test_layout_cache_of_another_environment_is_ignored(tmp_path, monkeypatch):
+    path = tmp_path / 'layout.json'
+    first = NgHeadless()
+    first.set_layout_cache(path)
+    _build(first)
+    first.close()
+
+    second = NgHeadless()
+    monkeypatch.setattr(second, '_measure_environment', lambda: ['other display'])
+    second.set_layout_cache(path)
+
+    assert second._widget_sizes == {}
+
+
+def test_unreadable_layout_cache_is_ignored(tmp_path):
+    path = tmp_path / 'layout.json'
+    path.write_text('not json')
+
+    window = NgHeadless()
+    window.set_layout_cache(path)
+    _build(window)
+
+    assert window.exists('name')
@@ -0,0 +1,44 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+from ng_layout_engine import NgLayoutEngine
+from pyNaviGuiWeb import NgWeb
+
+
+def test_boxes_flow_in_rows_without_tk():
+    layout = NgLayoutEngine()
+    layout.place('name_label', 42, 21)
+    layout.place('name', 140, 21)
+    layout.br()
+    layout.place('ok', 40, 30)
+
+    assert layout.boxes['name'] == (47, 0, 140, 21)
+    assert layout.boxes['ok'] == (0, 24, 40, 30)
+
+
+def test_move_below_and_over_follow_placed_boxes():
+    layout = NgLayoutEngine()
+    layout.move_to(10, 10)
+    layout.place('photo', 100, 80)
+
+    assert layout.move_below('photo') and (layout.current_x, layout.current_y) == (10, 95)
+    assert layout.move_over('photo') and (layout.current_x, layout.current_y) == (10, 10)
+    assert not layout.move_below('missing')
+
+
+def test_window_cursor_is_the_engine_state(window):
+    window.text('Name:', k='label').input('', k='name').br()
+
+    assert window.layout.boxes['name'] == window.element_positions['name']
+    assert window.current_y == window.layout.current_y > 0
+
+    window.set_x(200)
+    assert window.layout.current_x == 200
+
+
+def test_web_backend_shares_the_row_breaks():
+    web = NgWeb(app_name='test')
+    web.br(10)
+
+    assert web.layout.boxes is web.element_positions
+    assert web.current_y == NgLayoutEngine().row_height + 10
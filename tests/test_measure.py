@@ -0,0 +1,86 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+from ng_measure import NgTextMetrics
+from ngheadless_widgets import headless_font
+
+
+class _CountingFonts:
+    """Font module whose fonts count their measure() calls"""
+
+    def __init__(self):
+        self.measures = 0
+        fonts = self
+
+        class Font(headless_font.Font):
+            def measure(self, text):
+                fonts.measures += 1
+                return super().measure(text)
+
+        self.Font = Font
+
+
+def test_text_sizes_are_measured_once_per_font_and_text():
+    fonts = _CountingFonts()
+    metrics = NgTextMetrics(None, fonts)
+
+    first = metrics.text_size(('Arial', 12), 'Name:')
+    for _ in range(10):
+        assert metrics.text_size(('Arial', 12), 'Name:') == first
+    metrics.text_size(('Arial', 14), 'Name:')
+
+    assert fonts.measures == 2
+
+
+def test_text_size_cache_evicts_the_least_recently_used_size():
+    metrics = NgTextMetrics(None, _CountingFonts(), maxsize=2)
+    metrics.text_size(None, 'a')
+    metrics.text_size(None, 'b')
+    metrics.text_size(None, 'a')
+    metrics.text_size(None, 'c')
+
+    assert [key[1] for key, _ in metrics.entries()] == ['a', 'c']
+
+
+def test_labels_are_sized_like_tk_with_one_measurement_per_font(window, monkeypatch):
+    syncs = []
+    sync_geometry = window._sync_geometry
+    monkeypatch.setattr(window, '_sync_geometry', lambda widget: syncs.append(widget) or sync_geometry(widget))
+
+    for n in range(20):
+        window.text(f'Label {n}\nsecond line' if n % 2 else f'Label {n}', k=f'label_{n}')
+
+    assert len(syncs) == 1
+    for n in range(20):
+        label = window.widget(f'label_{n}')
+        assert window.element_positions[f'label_{n}'][2:] == (label.winfo_reqwidth(), label.winfo_reqheight())
+
+
+def test_entries_are_measured_once_per_width_and_font(window, monkeypatch):
+    syncs = []
+    monkeypatch.setattr(window, '_sync_geometry', syncs.append)
+
+    for n in range(10):
+        window.input('', k=f'name_{n}').br()
+    window.input('', k='big', font=('Arial', 16, 'bold'))
+
+    assert len(syncs) == 2
+    assert window._widget_sizes[('Entry', None, None)] == (window.widget('name_0').winfo_reqwidth(),
+                                                           window.widget('name_0').winfo_reqheight())
+
+
+def test_entries_are_not_packed_to_read_their_height(window, monkeypatch):
+    packs = []
+    window.text('Name:')
+    entry_class = window._tk.Entry
+    monkeypatch.setattr(window._tk, 'Entry', lambda *args, **kwargs: _no_pack(entry_class(*args, **kwargs), packs))
+
+    window.input('', k='name')
+
+    assert packs == []
+    assert window.widget('name').place_info() != {}
+
+
+def _no_pack(entry, packs):
+    entry.pack = lambda *args, **kwargs: packs.append(entry)
+    return entry
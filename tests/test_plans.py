@@ -0,0 +1,76 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import json
+
+import pytest
+
+from ng_plan import NgBuildPlan
+from pyNaviGuiHeadless import NgHeadless
+
+SPEC = [
+    ['text', 'Name:'],
+    {'call': 'input', 'args': ['Dario'], 'k': 'name', 'font': ('Arial', 12, 'bold')},
+    'br',
+    ['combobox', 'Country', ['Italy|IT', 'France|FR'], {'k': 'country', 'default': 'FR'}],
+    ['checkboxes', ['A|a', 'B|b'], {'k': 'flags'}],
+    'br',
+    ['button', 'OK', {'k': 'ok'}],
+]
+
+
+def _build_by_calls(window):
+    window.text('Name:')
+    window.input('Dario', k='name', font=('Arial', 12, 'bold')).br()
+    window.combobox('Country', ['Italy|IT', 'France|FR'], k='country', default='FR')
+    window.checkboxes(['A|a', 'B|b'], k='flags').br()
+    window.button('OK', k='ok')
+
+
+def _layout(window):
+    return dict(window.element_positions), window._get_values_snapshot()
+
+
+def test_plan_builds_the_same_layout_as_chained_calls(window):
+    reference = NgHeadless()
+    _build_by_calls(reference)
+
+    window.build(NgHeadless.compile_layout(SPEC))
+
+    assert _layout(window) == _layout(reference)
+
+
+def test_saved_plan_builds_the_same_layout(window, tmp_path):
+    plan = NgHeadless.compile_layout(SPEC)
+    path = tmp_path / 'form.json'
+    plan.save(path)
+
+    loaded = NgBuildPlan.load(path)
+    reference = NgHeadless()
+    reference.build(plan)
+    window.build(loaded)
+
+    assert len(loaded) == len(plan)
+    assert loaded.steps == plan.steps
+    assert _layout(window) == _layout(reference)
+
+
+def test_plan_of_another_version_is_rejected(tmp_path):
+    path = tmp_path / 'form.json'
+    NgHeadless.compile_layout(SPEC).save(path)
+    plan = json.loads(path.read_text())
+    plan['version'] = -1
+    path.write_text(json.dumps(plan))
+
+    with pytest.raises(ValueError):
+        NgBuildPlan.load(path)
+
+
+@pytest.mark.parametrize('spec', [
+    [['no_such_element', 'x']],
+    [['text', 'a', {'no_such_option': 1}]],
+    [['checkboxes']],
+])
+def test_invalid_spec_is_rejected_at_compile_time(spec):
+    with pytest.raises(ValueError):
+        NgHeadless.compile_layout(spec)
@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import pytest
+
+
+def test_read_returns_clicked_button_with_values(window):
+    window.input('', k='name').button('OK', k='ok')
+    window.type_text('name', 'Dario').click('ok')
+
+    assert window.read(timeout=0) == ('ok', {'name': 'Dario'})
+    assert window.read(timeout=0) == ('', {})
+
+
+def test_read_waits_for_an_event_queued_by_a_timer(window):
+    window.root.after(300, lambda: window.inject_event('late', {}))
+
+    assert window.read() == ('late', {})
+    assert window.root.clock_ms == 300
+
+
+def test_read_with_timeout_returns_empty_event_when_it_expires(window):
+    window.root.after(300, lambda: window.inject_event('late', {}))
+
+    assert window.read(timeout=100) == ('', {})
+    assert window.root.clock_ms == 100
+    assert window.read(timeout=1000) == ('late', {})
+
+
+def test_read_without_timeout_reports_a_wait_that_can_never_end(window):
+    with pytest.raises(RuntimeError):
+        window.read()
+
+
+def test_read_after_close_returns_the_closed_event(window):
+    window.close_window()
+
+    assert window.read(timeout=0) == (None, {})
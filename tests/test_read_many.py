@@ -0,0 +1,39 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+def test_read_many_coalesces_consecutive_events_with_the_same_key(window):
+    window.input('', k='name')
+    for text in ('D', 'Da', 'Dar'):
+        window.type_text('name', text).inject_event('name_CHANGE')
+    window.inject_event('ok', {'n': 1})
+    window.inject_event('name_CHANGE', {'n': 2})
+
+    events = window.read_many(timeout=0)
+
+    assert [event for event, _ in events] == ['name_CHANGE', 'ok', 'name_CHANGE']
+    assert events[0][1]['name'] == 'Dar'
+
+
+def test_read_many_without_coalescing_keeps_every_event(window):
+    for n in range(3):
+        window.inject_event('tick', {'n': n})
+
+    events = window.read_many(timeout=0, coalesce=False)
+
+    assert [values['n'] for _, values in events] == [0, 1, 2]
+
+
+def test_read_many_stops_at_max_events(window):
+    for n in range(5):
+        window.inject_event(f'e{n}', {})
+
+    assert len(window.read_many(max_events=2, timeout=0)) == 2
+    assert len(window.read_many(timeout=0)) == 3
+
+
+def test_read_many_waits_for_the_first_event_like_read(window):
+    window.root.after(200, lambda: window.inject_event('late', {}))
+
+    assert window.read_many(timeout=50) == []
+    assert window.read_many(timeout=500) == [('late', {})]
@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+def _run_jobs(window, max_slices=10000):
+    """Advance virtual time until every scheduled job has finished, return the number of steps"""
+    steps = 0
+    while window.scheduled_jobs() and steps < max_slices:
+        window.advance(1)
+        steps += 1
+    return steps
+
+
+def test_scheduled_job_runs_in_slices_and_reports_its_result(window):
+    def count(limit):
+        total = 0
+        for n in range(limit):
+            total += n
+            yield
+        return total
+
+    window.schedule(count, 10, budget_ms=0, k='done')
+
+    assert _run_jobs(window) > 1
+    assert window.read(timeout=0) == ('done', {'result': 45, 'error': None})
+
+
+def test_geometry_flush_does_not_drain_scheduled_jobs(window):
+    window.schedule(lambda: (yield from range(10)), budget_ms=0)
+
+    window.root.update_idletasks()
+
+    assert window.scheduled_jobs() == 1
+
+
+def test_listbox_refill_with_budget(window):
+    window.listbox(['A|a'], k='list')
+
+    window.update('list', options=[f'Item {n}|{n}' for n in range(2000)], default='1500', budget_ms=0)
+    _run_jobs(window)
+
+    assert window.widget('list').size() == 2000
+    assert window._read_value('list') == '1500'
+
+
+def test_navtable_page_refill_with_budget(window):
+    data = [[f'name {n}', 'missing.png'] for n in range(12)]
+    window.navtable({'NAME': ['Name', 10]}, data=data, nr_rows=5, k='people', budget_ms=1)
+
+    window._navtable_navigate('people', 1)
+    assert window.scheduled_jobs() == 1
+    _run_jobs(window)
+
+    page = window._read_value('people')
+    assert page['current_page'] == 1
+    assert page['current_page_data'][0] == ['name 5', 'missing.png']
+
+
+def test_deleting_an_element_stops_its_refill(window):
+    window.listbox(['A|a'], k='list')
+    window.update('list', options=[str(n) for n in range(2000)], budget_ms=0)
+
+    window.delete('list')
+
+    assert window.scheduled_jobs() == 0
+
+
+def test_jobs_share_one_slice_budget_and_take_turns(window):
+    steps = []
+
+    def job(name):
+        for n in range(3):
+            steps.append(name)
+            yield
+
+    window.schedule(job, 'a', budget_ms=0)
+    window.schedule(job, 'b', budget_ms=0)
+
+    window.root.update_idletasks()
+    assert steps == ['a']
+
+    _run_jobs(window)
+    assert steps == ['a', 'b', 'a', 'b', 'a', 'b']
+
+
+def test_rolling_back_unkeyed_budgeted_fills_stops_them(window):
+    cp = window.checkpoint()
+    window.table({'N': ['N', 10]}, data=[[n] for n in range(2000)], budget_ms=1)
+    window.listbox([str(n) for n in range(2000)], budget_ms=1)
+    assert window.scheduled_jobs() == 2
+
+    window.rollback(cp)
+
+    assert window.scheduled_jobs() == 0
@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+ROW_SPEC = [['text', '', {'k': 'item'}],
+            {'call': 'input', 'args': [''], 'k': 'note'},
+            ['checkboxes', ['OK|ok'], {'k': 'ok'}]]
+
+
+def _rows(count):
+    return [{'item': f'Item {n}', 'note': '', 'ok': []} for n in range(count)]
+
+
+def _build(window, count=100, height=120):
+    window.scroll_rows(ROW_SPEC, _rows(count), k='checks', height=height)
+    return window._groups['checks']
+
+
+def test_widgets_are_built_only_for_visible_rows(window):
+    group = _build(window)
+    nr_slots = len(group.slots)
+
+    assert 1 < nr_slots < 100
+    assert window.widget('checks_0_item').cget('text') == 'Item 0'
+    assert f'checks_{nr_slots}_item' not in window.element_keys
+
+
+def test_scrolling_recycles_widgets(window):
+    group = _build(window)
+    nr_elements = len(window.elements)
+    first_label = window.widget('checks_0_item')
+
+    window._scroll_rows_by('checks', 10)
+    window.widget('checks_0_note').event_generate('<MouseWheel>', delta=-120)
+
+    assert group.first == 11
+    assert len(window.elements) == nr_elements
+    assert window.widget('checks_0_item') is first_label
+    assert first_label.cget('text') == 'Item 11'
+
+
+def test_scrolling_stops_at_both_ends(window):
+    group = _build(window, count=30)
+
+    window._scroll_rows_command('checks', 'moveto', '1.0')
+    assert group.first == 30 - len(group.slots)
+
+    window._scroll_rows_command('checks', 'scroll', '-1', 'pages')
+    window._scroll_rows_command('checks', 'scroll', '-100', 'units')
+    assert group.first == 0
+
+
+def test_edits_follow_their_row_when_scrolled_away(window):
+    _build(window)
+    window.type_text('checks_1_note', 'flat tyre')
+    window.select('checks_1_ok', ['ok'])
+
+    window._scroll_rows_by('checks', 50)
+    assert window.widget('checks_1_note').get() == ''
+
+    window._scroll_rows_by('checks', -50)
+    rows = window._read_value('checks')
+
+    assert window.widget('checks_1_note').get() == 'flat tyre'
+    assert rows[1] == {'item': 'Item 1', 'note': 'flat tyre', 'ok': ['ok']}
+    assert len(rows) == 100
+
+
+def test_update_replaces_rows_and_fills_missing_fields(window):
+    group = _build(window)
+
+    window.update('checks', rows=[{'item': 'Only', 'note': None}])
+
+    assert window._read_value('checks') == [{'item': 'Only', 'note': '', 'ok': []}]
+    assert window.widget('checks_0_note').get() == ''
+    assert window._records[window.widget('checks_1_item')].visible is False
+    assert group.first == 0
+
+
+def test_scroll_row_index_maps_events_to_rows(window):
+    group = _build(window)
+    window._scroll_rows_by('checks', 7)
+
+    assert window.scroll_row_index('checks_2_note') == 9
+    assert window.scroll_row_index('other') is None
+    assert window.scroll_row_index(None) is None
+    assert group.first == 7
+
+
+def test_delete_removes_every_row_widget(window):
+    _build(window)
+    window.text('after', k='after')
+
+    window.delete('checks')
+
+    assert 'checks' not in window._groups
+    assert window.element_keys.keys_starting_with('checks_') == []
+    assert window.exists('after')
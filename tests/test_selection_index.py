@@ -0,0 +1,39 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+from ng_index import NgSelectionIndex
+
+
+def test_selection_index_exact_and_substring_queries():
+    index = NgSelectionIndex()
+    index['name'] = 'form fields'
+    index['email'] = 'form fields'
+    index['total'] = 'results'
+    index['ok'] = 'form buttons'
+
+    assert index.keys_equal('form fields') == ['name', 'email']
+    assert index.keys_containing('form') == ['name', 'email', 'ok']
+    assert index.keys_containing('s') == ['name', 'email', 'total', 'ok']
+    assert index.keys_containing('sult') == ['total']
+    assert index.keys_containing('form fieldz') == []
+
+
+def test_selection_index_forgets_removed_strings():
+    index = NgSelectionIndex()
+    index['a'] = 'results'
+    index['b'] = 'results'
+    del index['a']
+    index['b'] = 'other'
+
+    assert index.keys_containing('result') == []
+    assert index.keys_containing('other') == ['b']
+    assert index._keys_by_string == {'other': {'b': None}}
+
+
+def test_shas_queries_use_the_window_index(window):
+    window.text('1', k='a', s='form fields').text('2', k='b', s='results').text('3', k='c')
+
+    window.delete(shas='form')
+
+    assert not window.exists('a')
+    assert window.exists('b') and window.exists('c')
@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import io
+
+import pytest
+
+from ng_stats import NgHistogram
+
+
+def test_histogram_percentiles_use_power_of_two_buckets():
+    histogram = NgHistogram()
+    for ms in [1] * 90 + [20] * 10:
+        histogram.record(ms / 1000.0)
+
+    summary = histogram.summary()
+
+    assert summary['count'] == 100
+    assert summary['avg_ms'] == pytest.approx(2.9)
+    # 1 ms falls in the bucket ending at 1024 us, 20 ms is capped at the maximum
+    assert summary['p50_ms'] == 1.024
+    assert summary['p95_ms'] == summary['p99_ms'] == summary['max_ms'] == 20
+
+
+def test_read_values_and_handlers_are_timed(window):
+    window.input('', k='name').button('OK', k='ok')
+    window.register_event_handler('ok', lambda values: values['name'])
+    window.click('ok')
+
+    event, values = window.read(timeout=0)
+    window.process_event(event, values)
+    stats = window.stats()
+
+    assert stats['queue_wait']['count'] == 1
+    assert stats['values']['count'] == 1
+    assert stats['handler']['count'] == 1
+    assert stats['handlers']['ok']['calls'] == 1
+
+
+def test_reset_stats_clears_every_sample(window):
+    window.inject_event('tick', {})
+    window.read(timeout=0)
+
+    window.reset_stats()
+
+    assert all(window.stats()[name]['count'] == 0 for name in ('queue_wait', 'values', 'handler'))
+    assert window.stats()['handlers'] == {}
+
+
+def test_stats_dump_prints_every_interval_until_stopped(window):
+    out = io.StringIO()
+    window.stats_dump(1000, file=out)
+
+    window.advance(2500)
+    window.stats_dump(0)
+    window.advance(5000)
+
+    assert out.getvalue().count('[stats] queue_wait') == 2
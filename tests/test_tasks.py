@@ -0,0 +1,57 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import threading
+import time
+
+import pytest
+
+
+def _read_event(window, seconds=5):
+    """Read until a worker thread queues an event"""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        event, values = window.read(timeout=1)
+        if event:
+            return event, values
+        time.sleep(0.001)
+    raise AssertionError('no event queued')
+
+
+def test_task_result_is_reported_as_an_event(window):
+    window.run_task(sum, [1, 2, 3], k='total')
+
+    assert _read_event(window) == ('total', {'result': 6, 'error': None})
+    assert window.running_tasks() == 0
+
+
+def test_task_error_is_reported_as_an_event(window):
+    window.run_task(int, 'x')
+
+    event, values = _read_event(window)
+
+    assert event == 'RESULT' and values['result'] is None
+    assert isinstance(values['error'], ValueError)
+
+
+def test_cancel_tasks_drops_waiting_tasks_only(window):
+    window.max_tasks = 1
+    release = threading.Event()
+    window.run_task(release.wait, k='slow')
+    window.run_task(sum, [1], k='queued')
+    window.run_task(sum, [2], k='other')
+
+    assert window.running_tasks() == 3
+    assert window.cancel_tasks('queued') == 1
+    assert window.running_tasks('queued') == 0
+
+    release.set()
+    events = sorted(_read_event(window)[0] for _ in range(2))
+
+    assert events == ['other', 'slow']
+    assert window.read(timeout=0) == ('', {})
+
+
+def test_unknown_executor_is_rejected(window):
+    with pytest.raises(ValueError):
+        window.run_task(sum, [1], executor='fiber')
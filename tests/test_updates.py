@@ -0,0 +1,46 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import threading
+
+
+def test_idle_window_has_no_update_timer(window):
+    assert window._update_tick_id is None
+    assert window.root._timers == {}
+
+
+def test_posted_updates_are_merged_per_key_and_applied_once(window, monkeypatch):
+    window.text('', k='status').input('', k='name')
+    calls = []
+    update = window.update
+    monkeypatch.setattr(window, 'update', lambda k='', **kwargs: calls.append(k) or update(k, **kwargs))
+
+    for n in range(50):
+        window.post_update('status', text=f'{n} done')
+    window.post_update('name', text='Dario')
+    window.advance(window.update_interval_ms)
+
+    assert calls == ['status', 'name']
+    assert window.widget('status').cget('text') == '49 done'
+    assert window.widget('name').get() == 'Dario'
+
+
+def test_update_tick_stops_when_nothing_is_pending(window):
+    window.text('', k='status')
+    window.post_update('status', text='x')
+    window.advance(window.update_interval_ms * 10)
+
+    assert window._update_tick_id is None
+    assert window.root._timers == {}
+
+
+def test_updates_posted_by_other_threads_are_applied_by_read(window):
+    window.text('', k='status')
+    worker = threading.Thread(target=lambda: window.post_update('status', text='from worker'))
+    worker.start()
+    worker.join()
+
+    assert window._update_tick_id is None
+    window.read(timeout=window.update_interval_ms * 2)
+
+    assert window.widget('status').cget('text') == 'from worker'
@@ -0,0 +1,79 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+import json
+
+import pytest
+
+
+def test_values_are_read_on_access_by_default(window, monkeypatch):
+    window.input('a', k='name').checkboxes(['X|x'], k='flags')
+    reads = []
+    read_value = window._read_value
+    monkeypatch.setattr(window, '_read_value', lambda key: reads.append(key) or read_value(key))
+    window.inject_event('name')
+    _, values = window.read(timeout=0)
+
+    assert reads == []
+    assert values['name'] == 'a'
+    assert reads == ['name']
+
+
+def test_lazy_values_behave_like_a_mapping(window):
+    window.input('a', k='name').checkboxes(['X|x'], k='flags').text('label')
+    window.inject_event('name', None)
+    _, values = window.read(timeout=0)
+
+    assert values.get(3) is None
+    assert values.get('missing', 'default') == 'default'
+    assert values == {'name': 'a', 'flags': []}
+    assert not values != {'name': 'a', 'flags': []}
+    assert list(values) == ['name', 'flags']
+    assert len(values) == 2
+    assert 'flags' in values and '__auto_key_0' not in values
+
+
+def test_lazy_values_must_be_copied_for_json(window):
+    window.input('a', k='name')
+    window.inject_event('name')
+    _, values = window.read(timeout=0)
+
+    with pytest.raises(TypeError):
+        json.dumps(values)
+    assert json.loads(json.dumps(values.copy())) == {'name': 'a'}
+
+
+def test_lazy_values_accept_extra_keys(window):
+    window.input('a', k='name')
+    window.register_event_handler('btn_*', lambda values: dict(values))
+    window.inject_event('btn_save')
+    event, values = window.read(timeout=0)
+
+    values['row'] = 3
+    del values['name']
+
+    assert values == {'row': 3}
+    assert window.process_event(event, values) == {'row': 3, '_event': 'btn_save'}
+
+
+def test_lazy_values_read_the_widget_at_access_time(window):
+    window.input('a', k='name').input('b', k='other')
+    window.inject_event('name')
+    window.type_text('name', 'changed')
+    window.delete('other')
+    _, values = window.read(timeout=0)
+
+    assert values['name'] == 'changed'
+    assert 'other' not in values
+    assert values.get('other') is None
+
+
+def test_eager_values_are_a_plain_dict_snapshot(window):
+    window.set_eager_values(True)
+    window.input('a', k='name')
+    window.inject_event('name')
+    window.type_text('name', 'changed')
+    _, values = window.read(timeout=0)
+
+    assert type(values) is dict
+    assert json.dumps(values) == '{"name": "a"}'
@@ -0,0 +1,28 @@
+# Copyright (c) 2025 Dario Giacomelli
+# Licensed under the MIT License
+
+
+def test_visible_toggles_many_elements_with_one_redraw(window, count_calls):
+    for n in range(20):
+        window.text(str(n), k=f'row_{n}', s='rows')
+    redraws = count_calls('_refresh_window')
+
+    window.visible(False, shas='rows')
+
+    assert len(redraws) == 1
+    assert not window.is_visible(kstart='row_')
+
+    window.visible(True, kstart='row_')
+
+    assert len(redraws) == 2
+    assert window.widget('row_3').place_info()['x'] == window.element_positions['row_3'][0]
+
+
+def test_hiding_one_key_keeps_the_others_visible(window):
+    window.text('a', k='a', s='rows').text('b', k='b', s='rows').text('c', k='c')
+
+    window.visible(False, k='a')
+
+    assert window.is_visible(k='b') and not window.is_visible(k='a')
+    assert window.is_visible(shas='rows') and window.is_visible(k='c')
+    assert window._records[window.widget('a')].visible is False